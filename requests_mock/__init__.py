@@ -10,22 +10,78 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from requests_mock.adapter import Adapter, ANY
+import importlib
+
 from requests_mock.exceptions import MockException, NoMockAddress
-from requests_mock.mocker import mock, Mocker, MockerCore
-from requests_mock.mocker import DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT
-from requests_mock.response import create_response, CookieJar
+from requests_mock.exceptions import VerificationError
+
+# Importing adapter, mocker or response imports requests and everything it
+# depends on. Load them on first use so that importing requests_mock (and so
+# loading the pytest plugin) is cheap.
+_LAZY_ATTRIBUTES = {
+    'Adapter': 'requests_mock.adapter',
+    'ANY': 'requests_mock.adapter',
+    'create_response': 'requests_mock.response',
+    'CookieJar': 'requests_mock.response',
+    'Expectation': 'requests_mock.expectations',
+    'mock': 'requests_mock.mocker',
+    'Mocker': 'requests_mock.mocker',
+    'MockerCore': 'requests_mock.mocker',
+
+    'DELETE': 'requests_mock.mocker',
+    'GET': 'requests_mock.mocker',
+    'HEAD': 'requests_mock.mocker',
+    'OPTIONS': 'requests_mock.mocker',
+    'PATCH': 'requests_mock.mocker',
+    'POST': 'requests_mock.mocker',
+    'PUT': 'requests_mock.mocker',
+}
+
+_LAZY_SUBMODULES = {
+    'adapter',
+    'expectations',
+    'history',
+    'metrics',
+    'mocker',
+    'observer',
+    'pool',
+    'ratelimit',
+    'request',
+    'response',
+    'trace',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module('%s.%s' % (__name__, name))
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__,
+                                                                name))
+
+    # cache it so __getattr__ isn't called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = ['Adapter',
            'ANY',
            'create_response',
            'CookieJar',
+           'Expectation',
            'mock',
            'Mocker',
            'MockerCore',
            'MockException',
            'NoMockAddress',
+           'VerificationError',
 
            'DELETE',
            'GET',
@@ -9,6 +9,10 @@ from requests_mock.adapter import (
 from requests_mock.exceptions import (
     MockException as MockException, 
     NoMockAddress as NoMockAddress,
+    VerificationError as VerificationError,
+)
+from requests_mock.expectations import (
+    Expectation as Expectation,
 )
 from requests_mock.mocker import (
     DELETE as DELETE, 
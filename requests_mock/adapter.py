@@ -10,6 +10,20 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import bisect
+import contextlib
+import gc
+import heapq
+import itertools
+import math
+import operator
+import os
+import pickle
+import random
+import sys
+import tempfile
+import threading
+import time
 import urllib.parse
 import weakref
 
@@ -17,30 +31,56 @@ from requests.adapters import BaseAdapter
 from requests.utils import requote_uri
 
 from requests_mock import exceptions
-from requests_mock.request import _RequestObjectProxy
-from requests_mock.response import _MatcherResponse
+from requests_mock import history as _history
+from requests_mock.observer import Concurrency, MatcherStats
+from requests_mock import pool
+from requests_mock import ratelimit
+from requests_mock.request import _copy_qs, _parse_url, _RequestObjectProxy
+from requests_mock.response import _call_on_close
+from requests_mock.response import _MatcherResponse, create_response
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-try:
-    import purl
-    purl_types = (purl.URL,)
-except ImportError:
-    purl = None
-    purl_types = ()
 
-ANY = object()
+class _Any(object):
+    # Pickled as a reference to ANY, so that saved routes still match
+    # anything once loaded.
+
+    def __reduce__(self):
+        return 'ANY'
+
+
+ANY = _Any()
+
+_REPEAT_LAST = 'repeat_last'
+_CYCLE = 'cycle'
+
+# bump when the pickled form of the route table changes
+_ROUTES_FORMAT = 2
+
+
+def _is_purl(url):
+    # purl is optional. If url is a purl.URL then purl must already have been
+    # imported by the caller so there's no need to pay to import it here.
+    purl = sys.modules.get('purl')
+    return purl is not None and isinstance(url, purl.URL)
 
 
 class _RequestHistoryTracker(object):
 
     def __init__(self):
         self.request_history = []
+        # Requests may be sent from many threads. The lock is only held for
+        # the moment it takes to change the history so senders barely contend
+        # for it, and reset can't rebind the list between another thread
+        # looking it up and appending to it.
+        self._lock = threading.Lock()
 
     def _add_to_history(self, request):
-        self.request_history.append(request)
+        with self._lock:
+            self.request_history.append(request)
 
     @property
     def last_request(self):
@@ -63,7 +103,298 @@ class _RequestHistoryTracker(object):
         return len(self.request_history)
 
     def reset(self):
-        self.request_history = []
+        with self._lock:
+            self.request_history = []
+
+    def __getstate__(self):
+        # the history and lock belong to the process that recorded them
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['request_history'] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class _Snapshot(object):
+    """The state of an Adapter to return to with Adapter.restore."""
+
+    def __init__(self, next_seq, history_count, journal_count):
+        self.next_seq = next_seq
+        self.history_count = history_count
+        self.journal_count = journal_count
+
+
+def _index_key(matcher):
+    # Matchers for a literal URL can only handle requests for their method and
+    # path so they are indexed on those. None is the wildcard for matchers that
+    # can't be narrowed down, like regexes, ANY and custom matchers.
+    if not isinstance(matcher, _Matcher):
+        return None, None
+
+    method = None if matcher._method is ANY else matcher._method.lower()
+    return method, matcher._path
+
+
+class _SeqMap(object):
+    """Matchers by sequence number, kept in sequence order.
+
+    Registering always adds at the end. Restoring a snapshot can add at an
+    old sequence number, which is found by bisecting the sorted sequence
+    numbers rather than by sorting everything again.
+    """
+
+    __slots__ = ('_items', '_order')
+
+    def __init__(self):
+        self._items = {}
+        self._order = []
+
+    def __setitem__(self, seq, matcher):
+        if seq not in self._items:
+            order = self._order
+
+            if not order or seq > order[-1]:
+                order.append(seq)
+            else:
+                bisect.insort(order, seq)
+
+        self._items[seq] = matcher
+
+    def __getitem__(self, seq):
+        return self._items[seq]
+
+    def __delitem__(self, seq):
+        # drop it from the order first so a concurrent reader never finds a
+        # seq that is no longer in _items
+        order = self._order
+
+        if order[-1] == seq:
+            order.pop()
+        else:
+            del order[bisect.bisect_left(order, seq)]
+
+        del self._items[seq]
+
+    def pop(self, seq):
+        matcher = self._items[seq]
+        del self[seq]
+        return matcher
+
+    def __contains__(self, seq):
+        return seq in self._items
+
+    def __len__(self):
+        return len(self._order)
+
+    def last(self):
+        return self._order[-1]
+
+    def items(self):
+        return zip(self._order, self.values())
+
+    def values(self):
+        return map(self._items.__getitem__, self._order)
+
+    def reversed_items(self):
+        return zip(reversed(self._order), self.reversed_values())
+
+    def reversed_values(self):
+        return map(self._items.__getitem__, reversed(self._order))
+
+    def __getstate__(self):
+        return self._items, self._order
+
+    def __setstate__(self, state):
+        self._items, self._order = state
+
+
+class _MatcherTable(object):
+    """The matchers registered on an Adapter.
+
+    Each matcher is stored against a sequence number that increases with every
+    registration and a priority. Matchers with a higher priority are tried
+    first and within a priority the most recently registered wins. The
+    sequence number lets a matcher be removed, replaced or put back in
+    O(log n) wherever it is in the table.
+
+    Each priority is a tier of buckets indexed by method and path, so a
+    request only visits the matchers that could handle it.
+    """
+
+    def __init__(self):
+        # all matchers in the order they were registered
+        self._matchers = _SeqMap()
+        # id rather than the matcher as custom matchers may not be hashable.
+        # The table holds a reference so the id can't be reused.
+        self._seqs = {}
+        # seq: (priority, key) to find a matcher's bucket
+        self._index = {}
+        # priority: {key: _SeqMap}
+        self._tiers = {}
+        self._priorities = []
+        self.next_seq = 0
+
+    def __getstate__(self):
+        # ids don't survive pickling, everything else including the index is
+        # kept so loading doesn't have to rebuild it
+        state = self.__dict__.copy()
+        del state['_seqs']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._seqs = {}
+
+        for seq, matcher in self._matchers.items():
+            self._seqs.setdefault(id(matcher), []).append(seq)
+
+    def add(self, matcher, seq=None, priority=0):
+        if seq is None:
+            seq = self.next_seq
+            self.next_seq += 1
+
+        self._matchers[seq] = matcher
+        self._insert(seq, matcher, priority)
+        return seq
+
+    def _insert(self, seq, matcher, priority):
+        try:
+            tier = self._tiers[priority]
+        except KeyError:
+            tier = self._tiers[priority] = {}
+            self._priorities = sorted(self._tiers, reverse=True)
+
+        key = _index_key(matcher)
+
+        try:
+            bucket = tier[key]
+        except KeyError:
+            bucket = tier[key] = _SeqMap()
+
+        bucket[seq] = matcher
+        self._index[seq] = (priority, key)
+        self._seqs.setdefault(id(matcher), []).append(seq)
+
+    def _forget(self, matcher, seq):
+        seqs = self._seqs[id(matcher)]
+        seqs.remove(seq)
+
+        if not seqs:
+            del self._seqs[id(matcher)]
+
+    def _delete(self, seq):
+        priority, key = self._index.pop(seq)
+        tier = self._tiers[priority]
+        bucket = tier[key]
+        matcher = bucket.pop(seq)
+
+        if not bucket:
+            del tier[key]
+
+            if not tier:
+                del self._tiers[priority]
+                self._priorities.remove(priority)
+
+        self._forget(matcher, seq)
+        return matcher, priority
+
+    def remove(self, matcher):
+        """Remove the most recent registration of matcher.
+
+        :returns: The sequence number and priority the matcher was registered
+            with.
+        """
+        seq = max(self._seqs[id(matcher)])
+        return seq, self.remove_seq(seq)[1]
+
+    def remove_seq(self, seq):
+        """Remove the matcher registered with sequence number seq.
+
+        :returns: The matcher that was removed and its priority.
+        """
+        del self._matchers[seq]
+        return self._delete(seq)
+
+    def replace(self, old, new):
+        """Put new in the place of the most recent registration of old.
+
+        :returns: The sequence number of the registration.
+        """
+        seq = max(self._seqs[id(old)])
+        self.replace_seq(seq, new)
+        return seq
+
+    def replace_seq(self, seq, matcher):
+        """Put matcher in the place of the one registered at seq.
+
+        The new matcher takes the priority of the old one.
+
+        :returns: The matcher that was replaced.
+        """
+        priority, key = self._index[seq]
+        self._matchers[seq] = matcher
+
+        if _index_key(matcher) != key:
+            old, priority = self._delete(seq)
+            self._insert(seq, matcher, priority)
+            return old
+
+        # the same bucket, so it can simply take the old one's place
+        bucket = self._tiers[priority][key]
+        old = bucket[seq]
+        bucket[seq] = matcher
+        self._forget(old, seq)
+        self._seqs.setdefault(id(matcher), []).append(seq)
+        return old
+
+    def truncate(self, seq):
+        """Remove all matchers registered at or after seq."""
+        matchers = self._matchers
+
+        while matchers and matchers.last() >= seq:
+            self.remove_seq(matchers.last())
+
+    def tiers(self, request):
+        """The matchers that could handle request grouped by priority.
+
+        :returns: A list of (priority, matchers) tuples with the highest
+            priority first. matchers is an iterator in dispatch order.
+        """
+        method = request.method.lower()
+        path = request.path or '/'
+        keys = ((method, path), (method, None), (None, path), (None, None))
+        tiers = []
+
+        for priority in self._priorities:
+            tier = self._tiers[priority]
+            buckets = [tier[k] for k in keys if k in tier]
+
+            if len(buckets) == 1:
+                matchers = buckets[0].reversed_values()
+            else:
+                merged = heapq.merge(*(b.reversed_items() for b in buckets),
+                                     key=operator.itemgetter(0),
+                                     reverse=True)
+                matchers = (m for _, m in merged)
+
+            tiers.append((priority, matchers))
+
+        return tiers
+
+    def dispatch_order(self, request):
+        return itertools.chain.from_iterable(m for _, m in self.tiers(request))
+
+    def __contains__(self, matcher):
+        return id(matcher) in self._seqs
+
+    def __iter__(self):
+        return self._matchers.values()
+
+    def __len__(self):
+        return len(self._matchers)
 
 
 class _RunRealHTTP(Exception):
@@ -76,30 +407,278 @@ class _RunRealHTTP(Exception):
     """
 
 
+class _ResponseSequence(object):
+    """The responses that a matcher serves, in order.
+
+    Lists are indexed by the number of responses already served so that
+    serving is O(1) and can be rewound. Any other iterable is consumed lazily
+    and only what is needed to repeat it is kept, unless the matcher is used
+    by overlays, which may each be at a different point in the sequence.
+    """
+
+    def __init__(self, responses, mode=_REPEAT_LAST):
+        if mode not in (_REPEAT_LAST, _CYCLE):
+            raise ValueError('Unknown response mode: %s' % mode)
+
+        self._cycle = mode == _CYCLE
+        # the index of _items[0] once earlier items have been dropped
+        self._offset = 0
+        self._shared = False
+
+        if isinstance(responses, (list, tuple)):
+            self._items = list(responses)
+            self._iterator = None
+        else:
+            self._items = []
+            self._iterator = iter(responses)
+            # overlays of the matcher consume from other threads
+            self._lock = threading.Lock()
+
+    def _share(self):
+        # keep everything consumed from now on
+        self._shared = True
+
+    def _consume(self, count):
+        with self._lock:
+            items = self._items
+
+            while (self._iterator is not None and
+                   count >= self._offset + len(items)):
+                try:
+                    item = next(self._iterator)
+                except StopIteration:
+                    self._iterator = None
+                    break
+
+                # to repeat the last item we only need to hold on to that one
+                if self._cycle or self._shared:
+                    items.append(item)
+                else:
+                    self._offset += len(items)
+                    items[:] = [item]
+
+    def get(self, count):
+        """Return the response to serve after count have been served."""
+        if self._iterator is not None:
+            self._consume(count)
+
+        items = self._items
+
+        if not items:
+            # only an iterable can turn out to be empty
+            raise ValueError('response_list must have at least one response')
+
+        if self._cycle:
+            return items[count % len(items)]
+
+        return items[max(0, min(count - self._offset, len(items) - 1))]
+
+
+class _FaultSchedule(object):
+    """Decides which responses of a matcher are replaced with a fault.
+
+    The decisions are drawn from a seeded random number generator ahead of
+    time and indexed by the number of responses served, so the same requests
+    fault on every run and serving is a lookup. Like response lists the
+    schedule can be rewound.
+
+    :param faults: A dict of a fault's rate and the response kwargs to serve
+        when it happens, or a list of them.
+    :param seed: Seed for the random number generator. None seeds it
+        differently for every run.
+    """
+
+    _BLOCK = 1024
+    _NONE = 255
+
+    def __init__(self, faults, seed=0):
+        if isinstance(faults, dict):
+            faults = [faults]
+
+        if not faults or len(faults) >= self._NONE:
+            raise ValueError('faults must have between 1 and %d entries' %
+                             (self._NONE - 1))
+
+        self._thresholds = []
+        self._responses = []
+        total = 0
+
+        for fault in faults:
+            fault = dict(fault)
+
+            try:
+                rate = fault.pop('rate')
+            except KeyError:
+                raise ValueError('faults must each have a rate')
+
+            if rate < 0:
+                raise ValueError('fault rates must not be negative')
+
+            total += rate
+            self._thresholds.append(total)
+            self._responses.append(_MatcherResponse(**fault))
+
+        if total > 1:
+            raise ValueError('fault rates must not add up to more than 1')
+
+        self._seed = seed
+        self._start()
+
+    def _start(self):
+        self._random = random.Random(self._seed)
+        # one byte per response served, the index of the fault or _NONE
+        self._schedule = bytearray()
+        # overlays of the matcher extend the schedule from other threads
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # the schedule is drawn again from the seed once loaded
+        state = self.__dict__.copy()
+        del state['_random']
+        del state['_schedule']
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._start()
+
+    def get(self, count):
+        """Return the fault to serve after count responses, or None."""
+        schedule = self._schedule
+
+        if count >= len(schedule):
+            with self._lock:
+                while count >= len(schedule):
+                    draw = self._random.random
+                    thresholds = self._thresholds
+                    faults = len(thresholds)
+
+                    for _ in range(self._BLOCK):
+                        i = bisect.bisect_right(thresholds, draw())
+                        schedule.append(self._NONE if i == faults else i)
+
+        i = schedule[count]
+        return None if i == self._NONE else self._responses[i]
+
+
+def _compile_json(expected):
+    # Build a predicate once at registration rather than walking expected
+    # for every request. Dicts match if every expected key matches so extra
+    # keys are ignored at every level. Lists must match item for item.
+    if isinstance(expected, dict):
+        items = [(k, _compile_json(v)) for k, v in expected.items()]
+
+        def match(actual):
+            return (isinstance(actual, dict) and
+                    all(k in actual and m(actual[k]) for k, m in items))
+
+    elif isinstance(expected, list):
+        items = [_compile_json(v) for v in expected]
+
+        def match(actual):
+            return (isinstance(actual, list) and
+                    len(actual) == len(items) and
+                    all(m(a) for m, a in zip(items, actual)))
+
+    else:
+        def match(actual):
+            return actual == expected
+
+    return match
+
+
+class _JSONBodyMatcher(object):
+    """Matches the JSON body of a request against an expected value.
+
+    :param expected: The decoded JSON the body should contain.
+    :param bool complete: Require the body to equal expected. By default
+        objects in the body may have keys that are not in expected.
+    """
+
+    def __init__(self, expected, complete=False):
+        self._expected = expected
+        self._complete = complete
+        self._match = None if complete else _compile_json(expected)
+
+    def __call__(self, request):
+        body = request._parsed_json()
+
+        if not body:
+            return False
+
+        if self._complete:
+            return body[0] == self._expected
+
+        return self._match(body[0])
+
+    def __getstate__(self):
+        # the compiled predicate is made of closures that can't be pickled
+        return {'expected': self._expected, 'complete': self._complete}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
 class _Matcher(_RequestHistoryTracker):
     """Contains all the information about a provided URL to match."""
 
     def __init__(self, method, url, responses, complete_qs, request_headers,
-                 additional_matcher, real_http, case_sensitive):
+                 additional_matcher, real_http, case_sensitive,
+                 response_mode=_REPEAT_LAST, times=None, faults=None,
+                 rate_limit=None, clock=time.monotonic, json_body=None,
+                 form=None, track_concurrency=False):
         """
         :param bool complete_qs: Match the entire query string. By default URLs
             match if all the provided matcher query arguments are matched and
             extra query arguments are ignored. Set complete_qs to true to
             require that the entire query string needs to match.
+        :param str response_mode: How to continue once all the responses have
+            been served. 'repeat_last' to keep serving the last response or
+            'cycle' to start again from the first.
+        :param int times: Only serve this many responses, after which the
+            matcher no longer matches. None for no limit.
+        :param _FaultSchedule faults: The responses to replace with faults.
+        :param TokenBucket rate_limit: Reject requests with a 429 when the
+            bucket is empty.
+        :param callable clock: Returns the time in seconds for rate_limit.
+        :param _JSONBodyMatcher json_body: Match the JSON body of requests.
+        :param dict form: Fields and the value, or list of values, that the
+            form encoded or multipart body of requests must contain.
+        :param bool track_concurrency: Keep the series of concurrency.
         """
         super(_Matcher, self).__init__()
 
         self._method = method
         self._url = url
-        self._responses = responses
+        self._responses = _ResponseSequence(responses, response_mode)
+        self._response_count = 0
+
+        if times is not None and times < 1:
+            raise ValueError('times must be at least 1')
+
+        self._times = times
+        self._faults = faults
+        self.rate_limit = rate_limit
+        self._clock = clock
         self._complete_qs = complete_qs
         self._request_headers = request_headers
         self._real_http = real_http
         self._additional_matcher = additional_matcher
+        self._json_body = json_body
+        self.stats = MatcherStats()
+
+        # normalized once here rather than for every request
+        self._form = None
+        if form is not None:
+            self._form = {k: [str(i) for i in v]
+                          if isinstance(v, (list, tuple)) else [str(v)]
+                          for k, v in form.items()}
+        self.concurrency = Concurrency(series=track_concurrency)
 
         # url can be a regex object or ANY so don't always run urlparse
         if isinstance(url, str):
-            url_parts = urllib.parse.urlparse(url)
+            url_parts = _parse_url(url, True)
             self._scheme = url_parts.scheme.lower()
             self._netloc = url_parts.netloc.lower()
             self._path = requote_uri(url_parts.path or '/')
@@ -109,7 +688,7 @@ class _Matcher(_RequestHistoryTracker):
                 self._path = self._path.lower()
                 self._query = self._query.lower()
 
-        elif isinstance(url, purl_types):
+        elif _is_purl(url):
             self._scheme = url.scheme()
             self._netloc = url.netloc()
             self._path = url.path()
@@ -125,6 +704,10 @@ class _Matcher(_RequestHistoryTracker):
             self._path = None
             self._query = None
 
+        if self._query is not None:
+            self._qs = urllib.parse.parse_qs(self._query,
+                                             keep_blank_values=True)
+
     def _match_method(self, request):
         if self._method is ANY:
             return True
@@ -153,12 +736,13 @@ class _Matcher(_RequestHistoryTracker):
         if (request.path or '/') != self._path:
             return False
 
-        # construct our own qs structure as we remove items from it below
-        request_qs = urllib.parse.parse_qs(request.query,
-                                           keep_blank_values=True)
-        matcher_qs = urllib.parse.parse_qs(self._query, keep_blank_values=True)
+        if not (self._qs or self._complete_qs):
+            return True
+
+        # copy the shared qs structure as we remove items from it below
+        request_qs = _copy_qs(request._url_parts.qs)
 
-        for k, vals in matcher_qs.items():
+        for k, vals in self._qs.items():
             for v in vals:
                 try:
                     request_qs.get(k, []).remove(v)
@@ -195,6 +779,29 @@ class _Matcher(_RequestHistoryTracker):
 
         return True
 
+    def _match_json_body(self, request):
+        if self._json_body is None:
+            return True
+
+        return self._json_body(request)
+
+    def _match_form(self, request):
+        if self._form is None:
+            return True
+
+        form = request._form[0]
+
+        for k, vals in self._form.items():
+            values = list(form.get(k, ()))
+
+            for v in vals:
+                try:
+                    values.remove(v)
+                except ValueError:
+                    return False
+
+        return True
+
     def _match_additional(self, request):
         if callable(self._additional_matcher):
             return self._additional_matcher(request)
@@ -208,58 +815,523 @@ class _Matcher(_RequestHistoryTracker):
         return (self._match_method(request) and
                 self._match_url(request) and
                 self._match_headers(request) and
+                self._match_json_body(request) and
+                self._match_form(request) and
                 self._match_additional(request))
 
+    @property
+    def _exhausted(self):
+        return self._times is not None and self._response_count >= self._times
+
+    def _evaluate(self, request):
+        if self._exhausted:
+            return False
+
+        start = time.perf_counter_ns()
+        matched = self._match(request)
+
+        stats = self.stats
+        stats.match_time += time.perf_counter_ns() - start
+        stats.evaluations += 1
+
+        if matched:
+            stats.hits += 1
+
+        return matched
+
     def __call__(self, request):
-        if not self._match(request):
+        if not self._evaluate(request):
             return None
 
+        return self._get_response(request)
+
+    def _get_response(self, request):
         # doing this before _add_to_history means real requests are not stored
         # in the request history. I'm not sure what is better here.
         if self._real_http:
             raise _RunRealHTTP()
 
-        if len(self._responses) > 1:
-            response_matcher = self._responses.pop(0)
-        else:
-            response_matcher = self._responses[0]
+        # Counting rather than consuming the responses lets the sequence be
+        # rewound. Concurrent requests must each get their own response so
+        # take the response and record the request together.
+        with self._lock:
+            # another thread may have used up the last response since we
+            # were evaluated
+            if self._exhausted:
+                return None
+
+            self.request_history.append(request)
+            wait = 0
+
+            if self.rate_limit is not None:
+                wait = self.rate_limit.take(self._clock())
+
+            if wait:
+                # the server turned the request away so it doesn't use up a
+                # response
+                request._rate_limited = True
+            else:
+                response_matcher = self._responses.get(self._response_count)
+
+                if self._faults is not None:
+                    fault = self._faults.get(self._response_count)
+
+                    if fault is not None:
+                        response_matcher = fault
+                        self.stats.faults += 1
+
+                self._response_count += 1
+
+        concurrency = self.concurrency
+        concurrency._enter(self._clock())
+        start = time.perf_counter_ns()
+        try:
+            if wait:
+                resp = create_response(
+                    request,
+                    status_code=429,
+                    headers={'Retry-After': str(math.ceil(wait))})
+            else:
+                resp = response_matcher.get_response(request)
+        except BaseException:
+            concurrency._exit(self._clock())
+            raise
+        finally:
+            self.stats.build_time += time.perf_counter_ns() - start
+
+        _exit_on_close(resp, (concurrency,), self._clock)
+        return resp
+
+    def reset(self):
+        super(_Matcher, self).reset()
+        self.stats = MatcherStats()
+        self.concurrency.reset()
+
+        if self.rate_limit is not None:
+            self.rate_limit.reset()
+
+    def __getstate__(self):
+        # a loaded matcher starts as if it was just registered
+        state = super(_Matcher, self).__getstate__()
+        state['_response_count'] = 0
+        del state['stats']
+        del state['concurrency']
+        del state['_clock']
+        return state
+
+    def __setstate__(self, state):
+        super(_Matcher, self).__setstate__(state)
+        self.stats = MatcherStats()
+        self.concurrency = Concurrency()
+        self._clock = time.monotonic
+
+    def _fork(self):
+        # A copy for an overlay that serves responses and records history of
+        # its own from where this matcher is now. Statistics, concurrency and
+        # rate limits are still shared.
+        self._responses._share()
+        matcher = _Matcher.__new__(type(self))
+
+        with self._lock:
+            matcher.__dict__.update(self.__dict__)
+
+        matcher.request_history = []
+        matcher._lock = threading.Lock()
+        return matcher
 
-        self._add_to_history(request)
-        return response_matcher.get_response(request)
+    def _rewind(self, requests):
+        # Undo the handling of the given requests. They are always the most
+        # recent entries in our history as history is only ever appended to.
+        with self._lock:
+            history = self.request_history
+
+            while history and id(history[-1]) in requests:
+                if not history.pop()._rate_limited:
+                    self._response_count -= 1
+
+            # the tokens used since can't be told apart from a refill, so
+            # the bucket starts again full
+            if self.rate_limit is not None:
+                self.rate_limit._refill()
+
+    def __str__(self):
+        method = 'ANY' if self._method is ANY else self._method
+        url = 'ANY' if self._url is ANY else self._url
+        return '{0} {1}'.format(method, url)
+
+
+def _exit_on_close(response, trackers, clock, connection=None):
+    # A request is in flight until its body has been consumed, which for a
+    # streamed response is after it has been returned. That is also when
+    # urllib3 gives the connection back to the pool.
+    def exit():
+        now = clock()
+
+        for concurrency in trackers:
+            concurrency._exit(now)
+
+        if connection is not None:
+            connection._put()
+
+    _call_on_close(response, exit)
 
 
 class Adapter(BaseAdapter, _RequestHistoryTracker):
     """A fake adapter than can return predefined responses.
 
+    :param bool case_sensitive: Match the path and query of URLs case
+        sensitively.
+    :param callable clock: Returns the current time in seconds, used by rate
+        limits and concurrency tracking. Pass a virtual clock to simulate time
+        passing without waiting. Defaults to :py:func:`time.monotonic`.
+    :param int pool_maxsize: Emulate a connection pool of this size per host
+        like :py:class:`requests.adapters.HTTPAdapter` does. Defaults to no
+        pool, which allows any number of requests at once.
+    :param bool pool_block: Wait for a connection when the pool of a host is
+        empty rather than opening another.
+    :param float pool_timeout: The seconds to wait for a connection before
+        raising :py:exc:`urllib3.exceptions.EmptyPoolError`. Defaults to
+        waiting forever.
+    :param bool track_concurrency: Keep the series of every change in the
+        requests in flight on the adapter, its hosts and its matchers, rather
+        than only the current and peak counts.
+
+    :ivar Concurrency concurrency: The requests in flight on this adapter.
+    :ivar dict host_concurrency: The requests in flight on this adapter by
+        host.
+    :ivar dict pools: The :py:class:`~requests_mock.pool.ConnectionPool` of
+        each host when pool_maxsize is set.
     """
-    def __init__(self, case_sensitive=False):
+    def __init__(self, case_sensitive=False, clock=None, pool_maxsize=None,
+                 pool_block=False, pool_timeout=None, track_concurrency=False):
         super(Adapter, self).__init__()
         self._case_sensitive = case_sensitive
-        self._matchers = []
+        self._clock = clock or time.monotonic
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._pool_timeout = pool_timeout
+        self._track_concurrency = track_concurrency
+        self.concurrency = Concurrency(series=track_concurrency)
+        self.host_concurrency = {}
+        self.pools = {}
+        self._reserved = threading.local()
+        self._columns = _history._Columns()
+        self._matchers = _MatcherTable()
+        self._observers = []
+        self._parent = None
+        # the forks of the parent's matchers that this overlay has used
+        self._forks = {}
+
+        # (seq, priority, removed, added) for every matcher removed or replaced
+        # while a snapshot exists so that restore can undo it.
+        self._snapshots = weakref.WeakSet()
+        self._journal = []
 
     def send(self, request, **kwargs):
+        received = time.monotonic_ns()
         request = _RequestObjectProxy(request,
                                       case_sensitive=self._case_sensitive,
                                       **kwargs)
-        self._add_to_history(request)
+        request._received = received
+        request_size = _history._body_size(request.body)
+
+        with self._lock:
+            self.request_history.append(request)
+            columns = self._columns
+            row = request._row = columns._add(request.method,
+                                              request.url,
+                                              received,
+                                              request_size)
+
+        netloc = request.netloc.lower()
+        try:
+            host = self.host_concurrency[netloc]
+        except KeyError:
+            with self._lock:
+                host = self.host_concurrency.setdefault(
+                    netloc, Concurrency(series=self._track_concurrency))
+
+        connection = None
+        if self._pool_maxsize is not None:
+            try:
+                connection = self._connection(netloc)
+            except BaseException:
+                # the request is in the history though it was never sent
+                columns._finish(row, time.monotonic_ns())
+                raise
+
+        trackers = (self.concurrency, host)
+        now = self._clock()
+        for concurrency in trackers:
+            concurrency._enter(now)
+
+        try:
+            if self._observers:
+                resp = self._send_observed(request)
+            else:
+                resp = self._send(request)
+        except BaseException:
+            columns._finish(row, time.monotonic_ns())
+            now = self._clock()
+            for concurrency in trackers:
+                concurrency._exit(now)
+            if connection is not None:
+                connection._put()
+            raise
+
+        columns._finish(row, time.monotonic_ns(), resp)
+        _exit_on_close(resp, trackers, self._clock, connection)
+        return resp
+
+    def _connection(self, netloc):
+        # a connection waited for by _reserve goes to the next request the
+        # thread sends to its host
+        reserved = getattr(self._reserved, 'value', None)
+
+        if reserved is not None and reserved[0] == netloc:
+            self._reserved.value = None
+
+            if isinstance(reserved[1], BaseException):
+                raise reserved[1]
+
+            return reserved[1]
+
+        connection = self._pool(netloc)
+        connection._get()
+        return connection
+
+    @contextlib.contextmanager
+    def _reserve(self, url):
+        """Wait for a connection to the host of url before sending to it.
+
+        The mocker of all sessions waits here before taking the lock its
+        sessions share, so that a request waiting for one host doesn't stop
+        requests to others. The connection, or the error from waiting for
+        one, goes to the next request the thread sends to the host and is
+        given back if no request takes it.
+        """
+        if self._pool_maxsize is None:
+            yield
+            return
+
+        netloc = _parse_url(url, True).netloc.lower()
+        connection = self._pool(netloc)
+
+        try:
+            connection._get()
+        except Exception as e:
+            reserved = (netloc, e)
+        else:
+            reserved = (netloc, connection)
 
-        for matcher in reversed(self._matchers):
+        previous = getattr(self._reserved, 'value', None)
+        self._reserved.value = reserved
+
+        try:
+            yield
+        finally:
+            if self._reserved.value is reserved and connection is reserved[1]:
+                connection._put()
+
+            self._reserved.value = previous
+
+    def _pool(self, netloc):
+        try:
+            return self.pools[netloc]
+        except KeyError:
+            with self._lock:
+                try:
+                    return self.pools[netloc]
+                except KeyError:
+                    connections = pool.ConnectionPool(
+                        self._pool_maxsize,
+                        block=self._pool_block,
+                        timeout=self._pool_timeout,
+                        clock=self._clock)
+                    self.pools[netloc] = connections
+                    return connections
+
+    def _send(self, request):
+        now = time.perf_counter_ns
+        match_time = 0
+
+        try:
+            for matcher in self._dispatch_order(request):
+                start = now()
+                try:
+                    # _Matcher splits matching from building the response so
+                    # we can time each. Custom matchers only give us the
+                    # total.
+                    if isinstance(matcher, _Matcher):
+                        matched = matcher._evaluate(request)
+                        end = now()
+                        match_time += end - start
+
+                        if not matched:
+                            continue
+
+                        request._match_time = match_time
+                        try:
+                            resp = matcher._get_response(request)
+                        finally:
+                            request._build_time = now() - end
+                    else:
+                        resp = matcher(request)
+                        match_time += now() - start
+                except Exception:
+                    request._matcher = weakref.ref(matcher)
+                    raise
+
+                if resp is not None:
+                    return self._matched(request, matcher, resp)
+        finally:
+            request._match_time = match_time
+
+        raise exceptions.NoMockAddress(request)
+
+    def _send_observed(self, request):
+        # This duplicates the loop in _send so that there is no cost to the
+        # observer API when there are no observers.
+        observers = list(self._observers)
+        now = time.perf_counter_ns
+
+        timestamp = now()
+        for observer in observers:
+            observer.request_received(request, timestamp)
+
+        request._match_time = 0
+
+        for matcher in self._dispatch_order(request):
             try:
-                resp = matcher(request)
-            except Exception:
+                start = now()
+
+                # _Matcher splits matching from building the response so we
+                # can time each. Custom matchers only give us the total.
+                if isinstance(matcher, _Matcher):
+                    matched = matcher._evaluate(request)
+                    end = now()
+                else:
+                    resp = matcher(request)
+                    matched = resp is not None
+                    end = now()
+
+                request._match_time += end - start
+
+                for observer in observers:
+                    observer.matcher_evaluated(request,
+                                               matcher,
+                                               matched,
+                                               start,
+                                               end)
+
+                if not matched:
+                    continue
+
+                for observer in observers:
+                    observer.request_matched(request, matcher, end)
+
+                if isinstance(matcher, _Matcher):
+                    try:
+                        resp = matcher._get_response(request)
+                    finally:
+                        request._build_time = now() - end
+
+                    if resp is None:
+                        continue
+
+                built = now()
+                for observer in observers:
+                    observer.response_built(request,
+                                            matcher,
+                                            resp,
+                                            end,
+                                            built)
+
+            except _RunRealHTTP:
                 request._matcher = weakref.ref(matcher)
                 raise
-
-            if resp is not None:
+            except Exception as e:
                 request._matcher = weakref.ref(matcher)
-                resp.connection = self
-                logger.debug('{} {} {}'.format(request._request.method,
-                                               request._request.url,
-                                               resp.status_code))
-                return resp
+                timestamp = now()
+
+                for observer in observers:
+                    observer.request_failed(request, matcher, e, timestamp)
+
+                raise
+
+            return self._matched(request, matcher, resp)
+
+        timestamp = now()
+        for observer in observers:
+            observer.request_missed(request, timestamp)
 
         raise exceptions.NoMockAddress(request)
 
+    def _dispatch_order(self, request):
+        # Higher priorities always win. Within a priority the most recently
+        # registered matcher wins, and an overlay's own matchers win over those
+        # of its parent.
+        if self._parent is None:
+            return self._matchers.dispatch_order(request)
+
+        tiers = []
+        adapter = self
+        depth = 0
+
+        while adapter is not None:
+            for priority, matchers in adapter._matchers.tiers(request):
+                if depth:
+                    matchers = map(self._forked,
+                                   matchers,
+                                   itertools.repeat(adapter))
+
+                tiers.append((-priority, depth, matchers))
+
+            adapter = adapter._parent
+            depth += 1
+
+        tiers.sort(key=operator.itemgetter(0, 1))
+        return itertools.chain.from_iterable(t[2] for t in tiers)
+
+    def _forked(self, matcher, owner):
+        # The matchers of a parent are only ever read by an overlay. It uses
+        # a fork of each that keeps the responses it has served.
+        if not isinstance(matcher, _Matcher):
+            return matcher
+
+        try:
+            return self._forks[matcher]
+        except KeyError:
+            pass
+
+        # a nested overlay starts from where its parent had got to
+        parent = self._parent
+        source = matcher if parent is owner else parent._forked(matcher, owner)
+
+        with self._lock:
+            try:
+                return self._forks[matcher]
+            except KeyError:
+                fork = self._forks[matcher] = source._fork()
+                return fork
+
+    def _matched(self, request, matcher, resp):
+        # Retire matchers that have served all their responses so they aren't
+        # evaluated again. Matchers of a parent are left to the parent.
+        if isinstance(matcher, _Matcher) and matcher._exhausted:
+            # many threads may see the matcher exhausted at once
+            with self._lock:
+                if matcher in self._matchers:
+                    self._remove_matcher(matcher)
+
+        request._matcher = weakref.ref(matcher)
+        resp.connection = self
+        logger.debug('%s %s %s',
+                     request._request.method,
+                     request._request.url,
+                     resp.status_code)
+        return resp
+
     def close(self):
         pass
 
@@ -268,12 +1340,63 @@ class Adapter(BaseAdapter, _RequestHistoryTracker):
 
         :param str method: The HTTP method to match.
         :param str url: The URL to match.
+        :param response_list: A list of response kwargs to serve in order.
+            Any other iterable, including a generator, is consumed lazily as
+            requests are made.
+        :param str response_mode: What to do when all the responses in
+            response_list have been served. 'repeat_last' (the default) keeps
+            serving the last response and 'cycle' starts again from the first.
+        :param int times: Serve this many responses and then remove the
+            matcher so later requests fall through to other matchers.
+        :param int priority: Matchers with a higher priority are tried before
+            those with a lower one, regardless of the order they were
+            registered in. Defaults to 0.
+        :param faults: Replace responses with a fault at random. A dict of
+            the 'rate' to fault at, between 0 and 1, and the response kwargs
+            to serve instead, like exc or status_code. Pass a list of them to
+            inject different faults, each at its own rate.
+        :param fault_seed: The seed that decides which responses fault so
+            that runs are reproducible. Defaults to 0. None picks a different
+            seed for every run.
+        :param rate_limit: Reject requests over a rate limit with a 429 and a
+            Retry-After header. A dict of the 'rate' of requests per second
+            and optionally the 'burst' allowed, or a
+            :py:class:`requests_mock.ratelimit.TokenBucket` which can be
+            shared between matchers. Time is taken from the clock of the
+            adapter.
+        :param json_body: Only match requests with a JSON body that contains
+            this value. Objects in the body may have extra keys unless
+            complete_json is set.
+        :param bool complete_json: Require the JSON body to equal json_body.
+        :param dict form: Only match requests with a form encoded or multipart
+            body that has these fields. Each value is a string or a list of
+            strings that must all be present. Other fields are ignored.
         """
         complete_qs = kwargs.pop('complete_qs', False)
+        json_body = kwargs.pop('json_body', None)
+        complete_json = kwargs.pop('complete_json', False)
+        form = kwargs.pop('form', None)
+
+        if json_body is not None:
+            json_body = _JSONBodyMatcher(json_body, complete_json)
+
         additional_matcher = kwargs.pop('additional_matcher', None)
         request_headers = kwargs.pop('request_headers', {})
         real_http = kwargs.pop('_real_http', False)
         json_encoder = kwargs.pop('json_encoder', None)
+        response_mode = kwargs.pop('response_mode', _REPEAT_LAST)
+        times = kwargs.pop('times', None)
+        priority = kwargs.pop('priority', 0)
+        faults = kwargs.pop('faults', None)
+        fault_seed = kwargs.pop('fault_seed', 0)
+
+        if faults is not None:
+            faults = _FaultSchedule(faults, fault_seed)
+
+        rate_limit = kwargs.pop('rate_limit', None)
+
+        if isinstance(rate_limit, dict):
+            rate_limit = ratelimit.TokenBucket(**rate_limit)
 
         if response_list and kwargs:
             raise RuntimeError('You should specify either a list of '
@@ -292,7 +1415,11 @@ class Adapter(BaseAdapter, _RequestHistoryTracker):
         # Ideally case_sensitive would be a value passed to match() however
         # this would change the contract of matchers so we pass ito to the
         # proxy and the matcher separately.
-        responses = [_MatcherResponse(**k) for k in response_list]
+        if isinstance(response_list, (list, tuple)):
+            responses = [_MatcherResponse(**k) for k in response_list]
+        else:
+            responses = (_MatcherResponse(**k) for k in response_list)
+
         matcher = _Matcher(method,
                            url,
                            responses,
@@ -300,24 +1427,353 @@ class Adapter(BaseAdapter, _RequestHistoryTracker):
                            complete_qs=complete_qs,
                            additional_matcher=additional_matcher,
                            request_headers=request_headers,
-                           real_http=real_http)
-        self.add_matcher(matcher)
-        return matcher
-
-    def add_matcher(self, matcher):
+                           real_http=real_http,
+                           response_mode=response_mode,
+                           times=times,
+                           faults=faults,
+                           rate_limit=rate_limit,
+                           clock=self._clock,
+                           json_body=json_body,
+                           form=form,
+                           track_concurrency=self._track_concurrency)
+        return self.add_matcher(matcher, priority=priority)
+
+    def add_matcher(self, matcher, priority=0):
         """Register a custom matcher.
 
         A matcher is a callable that takes a `requests.Request` and returns a
         `requests.Response` if it matches or None if not.
 
         :param callable matcher: The matcher to execute.
+        :param int priority: Matchers with a higher priority are tried before
+            those with a lower one. Defaults to 0.
+        :returns: The matcher, which can be passed to :py:meth:`remove_matcher`
+            or :py:meth:`replace_matcher`.
+        """
+        self._matchers.add(matcher, priority=priority)
+        return matcher
+
+    def _check_registered(self, matcher):
+        if matcher not in self._matchers:
+            raise ValueError('%s is not registered with this adapter' %
+                             matcher)
+
+    def remove_matcher(self, matcher):
+        """Remove a matcher so it no longer handles requests.
+
+        The matcher is found with a binary search and removing it shifts the
+        matchers registered after it down a list, an O(log n) search plus a
+        list shift rather than a walk over every matcher.
+
+        :param matcher: The value returned by :py:meth:`register_uri` or
+            :py:meth:`add_matcher`. If the matcher was registered more than
+            once the most recent registration is removed.
+        :raises ValueError: If the matcher is not registered with this
+            adapter. Matchers of the adapter an overlay was created from have
+            to be removed from that adapter.
+        """
+        self._check_registered(matcher)
+        self._remove_matcher(matcher)
+
+    def replace_matcher(self, old, new):
+        """Replace a matcher with another in the same position.
+
+        The new matcher takes the precedence and priority of the old one, so
+        matchers that were registered after the old one still win over it. The
+        old matcher is removed and can be used again later, for example to
+        switch a route between two states::
+
+            healthy = adapter.register_uri('GET', url, text='ok')
+            degraded = adapter.register_uri('GET', url, status_code=503)
+            adapter.remove_matcher(degraded)
+            ...
+            adapter.replace_matcher(healthy, degraded)
+
+        :param old: The registered matcher to replace.
+        :param new: The matcher to put in its place.
+        :raises ValueError: If old is not registered with this adapter.
+        :returns: The new matcher.
+        """
+        self._check_registered(old)
+        seq = self._matchers.replace(old, new)
+        self._record(seq, None, old, new)
+        return new
+
+    def _remove_matcher(self, matcher):
+        seq, priority = self._matchers.remove(matcher)
+        self._record(seq, priority, matcher, None)
+
+    def _record(self, seq, priority, removed, added):
+        if self._snapshots:
+            self._journal.append((seq, priority, removed, added))
+        elif self._journal:
+            self._journal = []
+
+    def add_observer(self, observer):
+        """Register an observer to be notified as requests are handled.
+
+        :param Observer observer: The observer to notify. See
+            :py:class:`requests_mock.observer.Observer` for the events.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Stop notifying a previously registered observer.
+
+        :param Observer observer: The observer to remove.
         """
-        self._matchers.append(matcher)
+        self._observers.remove(observer)
 
     def reset(self):
-        super(Adapter, self).reset()
+        with self._lock:
+            self.request_history = []
+            self._columns = _history._Columns()
+            self._forks = {}
+
         for matcher in self._matchers:
             matcher.reset()
 
+        self.concurrency.reset()
+        for concurrency in list(self.host_concurrency.values()):
+            concurrency.reset()
+        for connections in list(self.pools.values()):
+            connections.reset()
+
+    def overlay(self):
+        """Create an adapter that falls through to this one.
+
+        Requests to the new adapter are matched against its own matchers
+        first and then against the matchers of this adapter. Matchers
+        registered on the new adapter stay local to it so one large set of
+        base routes can be shared by many variations. Creating an overlay is
+        cheap regardless of the number of matchers registered here.
+
+        Matchers of this adapter are never changed by the overlay. The
+        overlay serves their responses, counts their times and records their
+        history separately, starting from the state they are in when it first
+        uses them, so many overlays of one adapter don't affect each other or
+        the adapter. Statistics, concurrency and rate limits of the matchers
+        are still shared. The history of the overlay holds the requests sent
+        through it.
+
+        :returns Adapter: The new adapter.
+        """
+        adapter = type(self)(case_sensitive=self._case_sensitive,
+                             clock=self._clock,
+                             pool_maxsize=self._pool_maxsize,
+                             pool_block=self._pool_block,
+                             pool_timeout=self._pool_timeout,
+                             track_concurrency=self._track_concurrency)
+        adapter._parent = self
+        return adapter
+
+    def snapshot(self):
+        """Record the current state of the adapter.
+
+        Taking a snapshot is cheap regardless of the number of matchers
+        registered. Pass the result to :py:meth:`restore` to return to it.
+        """
+        snapshot = _Snapshot(self._matchers.next_seq,
+                             len(self.request_history),
+                             len(self._journal))
+        self._snapshots.add(snapshot)
+        return snapshot
+
+    def restore(self, snapshot):
+        """Return the adapter to the state it was in at a snapshot.
+
+        Matchers registered since the snapshot are removed and matchers
+        removed or replaced since the snapshot are put back. Requests made
+        since the snapshot are removed from the history of the adapter and the
+        matchers that handled them. Response lists of those matchers are
+        rewound so that the same responses are served again. Responses that
+        were given as an iterator are consumed and can't be rewound. The rate
+        limits of those matchers are refilled.
+
+        The cost is proportional to the number of requests made and matchers
+        registered or removed since the snapshot rather than the total
+        matchers.
+
+        :param snapshot: A value previously returned by :py:meth:`snapshot`.
+        """
+        with self._lock:
+            history = self.request_history
+            new_requests = history[snapshot.history_count:]
+            del history[snapshot.history_count:]
+            # the history may have been cleared since, which leaves its rows
+            count = history[-1]._row + 1 if history else 0
+            self._columns = self._columns._truncate(count)
+
+        self._matchers.truncate(snapshot.next_seq)
+
+        # undo newest first so a matcher replaced several times ends up as it
+        # was. Anything at or after next_seq was truncated above.
+        journal = self._journal[snapshot.journal_count:]
+        for seq, priority, removed, added in reversed(journal):
+            if seq < snapshot.next_seq:
+                if added is None:
+                    self._matchers.add(removed, seq, priority)
+                else:
+                    self._matchers.replace_seq(seq, removed)
+
+        del self._journal[snapshot.journal_count:]
+
+        ids = set(id(r) for r in new_requests)
+        for request in new_requests:
+            matcher = request.matcher
+
+            if isinstance(matcher, _Matcher):
+                matcher._rewind(ids)
+
+    def verify(self, expectations, ordered=False):
+        """Check the request history against many expectations at once.
+
+        The history is read once however many expectations there are, and
+        each request is only compared with the expectations that could match
+        its method and path. Requests that match no expectation are ignored.
+
+        :param expectations: A list of
+            :py:class:`~requests_mock.expectations.Expectation`.
+        :param bool ordered: Also require that the requests were made in the
+            order of the expectations they match. Each request then counts
+            towards one expectation, the first from the last one matched
+            that still needs it.
+        :raises VerificationError: Listing every expectation that wasn't met.
+        """
+        # expectations builds its matchers from this module
+        from requests_mock import expectations as _expectations
+
+        with self._lock:
+            history = list(self.request_history)
+
+        _expectations._verify(history,
+                              expectations,
+                              ordered=ordered,
+                              case_sensitive=self._case_sensitive)
+
+    def history_table(self):
+        """Return the request history as a column per field.
+
+        The columns are kept as each request is handled so making the table
+        is a copy of a few arrays, however long the history. It's the
+        cheap way to analyse thousands of requests, such as the spread of
+        their durations or how often each URL was called. Requests removed
+        from request_history, for example by clearing it, are left out.
+
+        :returns HistoryTable: The
+            :py:class:`~requests_mock.history.HistoryTable` of the requests
+            made so far.
+        """
+        with self._lock:
+            columns = self._columns
+            history = self.request_history
+
+            if len(history) == len(columns):
+                return columns._table()
+
+            # the history was changed directly, like cleared, so only the
+            # rows of the requests still in it are kept
+            return columns._table([r._row for r in history])
+
+    def save_routes(self, path, key=None):
+        """Save the registered matchers to a file.
+
+        The matchers are saved with their dispatch index so that
+        :py:meth:`load_routes` is much faster than registering them again.
+        Callbacks and custom matchers are saved by their import path so they
+        must be defined at the top level of a module. Responses given as an
+        iterator, file objects and raw responses can't be saved.
+
+        :param str path: The file to write. It is replaced atomically.
+        :param str key: Identifies the definitions the routes were built from,
+            like a hash of their source. :py:meth:`load_routes` only loads
+            routes saved with the same key.
+        :raises ValueError: If a matcher can't be saved.
+        """
+        header = (_ROUTES_FORMAT, key, self._case_sensitive)
+
+        try:
+            payload = pickle.dumps(self._matchers, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise ValueError('Routes can not be saved: %s' % e)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.requests_mock')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+                f.write(payload)
+
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load_routes(self, path, key=None):
+        """Load matchers saved with :py:meth:`save_routes`.
+
+        The file is unpickled so only load files you wrote yourself.
+
+        :param str path: The file to read.
+        :param str key: The key the routes must have been saved with.
+        :returns bool: True if the routes were loaded. False if there is no
+            file or it was saved with a different key, by a different version
+            of requests-mock or by an adapter with different case sensitivity,
+            in which case the routes should be registered and saved again.
+        :raises ValueError: If matchers have been registered on the adapter.
+        """
+        if self._matchers.next_seq:
+            raise ValueError('Routes can only be loaded into an adapter '
+                             'that has had no matchers registered')
+
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return False
+
+        with f:
+            try:
+                header = pickle.load(f)
+            except Exception:
+                return False
+
+            if header != (_ROUTES_FORMAT, key, self._case_sensitive):
+                return False
+
+            # unpickling creates a lot of objects and none of them are
+            # garbage, so don't let the collector walk them over and over
+            enabled = gc.isenabled()
+            gc.disable()
+
+            try:
+                matchers = pickle.load(f)
+            finally:
+                if enabled:
+                    gc.enable()
+
+        for matcher in matchers:
+            if isinstance(matcher, _Matcher):
+                matcher._clock = self._clock
+                matcher.concurrency = Concurrency(
+                    series=self._track_concurrency)
+
+        self._matchers = matchers
+        return True
+
+    def stats(self):
+        """Report the statistics of the registered matchers.
+
+        Custom matchers added with :py:meth:`add_matcher` are not included as
+        they don't record statistics.
+
+        :returns: A list of (matcher, MatcherStats) tuples sorted with the
+            matchers that have cost the most time first.
+        """
+        stats = [(m, m.stats) for m in self._matchers
+                 if isinstance(m, _Matcher)]
+        stats.sort(key=lambda s: s[1].total_time, reverse=True)
+        return stats
+
 
 __all__ = ['Adapter']
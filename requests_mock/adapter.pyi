@@ -2,14 +2,19 @@
 
 from http.cookiejar import CookieJar
 from io import IOBase
-from typing import Any, Callable, Dict, List, NewType, Optional, Pattern, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, List, NewType, Optional, Pattern, Tuple, Type, TypeVar, Union
 
 from requests import Response
 from requests.adapters import BaseAdapter
 from urllib3.response import HTTPResponse
 
+from requests_mock.expectations import Expectation
+from requests_mock.history import HistoryTable
+from requests_mock.observer import Concurrency, MatcherStats, Observer
+from requests_mock.pool import ConnectionPool
+from requests_mock.ratelimit import TokenBucket
 from requests_mock.request import Request
-from requests_mock.response import Context
+from requests_mock.response import Context, _MatcherResponse
 
 AnyMatcher = NewType("AnyMatcher", object)
 
@@ -33,9 +38,22 @@ class _RequestHistoryTracker:
     def call_count(self) -> int: ...
     def reset(self) -> None: ...
 
+class _Snapshot:
+    next_seq: int = ...
+    history_count: int = ...
+    journal_count: int = ...
+    def __init__(self, next_seq: int, history_count: int, journal_count: int) -> None: ...
+
 class _RunRealHTTP(Exception): ...
 
+class _FaultSchedule:
+    def __init__(self, faults: Union[Dict[str, Any], List[Dict[str, Any]]], seed: Optional[int] = ...) -> None: ...
+    def get(self, count: int) -> Optional[_MatcherResponse]: ...
+
 class _Matcher(_RequestHistoryTracker):
+    stats: MatcherStats = ...
+    concurrency: Concurrency = ...
+    rate_limit: Optional[TokenBucket] = ...
     def __init__(
         self, 
         method: Any, 
@@ -45,20 +63,39 @@ class _Matcher(_RequestHistoryTracker):
         request_headers: Any, 
         additional_matcher: AdditionalMatcher, 
         real_http: Any, 
-        case_sensitive: Any
+        case_sensitive: Any,
+        response_mode: str = ...,
+        times: Optional[int] = ...,
+        faults: Optional[_FaultSchedule] = ...,
+        rate_limit: Optional[TokenBucket] = ...,
+        clock: Callable[[], float] = ...
     ) -> None: ...
     def __call__(self, request: Request) -> Optional[Response]: ...
     
 class Adapter(BaseAdapter, _RequestHistoryTracker):
-    def __init__(self, case_sensitive: bool = ...) -> None: ...
+    concurrency: Concurrency = ...
+    host_concurrency: Dict[str, Concurrency] = ...
+    pools: Dict[str, ConnectionPool] = ...
+    def __init__(
+        self,
+        case_sensitive: bool = ...,
+        clock: Optional[Callable[[], float]] = ...,
+        pool_maxsize: Optional[int] = ...,
+        pool_block: bool = ...,
+        pool_timeout: Optional[float] = ...,
+        track_concurrency: bool = ...,
+    ) -> None: ...
     def register_uri(
         self,
         method: Union[str, AnyMatcher],
         url: Union[str, Pattern[str], AnyMatcher],
-        response_list: Optional[List[Dict[str, Any]]] = ...,
+        response_list: Optional[Iterable[Dict[str, Any]]] = ...,
         *,
         request_headers: Dict[str, str] = ...,
         complete_qs: bool = ...,
+        json_body: Any = ...,
+        complete_json: bool = ...,
+        form: Dict[str, Union[str, List[str]]] = ...,
         status_code: int = ...,
         reason: str = ...,
         headers: Dict[str, str] = ...,
@@ -70,7 +107,25 @@ class Adapter(BaseAdapter, _RequestHistoryTracker):
         raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
         exc: Union[Exception, Type[Exception]] = ...,
         additional_matcher: AdditionalMatcher = ...,
+        response_mode: str = ...,
+        times: Optional[int] = ...,
+        priority: int = ...,
+        faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+        fault_seed: Optional[int] = ...,
+        rate_limit: Union[Dict[str, float], TokenBucket] = ...,
         **kwargs: Any
     ) -> _Matcher: ...
-    def add_matcher(self, matcher: Matcher) -> None: ...
+    def add_matcher(self, matcher: Matcher, priority: int = ...) -> Matcher: ...
+    def remove_matcher(self, matcher: Matcher) -> None: ...
+    def replace_matcher(self, old: Matcher, new: Matcher) -> Matcher: ...
+    def add_observer(self, observer: Observer) -> None: ...
+    def remove_observer(self, observer: Observer) -> None: ...
     def reset(self) -> None: ...
+    def overlay(self) -> Adapter: ...
+    def snapshot(self) -> _Snapshot: ...
+    def restore(self, snapshot: _Snapshot) -> None: ...
+    def save_routes(self, path: str, key: Optional[str] = ...) -> None: ...
+    def load_routes(self, path: str, key: Optional[str] = ...) -> bool: ...
+    def verify(self, expectations: Iterable[Expectation], ordered: bool = ...) -> None: ...
+    def history_table(self) -> HistoryTable: ...
+    def stats(self) -> List[Tuple[_Matcher, MatcherStats]]: ...
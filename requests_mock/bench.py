@@ -0,0 +1,463 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Micro benchmarks for the requests-mock hot paths.
+
+Run with ``python -m requests_mock.bench``. Use ``--format json`` to get
+machine readable results and ``--compare`` to check them against a previously
+stored run.
+"""
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import threading
+import time
+import timeit
+
+import requests
+
+import requests_mock
+from requests_mock import response
+
+_MATCHER_COUNTS = (10, 1000, 10000)
+_QUICK_MATCHER_COUNTS = (10, 100)
+
+_BASE_URL = 'http://bench.example.com'
+
+# Kinds of matcher whose lookups are linear in the number registered.
+# Regexes are only in the wildcard bucket of the matcher table, and the query
+# and header matchers all share one method and path so they share a bucket.
+# String matchers each have their own path so are found by the index.
+_LINEAR_KINDS = ('regex', 'query', 'header')
+
+
+class Benchmark(object):
+    """A single named benchmark.
+
+    :param str name: The unique name of the benchmark.
+    :param callable setup: Called once before timing with no arguments. It
+        should return the callable that is to be timed.
+    :param int number: The number of times to call the timed function in each
+        repeat.
+    """
+
+    def __init__(self, name, setup, number):
+        self.name = name
+        self.setup = setup
+        self.number = number
+
+    def run(self, repeat):
+        func = self.setup()
+        timings = timeit.Timer(func).repeat(repeat=repeat, number=self.number)
+        return self._result([t / self.number for t in timings], repeat)
+
+    def _result(self, per_op, repeat):
+        per_op = sorted(per_op)
+
+        return {'name': self.name,
+                'number': self.number,
+                'repeat': repeat,
+                'min': per_op[0],
+                'median': per_op[len(per_op) // 2],
+                'max': per_op[-1]}
+
+
+class ImportBenchmark(Benchmark):
+    """Time importing a module in a fresh interpreter.
+
+    Each run is a new process so only the import itself is measured and it's
+    not affected by modules that earlier benchmarks loaded.
+
+    :param str module: The module to import.
+    :param int number: The number of imports to time in each repeat.
+    :param tuple preload: Modules to import before timing starts, for example
+        pytest is always loaded before its plugins.
+    """
+
+    _CODE = ('import time; '
+             '{1}'
+             'start = time.perf_counter(); '
+             'import {0}; '
+             'print(time.perf_counter() - start)')
+
+    def __init__(self, module, number, preload=()):
+        super(ImportBenchmark, self).__init__('import[%s]' % module,
+                                              None,
+                                              number)
+        self.module = module
+        self.preload = preload
+
+    def run(self, repeat):
+        preload = ''.join('import %s; ' % m for m in self.preload)
+        cmd = [sys.executable, '-c', self._CODE.format(self.module, preload)]
+        per_op = [float(subprocess.check_output(cmd))
+                  for _ in range(repeat * self.number)]
+
+        return self._result(per_op, repeat)
+
+
+class ThreadedBenchmark(Benchmark):
+    """Time a function called concurrently from many threads.
+
+    The result is the time per call over all threads, so if the threads
+    don't contend with each other it stays flat as threads are added.
+
+    :param callable setup: Called once before timing with no arguments. It
+        should return the adapter under test and the function to time, which
+        is passed the number of times to do its work.
+    :param int threads: The number of threads to call the function from.
+    """
+
+    def __init__(self, name, setup, number, threads):
+        super(ThreadedBenchmark, self).__init__(name, setup, number)
+        self.threads = threads
+
+    def run(self, repeat):
+        adapter, func = self.setup()
+        count = self.number // self.threads
+        per_op = []
+
+        for _ in range(repeat):
+            barrier = threading.Barrier(self.threads + 1)
+
+            def target():
+                barrier.wait()
+                func(count)
+
+            workers = [threading.Thread(target=target)
+                       for _ in range(self.threads)]
+            for worker in workers:
+                worker.start()
+
+            barrier.wait()
+            start = time.perf_counter()
+            for worker in workers:
+                worker.join()
+            per_op.append((time.perf_counter() - start) /
+                          (count * self.threads))
+
+            # don't let history growth skew the next repeat
+            adapter.reset()
+
+        return self._result(per_op, repeat)
+
+
+def _prepare(method, url, headers=None):
+    return requests.Request(method, url, headers=headers).prepare()
+
+
+def _register(adapter, kind, i):
+    if kind == 'string':
+        adapter.register_uri('GET', '%s/string/%d' % (_BASE_URL, i), text='')
+    elif kind == 'regex':
+        url = re.compile(r'^%s/regex/%d$' % (re.escape(_BASE_URL), i))
+        adapter.register_uri('GET', url, text='')
+    elif kind == 'query':
+        adapter.register_uri('GET', '%s/query?id=%d' % (_BASE_URL, i),
+                             text='')
+    elif kind == 'header':
+        adapter.register_uri('GET', '%s/header' % _BASE_URL,
+                             request_headers={'X-Id': str(i)},
+                             text='')
+    else:
+        raise ValueError('Unknown matcher kind: %s' % kind)
+
+
+def _first_request(kind):
+    # Matchers in a bucket are evaluated newest first so for the linear kinds
+    # the request for the first registered matcher is the worst case lookup.
+    # A string lookup costs the same whichever matcher it finds.
+    if kind == 'string':
+        return _prepare('GET', '%s/string/0' % _BASE_URL)
+    elif kind == 'regex':
+        return _prepare('GET', '%s/regex/0' % _BASE_URL)
+    elif kind == 'query':
+        return _prepare('GET', '%s/query?id=0' % _BASE_URL)
+    elif kind == 'header':
+        return _prepare('GET', '%s/header' % _BASE_URL, headers={'X-Id': '0'})
+
+    raise ValueError('Unknown matcher kind: %s' % kind)
+
+
+def _register_uri_bench(count):
+    def setup():
+        urls = ['%s/register/%d' % (_BASE_URL, i) for i in range(count)]
+
+        def func():
+            adapter = requests_mock.Adapter()
+            for url in urls:
+                adapter.register_uri('GET', url, text='')
+
+        return func
+
+    return Benchmark('register_uri[%d]' % count, setup, number=1)
+
+
+def _send_bench(kind, count, number):
+    def setup():
+        adapter = requests_mock.Adapter()
+        for i in range(count):
+            _register(adapter, kind, i)
+
+        request = _first_request(kind)
+
+        def func():
+            adapter.send(request)
+            # don't let history growth skew the lookup timings
+            adapter.request_history.clear()
+
+        return func
+
+    return Benchmark('send[%s-%d]' % (kind, count), setup, number=number)
+
+
+def _sequence_bench(length, number):
+    def setup():
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET',
+                             '%s/sequence' % _BASE_URL,
+                             [{'text': str(i)} for i in range(length)])
+        request = _prepare('GET', '%s/sequence' % _BASE_URL)
+
+        def func():
+            adapter.send(request)
+            adapter.request_history.clear()
+
+        return func
+
+    return Benchmark('sequence[%d]' % length, setup, number=number)
+
+
+def _create_response_bench(kind, number):
+    body = {'text': {'text': 'x' * 1024},
+            'json': {'json': {'key': ['value'] * 64}},
+            'content': {'content': b'x' * 1024}}[kind]
+
+    def setup():
+        request = _prepare('GET', '%s/response' % _BASE_URL)
+        return lambda: response.create_response(request, **body)
+
+    return Benchmark('create_response[%s]' % kind, setup, number=number)
+
+
+def _history_bench(size, number):
+    def setup():
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET', '%s/history' % _BASE_URL, text='')
+        request = _prepare('GET', '%s/history' % _BASE_URL)
+
+        for _ in range(size):
+            adapter.send(request)
+
+        def func():
+            adapter.send(request)
+            adapter.last_request
+            adapter.call_count
+
+        return func
+
+    return Benchmark('history[%d]' % size, setup, number=number)
+
+
+def _threaded_bench(threads, number):
+    def setup():
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET', '%s/threads' % _BASE_URL, text='')
+        request = _prepare('GET', '%s/threads' % _BASE_URL)
+
+        def send(count):
+            for _ in range(count):
+                adapter.send(request)
+
+        return adapter, send
+
+    return ThreadedBenchmark('threads[%d]' % threads, setup, number, threads)
+
+
+def _mocker_bench(number):
+    def setup():
+        def func():
+            m = requests_mock.Mocker()
+            m.start()
+            m.stop()
+
+        return func
+
+    return Benchmark('mocker[start-stop]', setup, number=number)
+
+
+def get_benchmarks(quick=False):
+    """Return the list of benchmarks to run.
+
+    :param bool quick: Use smaller sizes and iteration counts. Useful for
+        checking that the benchmarks work rather than for measuring.
+    """
+    counts = _QUICK_MATCHER_COUNTS if quick else _MATCHER_COUNTS
+    number = 10 if quick else 200
+
+    benchmarks = [_register_uri_bench(max(counts))]
+
+    for kind in ('string', 'regex', 'query', 'header'):
+        for count in counts:
+            if kind in _LINEAR_KINDS:
+                # scale the iterations down to keep the run time of large
+                # tables sane
+                iterations = max(5, min(number, 20000 // count))
+            else:
+                iterations = number
+
+            benchmarks.append(_send_bench(kind, count, iterations))
+
+    for length in (1, max(counts) * 5):
+        benchmarks.append(_sequence_bench(length, number))
+
+    for kind in ('text', 'json', 'content'):
+        benchmarks.append(_create_response_bench(kind, number * 10))
+
+    for size in (0, max(counts)):
+        benchmarks.append(_history_bench(size, number))
+
+    for threads in (1, 8):
+        benchmarks.append(_threaded_bench(threads, number * 10))
+
+    benchmarks.append(_mocker_bench(number * 10))
+
+    benchmarks.append(ImportBenchmark('requests_mock', 1 if quick else 3))
+    benchmarks.append(ImportBenchmark('requests_mock.contrib._pytest_plugin',
+                                      1 if quick else 3,
+                                      preload=('pytest',)))
+
+    return benchmarks
+
+
+def run(benchmarks, repeat=5, pattern=None):
+    """Run benchmarks and return the machine readable results.
+
+    :param list benchmarks: The :py:class:`Benchmark` objects to run.
+    :param int repeat: The number of times to repeat each benchmark.
+    :param str pattern: Only run benchmarks whose name matches this regex.
+    """
+    if pattern:
+        benchmarks = [b for b in benchmarks if re.search(pattern, b.name)]
+
+    return {'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'requests': requests.__version__,
+            'benchmarks': [b.run(repeat) for b in benchmarks]}
+
+
+def compare(baseline, results, threshold=0.25):
+    """Compare results against a baseline.
+
+    Benchmarks are compared on their fastest run as that is the least affected
+    by noise on the machine.
+
+    :param dict baseline: Results from a previous call to :py:func:`run`.
+    :param dict results: The current results.
+    :param float threshold: The allowed fractional slow down before a
+        benchmark is considered to have regressed.
+
+    :returns: A list of (name, baseline, current, ratio) tuples for each
+        benchmark that regressed.
+    """
+    previous = {b['name']: b for b in baseline['benchmarks']}
+    regressions = []
+
+    for current in results['benchmarks']:
+        try:
+            old = previous[current['name']]
+        except KeyError:
+            continue
+
+        ratio = current['min'] / old['min'] if old['min'] else 1.0
+
+        if ratio > 1.0 + threshold:
+            regressions.append((current['name'],
+                                old['min'],
+                                current['min'],
+                                ratio))
+
+    return regressions
+
+
+def _format_table(results):
+    lines = ['%-48s %14s %14s %14s' % ('benchmark', 'min', 'median', 'max')]
+
+    for b in results['benchmarks']:
+        lines.append('%-48s %12.2fus %12.2fus %12.2fus' % (b['name'],
+                                                           b['min'] * 1e6,
+                                                           b['median'] * 1e6,
+                                                           b['max'] * 1e6))
+
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m requests_mock.bench',
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true',
+                        help='Run reduced sizes to check the benchmarks work.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of times to repeat each benchmark.')
+    parser.add_argument('--filter', dest='pattern',
+                        help='Only run benchmarks matching this regex.')
+    parser.add_argument('--format', choices=('table', 'json'),
+                        default='table', help='Output format.')
+    parser.add_argument('--output', help='Write results to this file.')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='A JSON results file to compare against. Exits '
+                             'non-zero if any benchmark regressed.')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed fractional slow down when comparing.')
+
+    args = parser.parse_args(argv)
+
+    results = run(get_benchmarks(quick=args.quick),
+                  repeat=args.repeat,
+                  pattern=args.pattern)
+
+    if args.format == 'json':
+        output = json.dumps(results, indent=2, sort_keys=True)
+    else:
+        output = _format_table(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(baseline, results, threshold=args.threshold)
+
+        for name, old, new, ratio in regressions:
+            print('REGRESSION %s: %.2fus -> %.2fus (%.2fx)' % (name,
+                                                               old * 1e6,
+                                                               new * 1e6,
+                                                               ratio),
+                  file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -67,6 +67,17 @@ def pytest_addoption(parser):
                   default=_case_default)
 
 
+def _mocker(request):
+    # pytest plugins get loaded immediately. If we import requests_mock it
+    # imports requests and then SSL which prevents gevent patching. Late load.
+    import requests_mock as rm_module
+
+    case_sensitive = request.config.getini('requests_mock_case_sensitive')
+    kw = {'case_sensitive': _bool_value(case_sensitive)}
+
+    return rm_module.Mocker(**kw)
+
+
 @_fixture_type(scope='function')  # executed on every test
 def requests_mock(request):
     """Mock out the requests component of your code with defined responses.
@@ -75,12 +86,53 @@ def requests_mock(request):
     responses for unit testing. See:
     https://requests-mock.readthedocs.io/en/latest/
     """
-    # pytest plugins get loaded immediately. If we import requests_mock it
-    # imports requests and then SSL which prevents gevent patching. Late load.
-    import requests_mock as rm_module
+    with _mocker(request) as m:
+        yield m
 
-    case_sensitive = request.config.getini('requests_mock_case_sensitive')
-    kw = {'case_sensitive': _bool_value(case_sensitive)}
 
-    with rm_module.Mocker(**kw) as m:
+@_fixture_type(scope='module')
+def module_requests_mock(request):
+    """A requests_mock fixture shared by all the tests in a module.
+
+    Routes registered by module scoped fixtures are shared. Anything a test
+    registers or requests is undone when the test finishes.
+    """
+    with _mocker(request) as m:
+        yield m
+
+
+@_fixture_type(scope='session')
+def session_requests_mock(request):
+    """A requests_mock fixture shared by all the tests in a session.
+
+    Routes registered by session scoped fixtures are shared. Anything a test
+    registers or requests is undone when the test finishes.
+    """
+    with _mocker(request) as m:
         yield m
+
+
+_SHARED_FIXTURES = ('session_requests_mock', 'module_requests_mock')
+
+
+@_fixture_type(scope='function', autouse=True)
+def _requests_mock_restore(request):
+    # Tests using a shared mock each start from the shared routes with an
+    # empty history and their changes are rolled back when they finish.
+    # Restoring a snapshot only costs what the test itself did.
+    snapshots = []
+
+    for name in _SHARED_FIXTURES:
+        if name in request.fixturenames:
+            m = request.getfixturevalue(name)
+
+            # only needed if requests were made while setting up the routes
+            if m.called:
+                m.reset()
+
+            snapshots.append((m, m.snapshot()))
+
+    yield
+
+    for m, snapshot in reversed(snapshots):
+        m.restore(snapshot)
@@ -28,3 +28,20 @@ class NoMockAddress(MockException):
 
 class InvalidRequest(MockException):
     """This call cannot be made under a mocked environment"""
+
+
+class VerificationError(MockException, AssertionError):
+    """The request history didn't meet expectations.
+
+    :ivar list violations: A description of every expectation not met.
+    """
+
+    def __init__(self, violations):
+        super(VerificationError, self).__init__(violations)
+        self.violations = violations
+
+    def __str__(self):
+        lines = ['%d expectation%s not met:' % (
+            len(self.violations), '' if len(self.violations) == 1 else 's')]
+        lines.extend('  ' + v for v in self.violations)
+        return '\n'.join(lines)
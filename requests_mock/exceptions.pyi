@@ -1,6 +1,6 @@
 # Stubs for requests_mock.exceptions
 
-from typing import Any
+from typing import Any, List
 
 from requests import Request
 
@@ -11,3 +11,7 @@ class NoMockAddress(MockException):
     def __init__(self, request: Request) -> None: ...
 
 class InvalidRequest(MockException): ...
+
+class VerificationError(MockException, AssertionError):
+    violations: List[str] = ...
+    def __init__(self, violations: List[str]) -> None: ...
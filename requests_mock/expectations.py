@@ -0,0 +1,157 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Check many expectations of the request history at once."""
+
+from requests_mock import adapter
+from requests_mock import exceptions
+
+
+class Expectation(object):
+    """A request that should have been made.
+
+    Requests are matched the same way as by
+    :py:meth:`requests_mock.Adapter.register_uri`.
+
+    :param method: The HTTP method to match, or ANY.
+    :param url: The URL to match, a regular expression or ANY.
+    :param int times: The number of matching requests there must have been.
+        Defaults to at least one. Pass 0 to require there were none.
+    :param kwargs: Further conditions on the request: request_headers,
+        complete_qs, json_body, complete_json, form and additional_matcher.
+    """
+
+    _KWARGS = ('request_headers', 'complete_qs', 'json_body', 'complete_json',
+               'form', 'additional_matcher')
+
+    def __init__(self, method, url, times=None, **kwargs):
+        unexpected = set(kwargs) - set(self._KWARGS)
+        if unexpected:
+            raise TypeError('Unexpected Arguments: %s' %
+                            ', '.join(sorted(unexpected)))
+
+        if times is not None and times < 0:
+            raise ValueError('times must not be negative')
+
+        self.method = method
+        self.url = url
+        self.times = times
+        self._kwargs = kwargs
+
+    def _matcher(self, case_sensitive):
+        kwargs = dict(self._kwargs)
+        json_body = kwargs.pop('json_body', None)
+        complete_json = kwargs.pop('complete_json', False)
+
+        if json_body is not None:
+            json_body = adapter._JSONBodyMatcher(json_body, complete_json)
+
+        return adapter._Matcher(
+            self.method,
+            self.url,
+            [],
+            complete_qs=kwargs.get('complete_qs', False),
+            request_headers=kwargs.get('request_headers', {}),
+            additional_matcher=kwargs.get('additional_matcher'),
+            real_http=False,
+            case_sensitive=case_sensitive,
+            json_body=json_body,
+            form=kwargs.get('form'))
+
+    def _full(self, count):
+        # whether another request would be too many
+        return bool(self.times) and count >= self.times
+
+    def _wants(self, count):
+        # whether the expectation still needs requests to be met
+        return count < (1 if self.times is None else self.times)
+
+    def _check(self, count):
+        if self.times is None:
+            if count == 0:
+                return 'expected at least 1 call, got 0'
+        elif count != self.times:
+            return 'expected %d call%s, got %d' % (self.times,
+                                                   '' if self.times == 1
+                                                   else 's',
+                                                   count)
+
+        return None
+
+
+def _verify(history, expectations, ordered=False, case_sensitive=False):
+    # The expectations are put in a matcher table, like the routes of an
+    # adapter, so each request is only compared with the expectations that
+    # could match its method and path.
+    table = adapter._MatcherTable()
+    index = {}
+
+    for i, expectation in enumerate(expectations):
+        matcher = expectation._matcher(case_sensitive)
+        table.add(matcher)
+        # the table keeps the matchers alive so their ids aren't reused
+        index[id(matcher)] = i
+
+    counts = [0] * len(expectations)
+    violations = []
+    position = 0
+
+    for number, request in enumerate(history):
+        matched = [index[id(matcher)]
+                   for matcher in table.dispatch_order(request)
+                   if matcher._match(request)]
+
+        if not matched:
+            continue
+
+        if not ordered:
+            for i in matched:
+                counts[i] += 1
+
+            continue
+
+        # In order each request is counted once, by the first expectation
+        # from the current one that still needs it.
+        matched.sort()
+        later = [i for i in matched if i >= position] or matched
+        room = [i for i in later if not expectations[i]._full(counts[i])]
+        wanting = [i for i in room if expectations[i]._wants(counts[i])]
+        i = (wanting or room or later)[0]
+        counts[i] += 1
+
+        if i >= position:
+            position = i
+        else:
+            violations.append(
+                    'request %d %s %s came after requests for %s' % (
+                        number,
+                        request.method,
+                        request.url,
+                        _describe(expectations[position])))
+
+    for expectation, count in zip(expectations, counts):
+        problem = expectation._check(count)
+
+        if problem:
+            violations.append('%s: %s' % (_describe(expectation), problem))
+
+    if violations:
+        raise exceptions.VerificationError(violations)
+
+
+def _describe(expectation):
+    method = 'ANY' if expectation.method is adapter.ANY else expectation.method
+    url = 'ANY' if expectation.url is adapter.ANY else expectation.url
+    return '{0} {1}'.format(method, getattr(url, 'pattern', url))
+
+
+__all__ = ['Expectation']
@@ -0,0 +1,17 @@
+# Stubs for requests_mock.expectations
+
+from typing import Any, Optional, Pattern, Union
+
+from requests_mock.adapter import AnyMatcher
+
+class Expectation:
+    method: Union[str, AnyMatcher] = ...
+    url: Union[str, Pattern[str], AnyMatcher] = ...
+    times: Optional[int] = ...
+    def __init__(
+        self,
+        method: Union[str, AnyMatcher],
+        url: Union[str, Pattern[str], AnyMatcher],
+        times: Optional[int] = ...,
+        **kwargs: Any
+    ) -> None: ...
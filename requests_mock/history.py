@@ -0,0 +1,210 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""The request history of an adapter as columns."""
+
+import array
+
+# status of a request that is still being handled or that raised
+NO_STATUS = 0
+# size of a body that isn't known, like an iterator or file
+UNKNOWN_SIZE = -1
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return UNKNOWN_SIZE
+
+
+def _response_size(response):
+    # only bodies made by create_response are in memory
+    body = getattr(getattr(response, 'raw', None), '_fp', None)
+
+    try:
+        return body.getbuffer().nbytes
+    except (AttributeError, ValueError):
+        return UNKNOWN_SIZE
+
+
+class _Categories(object):
+    """Strings stored once, with a code for each."""
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value):
+        try:
+            return self._codes[value]
+        except KeyError:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+            return code
+
+    def copy(self):
+        categories = _Categories()
+        categories.values = list(self.values)
+        categories._codes = dict(self._codes)
+        return categories
+
+
+class _Columns(object):
+    """The history of an adapter, one array per field.
+
+    A row is added for each request as it is received and completed when
+    the adapter returns its response. Callers hold the adapter lock while
+    adding rows. The row of a request is its _row, which is its index in
+    the history unless the history was changed directly.
+    """
+
+    def __init__(self):
+        self.methods = _Categories()
+        self.urls = _Categories()
+        self.method = array.array('I')
+        self.url = array.array('I')
+        self.status = array.array('H')
+        self.timestamp = array.array('q')
+        self.duration = array.array('q')
+        self.request_size = array.array('q')
+        self.response_size = array.array('q')
+
+    def __len__(self):
+        return len(self.method)
+
+    def _add(self, method, url, timestamp, request_size):
+        row = len(self.method)
+        self.method.append(self.methods.code(method))
+        self.url.append(self.urls.code(url))
+        self.status.append(NO_STATUS)
+        self.timestamp.append(timestamp)
+        self.duration.append(-1)
+        self.request_size.append(request_size)
+        self.response_size.append(UNKNOWN_SIZE)
+        return row
+
+    def _finish(self, row, end, response=None):
+        # each row is only finished by the thread that added it
+        self.duration[row] = end - self.timestamp[row]
+
+        if response is not None:
+            status = response.status_code
+
+            # custom matchers can return a response without a valid status
+            if isinstance(status, int) and 0 <= status <= 0xffff:
+                self.status[row] = status
+
+            self.response_size[row] = _response_size(response)
+
+    def _truncate(self, count):
+        """Return a copy with only the first count rows.
+
+        Rows still being finished by another thread are finished in the
+        original, so they can't land on a row that was reused.
+        """
+        columns = _Columns()
+        columns.methods = self.methods.copy()
+        columns.urls = self.urls.copy()
+
+        for name in HistoryTable._ARRAYS:
+            setattr(columns, name, getattr(self, name)[:count])
+
+        return columns
+
+    def _table(self, rows=None):
+        if rows is None:
+            arrays = [getattr(self, name)[:] for name in HistoryTable._ARRAYS]
+        else:
+            arrays = []
+            for name in HistoryTable._ARRAYS:
+                values = getattr(self, name)
+                arrays.append(array.array(values.typecode,
+                                          map(values.__getitem__, rows)))
+
+        return HistoryTable(tuple(self.methods.values),
+                            tuple(self.urls.values),
+                            *arrays)
+
+
+class HistoryTable(object):
+    """The requests an adapter has handled, as a column per field.
+
+    Row i of every column is request_history[i] of the adapter at the time
+    the table was made. Methods and URLs are stored as codes that index
+    into :py:attr:`methods` and :py:attr:`urls`, so that counting or
+    grouping by them is cheap.
+
+    :ivar tuple methods: The distinct methods, indexed by method codes.
+    :ivar tuple urls: The distinct URLs, indexed by url codes.
+    :ivar array.array method: The method code of each request.
+    :ivar array.array url: The URL code of each request.
+    :ivar array.array status: The status code of each response, or 0 for
+        requests that raised, haven't been answered yet or were answered
+        without a valid status code.
+    :ivar array.array timestamp: When each request was received, from
+        :py:func:`time.monotonic_ns`.
+    :ivar array.array duration: The nanoseconds the adapter took to return
+        each response, or -1 for requests that haven't been answered yet.
+        Reading a streamed body is not included.
+    :ivar array.array request_size: The size of each request body in bytes,
+        or -1 when the body is an iterator or file.
+    :ivar array.array response_size: The size of each response body in
+        bytes, or -1 when it isn't known.
+    """
+
+    _ARRAYS = ('method', 'url', 'status', 'timestamp', 'duration',
+               'request_size', 'response_size')
+
+    def __init__(self, methods, urls, method, url, status, timestamp,
+                 duration, request_size, response_size):
+        self.methods = methods
+        self.urls = urls
+        self.method = method
+        self.url = url
+        self.status = status
+        self.timestamp = timestamp
+        self.duration = duration
+        self.request_size = request_size
+        self.response_size = response_size
+
+    def __len__(self):
+        return len(self.method)
+
+    def to_numpy(self):
+        """Convert the table to NumPy arrays.
+
+        The arrays share memory with the table rather than copying it.
+        Methods and URLs are returned as arrays of strings as well as codes.
+        NumPy must be installed.
+
+        :returns: A dict of column name to :py:class:`numpy.ndarray`, with
+            the columns of the table plus ``method_name`` and ``url_name``.
+        """
+        import numpy
+
+        columns = {}
+        for name in self._ARRAYS:
+            values = getattr(self, name)
+            columns[name] = numpy.frombuffer(values, dtype=values.typecode)
+
+        columns['method_name'] = numpy.array(self.methods,
+                                             dtype=object)[columns['method']]
+        columns['url_name'] = numpy.array(self.urls,
+                                          dtype=object)[columns['url']]
+        return columns
+
+
+__all__ = ['HistoryTable']
@@ -0,0 +1,32 @@
+# Stubs for requests_mock.history
+
+from array import array
+from typing import Any, Dict, Tuple
+
+NO_STATUS: int
+UNKNOWN_SIZE: int
+
+class HistoryTable:
+    methods: Tuple[str, ...] = ...
+    urls: Tuple[str, ...] = ...
+    method: array[int] = ...
+    url: array[int] = ...
+    status: array[int] = ...
+    timestamp: array[int] = ...
+    duration: array[int] = ...
+    request_size: array[int] = ...
+    response_size: array[int] = ...
+    def __init__(
+        self,
+        methods: Tuple[str, ...],
+        urls: Tuple[str, ...],
+        method: array[int],
+        url: array[int],
+        status: array[int],
+        timestamp: array[int],
+        duration: array[int],
+        request_size: array[int],
+        response_size: array[int],
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def to_numpy(self) -> Dict[str, Any]: ...
@@ -0,0 +1,216 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Expose mock traffic as metrics in the OpenMetrics text format."""
+
+import bisect
+import os
+import tempfile
+import threading
+
+from requests_mock.observer import Observer
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005,
+                   0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0)
+
+
+class _Series(object):
+
+    __slots__ = ('count', 'sum', 'buckets')
+
+    def __init__(self, size):
+        self.count = 0
+        self.sum = 0
+        # counts per bucket rather than cumulative so that recording is a
+        # single increment. They are summed when rendering.
+        self.buckets = [0] * size
+
+
+def _escape(value):
+    return (str(value).replace('\\', '\\\\')
+                      .replace('"', '\\"')
+                      .replace('\n', '\\n'))
+
+
+def _labels(names, values):
+    return ','.join('%s="%s"' % (n, _escape(v)) for n, v in zip(names, values))
+
+
+def _matcher_name(matcher):
+    # _Matcher describes itself. Custom matchers are usually functions whose
+    # default str includes an address that changes every run.
+    return getattr(matcher, '__qualname__', None) or str(matcher)
+
+
+class OpenMetricsExporter(Observer):
+    """An Observer that keeps metrics of the requests an adapter handles.
+
+    Requests are counted and their latency recorded in a histogram per
+    matcher, method, host and status code. Requests whose matcher raised,
+    such as a response registered with ``exc`` or an injected fault, have a
+    status of ``exception``. Requests that no matcher handled are counted
+    per method and host. Recording is a few increments and
+    rendering doesn't look at the request history.
+
+    Register it with :py:meth:`requests_mock.Adapter.add_observer`.
+
+    :param buckets: The upper bounds of the latency histogram in seconds.
+    :param str prefix: The prefix of the metric names.
+    """
+
+    _LABELS = ('matcher', 'method', 'host', 'status')
+    _UNMATCHED_LABELS = ('method', 'host')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix='requests_mock'):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._bounds = [int(b * 1e9) for b in self.buckets]
+        self._series = {}
+        self._unmatched = {}
+        self._lock = threading.Lock()
+        # the events of a request all happen on the thread that sent it
+        self._local = threading.local()
+
+    def request_received(self, request, timestamp):
+        self._local.received = timestamp
+
+    def request_missed(self, request, timestamp):
+        key = (request.method, request.netloc)
+
+        with self._lock:
+            self._unmatched[key] = self._unmatched.get(key, 0) + 1
+
+    def response_built(self, request, matcher, response, start, end):
+        self._record(request, matcher, response.status_code, start, end)
+
+    def request_failed(self, request, matcher, exception, timestamp):
+        self._record(request, matcher, 'exception', timestamp, timestamp)
+
+    def _record(self, request, matcher, status, start, end):
+        duration = end - getattr(self._local, 'received', start)
+        key = (matcher, request.method, request.netloc, status)
+
+        with self._lock:
+            try:
+                series = self._series[key]
+            except KeyError:
+                series = _Series(len(self._bounds) + 1)
+                self._series[key] = series
+
+            series.count += 1
+            series.sum += duration
+            series.buckets[bisect.bisect_left(self._bounds, duration)] += 1
+
+    def reset(self):
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._series = {}
+            self._unmatched = {}
+
+    def render(self):
+        """Render the metrics in the OpenMetrics text format.
+
+        :returns str: The exposition, ending with the ``# EOF`` marker.
+        """
+        with self._lock:
+            recorded = [(k, s.count, s.sum, list(s.buckets))
+                        for k, s in self._series.items()]
+            unmatched = list(self._unmatched.items())
+
+        # Series are recorded per matcher but matchers can share a name, like
+        # an override of the same URL, and every label set must be rendered
+        # once.
+        merged = {}
+        for key, count, total, buckets in recorded:
+            labels = (_matcher_name(key[0]),) + key[1:]
+
+            try:
+                s = merged[labels]
+            except KeyError:
+                merged[labels] = [count, total, buckets]
+            else:
+                s[0] += count
+                s[1] += total
+                s[2] = [a + b for a, b in zip(s[2], buckets)]
+
+        series = [k + tuple(v) for k, v in merged.items()]
+        series.sort(key=lambda s: tuple(str(v) for v in s[:4]))
+        unmatched.sort(key=lambda u: tuple(str(v) for v in u[0]))
+
+        requests = '%s_requests' % self.prefix
+        duration = '%s_request_duration_seconds' % self.prefix
+        missed = '%s_unmatched_requests' % self.prefix
+
+        lines = ['# TYPE %s counter' % requests,
+                 '# HELP %s Requests handled by a matcher.' % requests]
+
+        for s in series:
+            lines.append('%s_total{%s} %d' % (requests,
+                                              _labels(self._LABELS, s[:4]),
+                                              s[4]))
+
+        lines.append('# TYPE %s histogram' % duration)
+        lines.append('# HELP %s Time taken to handle requests.' % duration)
+        lines.append('# UNIT %s seconds' % duration)
+
+        for s in series:
+            labels = _labels(self._LABELS, s[:4])
+            cumulative = 0
+
+            for bound, count in zip(self.buckets + ('+Inf',), s[6]):
+                cumulative += count
+                lines.append('%s_bucket{%s,le="%s"} %d' % (duration,
+                                                           labels,
+                                                           bound,
+                                                           cumulative))
+
+            lines.append('%s_count{%s} %d' % (duration, labels, s[4]))
+            lines.append('%s_sum{%s} %r' % (duration, labels, s[5] / 1e9))
+
+        lines.append('# TYPE %s counter' % missed)
+        lines.append('# HELP %s Requests no matcher handled.' % missed)
+
+        for key, count in unmatched:
+            lines.append('%s_total{%s} %d' % (
+                missed,
+                _labels(self._UNMATCHED_LABELS, key),
+                count))
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """Write the rendered metrics to a file.
+
+        The file is replaced atomically so a collector reading it never sees
+        a partial exposition.
+
+        :param str path: The file to write.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.requests_mock')
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.render())
+
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+__all__ = ['CONTENT_TYPE', 'DEFAULT_BUCKETS', 'OpenMetricsExporter']
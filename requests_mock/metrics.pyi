@@ -0,0 +1,19 @@
+# Stubs for requests_mock.metrics
+
+from typing import Any, Iterable, Tuple
+
+from requests import Response
+
+from requests_mock.observer import Observer
+from requests_mock.request import Request
+
+CONTENT_TYPE: str
+DEFAULT_BUCKETS: Tuple[float, ...]
+
+class OpenMetricsExporter(Observer):
+    buckets: Tuple[float, ...] = ...
+    prefix: str = ...
+    def __init__(self, buckets: Iterable[float] = ..., prefix: str = ...) -> None: ...
+    def reset(self) -> None: ...
+    def render(self) -> str: ...
+    def write(self, path: str) -> None: ...
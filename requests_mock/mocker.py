@@ -89,11 +89,22 @@ class MockerCore(object):
     _PROXY_FUNCS = {
         'last_request',
         'add_matcher',
+        'add_observer',
+        'load_routes',
+        'remove_matcher',
+        'remove_observer',
+        'replace_matcher',
         'request_history',
         'called',
         'called_once',
         'call_count',
+        'history_table',
         'reset',
+        'restore',
+        'save_routes',
+        'snapshot',
+        'stats',
+        'verify',
     }
 
     case_sensitive = False
@@ -125,9 +136,12 @@ class MockerCore(object):
 
         self._mock_target = session or requests.Session
         self.case_sensitive = kwargs.pop('case_sensitive', self.case_sensitive)
+        clock = kwargs.pop('clock', None)
+        track_concurrency = kwargs.pop('track_concurrency', False)
         self._adapter = (
             kwargs.pop('adapter', None) or
-            adapter.Adapter(case_sensitive=self.case_sensitive)
+            adapter.Adapter(case_sensitive=self.case_sensitive, clock=clock,
+                            track_concurrency=track_concurrency)
         )
 
         self._json_encoder = kwargs.pop('json_encoder', None)
@@ -149,6 +163,10 @@ class MockerCore(object):
         self._last_send = self._mock_target.send
         self._last_get_adapter = self._mock_target.get_adapter
 
+        if not isinstance(self._mock_target, type):
+            self._start_session()
+            return
+
         def _fake_get_adapter(session, url):
             return self._adapter
 
@@ -157,7 +175,10 @@ class MockerCore(object):
             # are multiple threads running - one thread could restore the
             # original get_adapter() just as a second thread is about to
             # execute _original_send() below
-            with threading_rlock(timeout=10):
+            #
+            # Waiting for a pooled connection is done before taking the lock
+            # so that a request blocked on one host doesn't block the rest.
+            with self._reserve(request.url), threading_rlock(timeout=10):
                 # mock get_adapter
                 #
                 # NOTE(phodge): requests.Session.send() is actually
@@ -204,6 +225,59 @@ class MockerCore(object):
 
         _set_method(self._mock_target, "send", _fake_send)
 
+    def _reserve(self, url):
+        if isinstance(self._adapter, adapter.Adapter):
+            return self._adapter._reserve(url)
+
+        return contextlib.nullcontext()
+
+    def _start_session(self):
+        # Mocking a single session only patches that instance so there is
+        # nothing to guard with the global lock and sessions mocked in
+        # different threads don't contend. get_adapter stays patched until
+        # stop and a request that falls through to the real send is told
+        # apart with a thread local rather than by unpatching get_adapter
+        # from under other threads using the session.
+        local = threading.local()
+        last_get_adapter = self._last_get_adapter
+        last_send = self._last_send
+
+        def _fake_get_adapter(session, url):
+            if getattr(local, 'passthrough', False):
+                return last_get_adapter(url)
+
+            return self._adapter
+
+        fake_get_adapter = types.MethodType(_fake_get_adapter,
+                                            self._mock_target)
+
+        def _fake_send(session, request, **kwargs):
+            # redirects of a request that fell through are sent through here
+            # again and should be mocked
+            passthrough = getattr(local, 'passthrough', False)
+            local.passthrough = False
+
+            try:
+                # a mocker of the class that a request fell through to puts
+                # back the get_adapter of the class when it's done
+                session.get_adapter = fake_get_adapter
+
+                try:
+                    return _original_send(session, request, **kwargs)
+                except exceptions.NoMockAddress:
+                    if not self.real_http:
+                        raise
+                except adapter._RunRealHTTP:
+                    pass
+
+                local.passthrough = True
+                return last_send(request, **kwargs)
+            finally:
+                local.passthrough = passthrough
+
+        self._mock_target.get_adapter = fake_get_adapter
+        _set_method(self._mock_target, "send", _fake_send)
+
     def stop(self):
         """Stop mocking requests.
 
@@ -214,6 +288,9 @@ class MockerCore(object):
             self._mock_target.send = self._last_send
             self._last_send = None
 
+            if not isinstance(self._mock_target, type):
+                self._mock_target.get_adapter = self._last_get_adapter
+
     # for familiarity with MagicMock
     def reset_mock(self):
         self.reset()
@@ -273,6 +350,10 @@ class Mocker(MockerCore):
             as this named keyword argument, rather than a positional argument.
         :param bool real_http: True to send the request to the real requested
             uri if there is not a mock installed for it. Defaults to False.
+        :param callable clock: Returns the current time in seconds, used by
+            rate limits. Defaults to :py:func:`time.monotonic`.
+        :param bool track_concurrency: Keep the series of every change in the
+            requests in flight. Defaults to False.
         """
         self._kw = kwargs.pop('kw', None)
         super(Mocker, self).__init__(**kwargs)
@@ -300,6 +381,23 @@ class Mocker(MockerCore):
         )
         return m
 
+    def overlay(self):
+        """Returns a new mock that falls through to this mock's routes.
+
+        Routes registered on the new mock stay local to it and take precedence
+        over the routes of this mock. See :py:meth:`Adapter.overlay`.
+        """
+        kwargs = {}
+        if not isinstance(self._mock_target, type):
+            kwargs['session'] = self._mock_target
+
+        return type(self)(kw=self._kw,
+                          real_http=self.real_http,
+                          case_sensitive=self.case_sensitive,
+                          json_encoder=self._json_encoder,
+                          adapter=self._adapter.overlay(),
+                          **kwargs)
+
     def decorate_callable(self, func):
         """Decorates a callable
 
@@ -4,13 +4,17 @@ from json import JSONEncoder
 from http.cookiejar import CookieJar
 from io import IOBase
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Optional, Pattern, Type, TypeVar, Union, overload
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple, Type, TypeVar, Union, overload
 
 from requests import Response, Session
 from typing_extensions import Self
 from urllib3.response import HTTPResponse
 
-from requests_mock.adapter import AnyMatcher, _Matcher, Callback, AdditionalMatcher
+from requests_mock.adapter import AnyMatcher, _Matcher, _Snapshot, Callback, AdditionalMatcher
+from requests_mock.expectations import Expectation
+from requests_mock.history import HistoryTable
+from requests_mock.observer import MatcherStats, Observer
+from requests_mock.ratelimit import TokenBucket
 from requests_mock.request import Request
 
 DELETE: str
@@ -26,7 +30,19 @@ class MockerCore:
     def __init__(self, **kwargs: Any) -> None: ...
     def start(self) -> None: ...
     def stop(self) -> None: ...
-    def add_matcher(self, matcher: Callable[[Request], Optional[Response]]) -> None: ...
+    def add_matcher(
+        self,
+        matcher: Callable[[Request], Optional[Response]],
+        priority: int = ...,
+    ) -> Callable[[Request], Optional[Response]]: ...
+    def remove_matcher(self, matcher: Callable[[Request], Optional[Response]]) -> None: ...
+    def replace_matcher(
+        self,
+        old: Callable[[Request], Optional[Response]],
+        new: Callable[[Request], Optional[Response]],
+    ) -> Callable[[Request], Optional[Response]]: ...
+    def add_observer(self, observer: Observer) -> None: ...
+    def remove_observer(self, observer: Observer) -> None: ...
     @property
     def request_history(self) -> List[Request]: ...
     @property
@@ -39,15 +55,25 @@ class MockerCore:
     def call_count(self) -> int: ...
     def reset(self) -> None: ...
     def reset_mock(self) -> None: ...
+    def snapshot(self) -> _Snapshot: ...
+    def restore(self, snapshot: _Snapshot) -> None: ...
+    def save_routes(self, path: str, key: Optional[str] = ...) -> None: ...
+    def load_routes(self, path: str, key: Optional[str] = ...) -> bool: ...
+    def verify(self, expectations: Iterable[Expectation], ordered: bool = ...) -> None: ...
+    def history_table(self) -> HistoryTable: ...
+    def stats(self) -> List[Tuple[_Matcher, MatcherStats]]: ...
 
     def register_uri(
       self,
       method: Union[str, AnyMatcher],
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -59,6 +85,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -67,10 +99,13 @@ class MockerCore:
       self,
       method: Union[str, AnyMatcher],
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -82,6 +117,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -89,10 +130,13 @@ class MockerCore:
     def get(
       self,
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -104,6 +148,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -111,10 +161,13 @@ class MockerCore:
     def head(
       self,
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -126,6 +179,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -133,10 +192,13 @@ class MockerCore:
     def options(
       self,
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -148,6 +210,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -155,10 +223,13 @@ class MockerCore:
     def post(
       self,
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -170,6 +241,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -177,10 +254,13 @@ class MockerCore:
     def put(
       self,
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -192,6 +272,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -199,10 +285,13 @@ class MockerCore:
     def patch(
       self,
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -214,6 +303,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -221,10 +316,13 @@ class MockerCore:
     def delete(
       self,
       url: Union[str, Pattern[str], AnyMatcher],
-      response_list: Optional[List[Dict[str, Any]]] = ...,
+      response_list: Optional[Iterable[Dict[str, Any]]] = ...,
       *,
       request_headers: Dict[str, str] = ...,
       complete_qs: bool = ...,
+      json_body: Any = ...,
+      complete_json: bool = ...,
+      form: Dict[str, Union[str, List[str]]] = ...,
       status_code: int = ...,
       reason: str = ...,
       headers: Dict[str, str] = ...,
@@ -236,6 +334,12 @@ class MockerCore:
       raw: Union[HTTPResponse, Callback[HTTPResponse]] = ...,
       exc: Union[Exception, Type[Exception]] = ...,
       additional_matcher: AdditionalMatcher = ...,
+      response_mode: str = ...,
+      times: Optional[int] = ...,
+      priority: int = ...,
+      faults: Union[Dict[str, Any], List[Dict[str, Any]]] = ...,
+      fault_seed: Optional[int] = ...,
+      rate_limit: Union[Dict[str, float], TokenBucket] = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
       **kwargs: Any,
     ) -> _Matcher: ...
@@ -256,6 +360,8 @@ class Mocker(MockerCore):
       session: Optional[Session] = ...,
       real_http: bool = ...,
       json_encoder: Optional[Type[JSONEncoder]] = ...,
+      clock: Optional[Callable[[], float]] = ...,
+      track_concurrency: bool = ...,
     ) -> None: ...
     def __enter__(self) -> Self: ...
     def __exit__(self, type: type[BaseException] | None, value: BaseException | None, traceback: TracebackType | None) -> None: ...
@@ -264,6 +370,7 @@ class Mocker(MockerCore):
     @overload
     def __call__(self, obj: _CallableT) -> _CallableT: ...
     def copy(self) -> Mocker: ...
+    def overlay(self) -> Mocker: ...
     def decorate_callable(self, func: _CallableT) -> _CallableT: ...
     def decorate_class(self, klass: Type[_T]) -> Type[_T]: ...
 
@@ -0,0 +1,164 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+
+class Observer(object):
+    """Receives events as an Adapter handles requests.
+
+    Subclass this and override the events you are interested in, then register
+    it with :py:meth:`requests_mock.Adapter.add_observer`.
+
+    All timestamps are integer nanoseconds from :py:func:`time.perf_counter_ns`
+    so they are monotonic and only meaningful relative to each other.
+    """
+
+    def request_received(self, request, timestamp):
+        """A request was received by the adapter."""
+
+    def matcher_evaluated(self, request, matcher, matched, start, end):
+        """A matcher was checked against the request.
+
+        For custom matchers registered with ``add_matcher`` the time includes
+        building the response as matching and building can't be separated.
+        """
+
+    def request_matched(self, request, matcher, timestamp):
+        """A matcher accepted the request."""
+
+    def request_missed(self, request, timestamp):
+        """No matcher accepted the request."""
+
+    def response_built(self, request, matcher, response, start, end):
+        """The matched matcher finished building its response."""
+
+    def request_failed(self, request, matcher, exception, timestamp):
+        """A matcher raised while matching or building its response.
+
+        This includes responses registered with ``exc`` and injected faults.
+        """
+
+
+class MatcherStats(object):
+    """The statistics collected for a single matcher.
+
+    :ivar int evaluations: The number of times the matcher was checked.
+    :ivar int hits: The number of times the matcher accepted a request.
+    :ivar int match_time: Nanoseconds spent checking requests.
+    :ivar int build_time: Nanoseconds spent building responses.
+    :ivar int faults: The number of responses replaced with an injected
+        fault.
+    """
+
+    def __init__(self):
+        self.evaluations = 0
+        self.hits = 0
+        self.match_time = 0
+        self.build_time = 0
+        self.faults = 0
+
+    @property
+    def total_time(self):
+        return self.match_time + self.build_time
+
+
+class Concurrency(object):
+    """Tracks how many requests are in flight at once.
+
+    A request is in flight from when it is handled until its response body
+    has been read or closed, so a streamed response counts until the caller
+    is done with it. Times are read from the clock of the adapter.
+
+    :ivar int current: The number of requests in flight now.
+    :ivar int peak: The most requests that have been in flight at once.
+    :ivar list series: A (time, current) tuple for every change, or None
+        unless the series is tracked.
+
+    :param bool series: Record every change in :py:attr:`series`. The series
+        grows with each request, so it is off by default.
+    """
+
+    def __init__(self, series=False):
+        self.current = 0
+        self.peak = 0
+        self.series = [] if series else None
+        self._lock = threading.Lock()
+
+    def _enter(self, now):
+        with self._lock:
+            self.current += 1
+            if self.series is not None:
+                self.series.append((now, self.current))
+
+            if self.current > self.peak:
+                self.peak = self.current
+
+    def _exit(self, now):
+        with self._lock:
+            self.current -= 1
+            if self.series is not None:
+                self.series.append((now, self.current))
+
+    def reset(self):
+        """Forget the history. Requests still in flight are kept."""
+        with self._lock:
+            self.peak = self.current
+            if self.series is not None:
+                self.series = []
+
+
+class MatcherStatsObserver(Observer):
+    """An Observer that aggregates counts and timings per matcher.
+
+    :ivar dict matchers: A mapping of matcher to :py:class:`MatcherStats`.
+    :ivar int requests: The number of requests received.
+    :ivar int misses: The number of requests that no matcher accepted.
+    :ivar int match_time: Total nanoseconds spent evaluating matchers.
+    :ivar int build_time: Total nanoseconds spent building responses.
+    """
+
+    def __init__(self):
+        self.matchers = {}
+        self.requests = 0
+        self.misses = 0
+        self.match_time = 0
+        self.build_time = 0
+
+    def _stats(self, matcher):
+        try:
+            return self.matchers[matcher]
+        except KeyError:
+            stats = self.matchers[matcher] = MatcherStats()
+            return stats
+
+    def request_received(self, request, timestamp):
+        self.requests += 1
+
+    def matcher_evaluated(self, request, matcher, matched, start, end):
+        stats = self._stats(matcher)
+        stats.evaluations += 1
+        stats.match_time += end - start
+        self.match_time += end - start
+
+        if matched:
+            stats.hits += 1
+
+    def request_missed(self, request, timestamp):
+        self.misses += 1
+
+    def response_built(self, request, matcher, response, start, end):
+        self._stats(matcher).build_time += end - start
+        self.build_time += end - start
+
+
+__all__ = ['Concurrency', 'MatcherStats', 'MatcherStatsObserver', 'Observer']
@@ -0,0 +1,40 @@
+# Stubs for requests_mock.observer
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests import Response
+
+from requests_mock.request import Request
+
+class Observer:
+    def request_received(self, request: Request, timestamp: int) -> None: ...
+    def matcher_evaluated(self, request: Request, matcher: Any, matched: bool, start: int, end: int) -> None: ...
+    def request_matched(self, request: Request, matcher: Any, timestamp: int) -> None: ...
+    def request_missed(self, request: Request, timestamp: int) -> None: ...
+    def response_built(self, request: Request, matcher: Any, response: Response, start: int, end: int) -> None: ...
+    def request_failed(self, request: Request, matcher: Any, exception: Exception, timestamp: int) -> None: ...
+
+class MatcherStats:
+    evaluations: int = ...
+    hits: int = ...
+    match_time: int = ...
+    build_time: int = ...
+    faults: int = ...
+    def __init__(self) -> None: ...
+    @property
+    def total_time(self) -> int: ...
+
+class Concurrency:
+    current: int = ...
+    peak: int = ...
+    series: Optional[List[Tuple[float, int]]] = ...
+    def __init__(self, series: bool = ...) -> None: ...
+    def reset(self) -> None: ...
+
+class MatcherStatsObserver(Observer):
+    matchers: Dict[Any, MatcherStats] = ...
+    requests: int = ...
+    misses: int = ...
+    match_time: int = ...
+    build_time: int = ...
+    def __init__(self) -> None: ...
@@ -0,0 +1,125 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import logging
+import threading
+import time
+
+from urllib3.exceptions import EmptyPoolError
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool(object):
+    """An emulated pool of connections to one host.
+
+    This follows the pool urllib3 gives each host of a
+    :py:class:`requests.adapters.HTTPAdapter`. A request takes a connection
+    from the pool and gives it back once its response body has been read or
+    closed. At most maxsize idle connections are kept. If the pool is empty
+    a blocking pool waits for a connection to be given back, otherwise a new
+    connection is opened and discarded when it is given back to a full pool.
+
+    Waits are real waits, timed with the clock of the adapter.
+
+    :param int maxsize: The number of connections to keep.
+    :param bool block: Wait for a connection rather than opening more than
+        maxsize.
+    :param float timeout: The seconds to wait for a connection before
+        raising :py:exc:`urllib3.exceptions.EmptyPoolError`. None to wait
+        forever.
+    :param callable clock: Returns the time in seconds.
+
+    :ivar int in_use: The number of connections in use.
+    :ivar int idle: The number of connections kept open for reuse.
+    :ivar int created: The number of connections opened.
+    :ivar int discarded: The number of connections closed because the pool
+        was full.
+    :ivar int waits: The number of requests that waited for a connection.
+    :ivar float wait_time: The total time requests waited for a connection.
+    :ivar float max_wait: The longest time a request waited for a connection.
+    :ivar int timeouts: The number of requests that gave up waiting.
+    """
+
+    def __init__(self, maxsize, block=False, timeout=None,
+                 clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.maxsize = maxsize
+        self.block = block
+        self.timeout = timeout
+        self.in_use = 0
+        self.idle = 0
+        self._clock = clock
+        self._condition = threading.Condition()
+        self.reset()
+
+    def _available(self):
+        return self.in_use < self.maxsize
+
+    def _get(self):
+        with self._condition:
+            if self.block and not self._available():
+                start = self._clock()
+                self.waits += 1
+
+                available = self._condition.wait_for(self._available,
+                                                     self.timeout)
+
+                waited = self._clock() - start
+                self.wait_time += waited
+                self.max_wait = max(self.max_wait, waited)
+
+                if not available:
+                    self.timeouts += 1
+                    raise EmptyPoolError(
+                        self,
+                        'Pool is empty and a full pool is blocking.')
+
+            self.in_use += 1
+
+            if self.idle:
+                self.idle -= 1
+            else:
+                self.created += 1
+
+    def _put(self):
+        with self._condition:
+            self.in_use -= 1
+
+            if self.idle < self.maxsize:
+                self.idle += 1
+            else:
+                self.discarded += 1
+                logger.warning('Connection pool is full, discarding '
+                               'connection. Connection pool size: %s',
+                               self.maxsize)
+
+            self._condition.notify()
+
+    def reset(self):
+        """Clear the statistics. Connections in use are kept."""
+        with self._condition:
+            self.created = 0
+            self.discarded = 0
+            self.waits = 0
+            self.wait_time = 0
+            self.max_wait = 0
+            self.timeouts = 0
+
+    def __str__(self):
+        return 'ConnectionPool(maxsize=%d, block=%s)' % (self.maxsize,
+                                                         self.block)
+
+
+__all__ = ['ConnectionPool']
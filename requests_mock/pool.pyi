@@ -0,0 +1,24 @@
+# Stubs for requests_mock.pool
+
+from typing import Callable, Optional
+
+class ConnectionPool:
+    maxsize: int = ...
+    block: bool = ...
+    timeout: Optional[float] = ...
+    in_use: int = ...
+    idle: int = ...
+    created: int = ...
+    discarded: int = ...
+    waits: int = ...
+    wait_time: float = ...
+    max_wait: float = ...
+    timeouts: int = ...
+    def __init__(
+        self,
+        maxsize: int,
+        block: bool = ...,
+        timeout: Optional[float] = ...,
+        clock: Callable[[], float] = ...,
+    ) -> None: ...
+    def reset(self) -> None: ...
@@ -0,0 +1,97 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+
+class TokenBucket(object):
+    """A token bucket to simulate a server side rate limit.
+
+    The bucket holds up to burst tokens and refills at rate tokens a second.
+    Every accepted request takes a token and requests that find the bucket
+    empty are rejected.
+
+    Time is read from the clock of the adapter the bucket is used with so a
+    virtual clock can simulate throughput without waiting. Pass the same
+    bucket as the ``rate_limit`` of many matchers to share a limit between
+    them, for example across all the routes of a host.
+
+    :param float rate: The number of requests accepted per second.
+    :param int burst: The number of requests that can be accepted at once
+        after a quiet period. Defaults to the rate, and at least 1.
+
+    :ivar int accepted: The number of requests accepted.
+    :ivar int rejected: The number of requests rejected.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0')
+
+        if burst is None:
+            burst = max(1, rate)
+        elif burst < 1:
+            raise ValueError('burst must be at least 1')
+
+        self.rate = rate
+        self.burst = burst
+        self.accepted = 0
+        self.rejected = 0
+
+        self._tokens = burst
+        self._updated = None
+        self._lock = threading.Lock()
+
+    def take(self, now):
+        """Take a token for a request.
+
+        :param float now: The current time in seconds.
+        :returns float: 0 if the request is accepted, otherwise the seconds
+            until a token will be available.
+        """
+        with self._lock:
+            if self._updated is not None:
+                # a virtual clock may be wound back, never take tokens away
+                elapsed = max(0, now - self._updated)
+                self._tokens = min(self.burst,
+                                   self._tokens + elapsed * self.rate)
+
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.accepted += 1
+                return 0
+
+            self.rejected += 1
+            return (1 - self._tokens) / self.rate
+
+    def _refill(self):
+        with self._lock:
+            self._tokens = self.burst
+            self._updated = None
+
+    def reset(self):
+        """Refill the bucket and forget the counts."""
+        self._refill()
+        self.accepted = 0
+        self.rejected = 0
+
+    def __getstate__(self):
+        # only the configuration is kept, a loaded bucket starts full
+        return {'rate': self.rate, 'burst': self.burst}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+__all__ = ['TokenBucket']
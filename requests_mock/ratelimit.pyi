@@ -0,0 +1,12 @@
+# Stubs for requests_mock.ratelimit
+
+from typing import Optional
+
+class TokenBucket:
+    rate: float = ...
+    burst: float = ...
+    accepted: int = ...
+    rejected: int = ...
+    def __init__(self, rate: float, burst: Optional[float] = ...) -> None: ...
+    def take(self, now: float) -> float: ...
+    def reset(self) -> None: ...
@@ -10,12 +10,163 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
 import copy
+import email.message
+import functools
 import json
 import urllib.parse
 
 import requests
 
+_URL_CACHE_SIZE = 1024
+
+_URLParts = collections.namedtuple('_URLParts',
+                                   ['scheme', 'netloc', 'path', 'query', 'qs'])
+
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _parse_url(url, case_sensitive):
+    # Tests tend to request the same few URLs over and over so cache the
+    # parsing. The qs is shared by every caller so it must be copied rather
+    # than modified, see _copy_qs.
+    if not case_sensitive:
+        url = url.lower()
+
+    parts = urllib.parse.urlparse(url)
+    qs = urllib.parse.parse_qs(parts.query, keep_blank_values=True)
+    return _URLParts(parts.scheme, parts.netloc, parts.path, parts.query, qs)
+
+
+def _copy_qs(qs):
+    return {k: list(v) for k, v in qs.items()}
+
+
+UploadedFile = collections.namedtuple('UploadedFile',
+                                      ['filename', 'content_type', 'content'])
+UploadedFile.__doc__ = """A file uploaded in a multipart request.
+
+:ivar str filename: The name the file was uploaded with.
+:ivar str content_type: The content type of the part, or None.
+:ivar bytes content: The contents of the file.
+"""
+
+
+def _header_params(value):
+    # email does the quoting and continuation rules of MIME parameters
+    message = email.message.Message()
+    message['content-type'] = value
+    return message
+
+
+def _iter_multipart(body, boundary):
+    # Walk the parts by finding each delimiter in place so only the parts
+    # themselves are copied out of the body, never the body as a whole.
+    delimiter = b'\r\n--' + boundary
+    # the first delimiter may start the body without a preceding newline
+    pos = body.find(delimiter[2:])
+
+    if pos == -1:
+        return
+
+    pos += len(delimiter) - 2
+
+    while not body.startswith(b'--', pos):
+        headers_start = body.find(b'\r\n', pos)
+        headers_end = body.find(b'\r\n\r\n', headers_start)
+
+        if headers_start == -1 or headers_end == -1:
+            return
+
+        end = body.find(delimiter, headers_end + 4)
+
+        if end == -1:
+            return
+
+        headers = {}
+        for line in body[headers_start + 2:headers_end].split(b'\r\n'):
+            name, _, value = line.decode('utf-8', 'replace').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        yield headers, body[headers_end + 4:end]
+        pos = end + len(delimiter)
+
+
+def _decode(data, charset='utf-8'):
+    # bodies come from the caller so may be in any encoding, or none
+    try:
+        return data.decode(charset, 'replace')
+    except LookupError:
+        return data.decode('utf-8', 'replace')
+
+
+def _parse_form(content_type, body):
+    # Returns the (form, files) of a request body
+    form = {}
+    files = {}
+
+    if not content_type or not isinstance(body, (bytes, str)):
+        return form, files
+
+    params = _header_params(content_type)
+    mimetype = params.get_content_type()
+
+    if mimetype == 'application/x-www-form-urlencoded':
+        if isinstance(body, bytes):
+            body = _decode(body)
+
+        form = urllib.parse.parse_qs(body, keep_blank_values=True)
+
+    elif mimetype == 'multipart/form-data':
+        boundary = params.get_param('boundary')
+
+        if not boundary:
+            return form, files
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        for headers, content in _iter_multipart(body,
+                                                boundary.encode('utf-8')):
+            disposition = _header_params(
+                'form-data; ' + headers.get('content-disposition', ''))
+            name = disposition.get_param('name')
+
+            if name is None:
+                continue
+
+            filename = disposition.get_param('filename')
+
+            if filename is None:
+                charset = _header_params(
+                    headers.get('content-type', 'text/plain')
+                ).get_content_charset('utf-8')
+                form.setdefault(name, []).append(_decode(content, charset))
+            else:
+                files.setdefault(name, []).append(
+                    UploadedFile(filename,
+                                 headers.get('content-type'),
+                                 content))
+
+    return form, files
+
+
+def url_cache_info():
+    """Report the use of the cache of parsed URLs.
+
+    Requests and matchers share a bounded cache of their parsed URLs so that
+    requesting the same URL again doesn't parse it again.
+
+    :returns: A named tuple of hits, misses, maxsize and currsize as from
+        :py:func:`functools.lru_cache`.
+    """
+    return _parse_url.cache_info()
+
+
+def url_cache_clear():
+    """Empty the cache of parsed URLs and reset its counters."""
+    _parse_url.cache_clear()
+
 
 class _RequestObjectProxy(object):
     """A wrapper around a requests.Request that gives some extra information.
@@ -27,8 +178,15 @@ class _RequestObjectProxy(object):
     def __init__(self, request, **kwargs):
         self._request = request
         self._matcher = None
+        self._rate_limited = False
         self._url_parts_ = None
         self._qs = None
+        self._json = None
+        self._form_ = None
+        self._received = None
+        self._row = None
+        self._match_time = None
+        self._build_time = None
 
         # All of these params should always exist but we use a default
         # to make the test setup easier.
@@ -55,12 +213,8 @@ class _RequestObjectProxy(object):
     @property
     def _url_parts(self):
         if self._url_parts_ is None:
-            url = self._request.url
-
-            if not self._case_sensitive:
-                url = url.lower()
-
-            self._url_parts_ = urllib.parse.urlparse(url)
+            self._url_parts_ = _parse_url(self._request.url,
+                                          self._case_sensitive)
 
         return self._url_parts_
 
@@ -109,8 +263,7 @@ class _RequestObjectProxy(object):
     @property
     def qs(self):
         if self._qs is None:
-            self._qs = urllib.parse.parse_qs(self.query,
-                                             keep_blank_values=True)
+            self._qs = _copy_qs(self._url_parts.qs)
 
         return self._qs
 
@@ -138,6 +291,35 @@ class _RequestObjectProxy(object):
     def proxies(self):
         return self._proxies
 
+    @property
+    def received(self):
+        """When the adapter received the request.
+
+        :returns int: Nanoseconds from :py:func:`time.monotonic_ns`, or None
+            if the request wasn't sent through an adapter.
+        """
+        return self._received
+
+    @property
+    def match_time(self):
+        """The nanoseconds spent finding the matcher for the request.
+
+        This includes evaluating matchers that didn't match. Custom matchers
+        only report the total time of the call, which is counted here.
+
+        :returns int: The time, or None if the request wasn't sent through an
+            adapter.
+        """
+        return self._match_time
+
+    @property
+    def build_time(self):
+        """The nanoseconds spent building the response to the request.
+
+        :returns int: The time, or None if no response was built.
+        """
+        return self._build_time
+
     @classmethod
     def _create(cls, *args, **kwargs):
         return cls(requests.Request(*args, **kwargs).prepare())
@@ -154,6 +336,45 @@ class _RequestObjectProxy(object):
     def json(self, **kwargs):
         return json.loads(self.text, **kwargs)
 
+    @property
+    def _form(self):
+        # The parsed (form, files) shared by the matchers and accessors, so
+        # it must be copied rather than modified.
+        if self._form_ is None:
+            request = self._request
+            self._form_ = _parse_form(request.headers.get('Content-Type'),
+                                      request.body)
+
+        return self._form_
+
+    @property
+    def form(self):
+        """The fields of a form encoded or multipart request body.
+
+        :returns dict: A list of the values of each field.
+        """
+        return _copy_qs(self._form[0])
+
+    @property
+    def files(self):
+        """The files uploaded in a multipart request body.
+
+        :returns dict: A list of the :py:class:`UploadedFile` of each field.
+        """
+        return _copy_qs(self._form[1])
+
+    def _parsed_json(self):
+        # The body decoded once for all the matchers that look at it. Unlike
+        # json() the value is shared so it must not be changed. The result
+        # is a tuple of the value, or empty if the body isn't JSON.
+        if self._json is None:
+            try:
+                self._json = (json.loads(self.text),)
+            except (TypeError, ValueError):
+                self._json = ()
+
+        return self._json
+
     def __getstate__(self):
         # Can't pickle a weakref, but it's a weakref so ok to drop it.
         d = self.__dict__.copy()
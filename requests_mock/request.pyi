@@ -1,6 +1,16 @@
 # Stubs for requests_mock.request
 
-from typing import Any, Dict, List
+from functools import _CacheInfo
+from typing import Any, Dict, List, NamedTuple, Optional
+
+class UploadedFile(NamedTuple):
+    filename: str
+    content_type: Optional[str]
+    content: bytes
+
+def url_cache_info() -> _CacheInfo: ...
+
+def url_cache_clear() -> None: ...
 
 class _RequestObjectProxy:
     def __init__(self, request: Any, **kwargs: Any) -> None: ...
@@ -35,6 +45,16 @@ class _RequestObjectProxy:
     def text(self) -> str: ...
     def json(self, **kwargs: Any) -> Any: ...
     @property
+    def form(self) -> Dict[str, List[str]]: ...
+    @property
+    def files(self) -> Dict[str, List[UploadedFile]]: ...
+    @property
+    def received(self) -> Optional[int]: ...
+    @property
+    def match_time(self) -> Optional[int]: ...
+    @property
+    def build_time(self) -> Optional[int]: ...
+    @property
     def matcher(self) -> Any: ...
     
 
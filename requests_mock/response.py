@@ -33,7 +33,10 @@ _HTTP_ARGS = frozenset([
 ])
 
 _DEFAULT_STATUS = 200
-_http_adapter = HTTPAdapter()
+
+# Creating an HTTPAdapter sets up a connection pool so only do it when the
+# first response is built rather than at import time.
+_http_adapter = None
 
 
 class CookieJar(RequestsCookieJar):
@@ -117,6 +120,17 @@ class _IOReader(io.BytesIO):
     compatibility we want to do the same thing a HTTPResponse does.
     """
 
+    def __init__(self, *args, **kwargs):
+        super(_IOReader, self).__init__(*args, **kwargs)
+        self._close_callbacks = []
+
+    def close(self):
+        callbacks, self._close_callbacks = self._close_callbacks, []
+        io.BytesIO.close(self)
+
+        for callback in callbacks:
+            callback()
+
     def read(self, *args, **kwargs):
         if self.closed:
             return b''
@@ -137,6 +151,21 @@ class _IOReader(io.BytesIO):
         return result
 
 
+def _call_on_close(response, callback):
+    """Call callback once the body of response has been read or closed.
+
+    Only bodies created by create_response can be watched, for anything else
+    callback is called straight away.
+    """
+    # urllib3 keeps the body it was given as _fp
+    body = getattr(response.raw, '_fp', None)
+
+    if isinstance(body, _IOReader) and not body.closed:
+        body._close_callbacks.append(callback)
+    else:
+        callback()
+
+
 def create_response(request, **kwargs):
     """
     :param int status_code: The status code to return upon a successful
@@ -196,6 +225,10 @@ def create_response(request, **kwargs):
                            preload_content=False,
                            original_response=None)
 
+    global _http_adapter
+    if _http_adapter is None:
+        _http_adapter = HTTPAdapter()
+
     response = _http_adapter.build_response(request, raw)
     response.connection = connection
 
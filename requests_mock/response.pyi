@@ -1,7 +1,7 @@
 # Stubs for requests_mock.response
 
 import io
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from requests import Request, Response
 from requests.cookies import RequestsCookieJar
@@ -15,8 +15,11 @@ class _FakeConnection:
 
 class _IOReader(io.BytesIO):
 
+    def close(self) -> None: ...
     def read(self, *args: Any, **kwargs: Any) -> Any: ...
 
+def _call_on_close(response: Response, callback: Callable[[], None]) -> None: ...
+
 def create_response(request: Any, **kwargs: Any) -> Response: ...
 
 class _Context:
@@ -0,0 +1,202 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Record mock traffic as a Chrome trace."""
+
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+
+from requests_mock.metrics import _matcher_name
+from requests_mock.observer import Observer
+from requests_mock.response import _call_on_close
+
+CATEGORY = 'requests_mock'
+
+
+class ChromeTraceExporter(Observer):
+    """An Observer that records the requests an adapter handles as a trace.
+
+    The trace is in the Chrome Trace Event format, which can be opened in
+    Perfetto (https://ui.perfetto.dev) or chrome://tracing. Each thread that
+    sends requests gets its own track. A request is shown as a span with
+    the time spent matching it and building its response nested inside. A
+    request whose matcher raised, like a response registered with ``exc``,
+    has the name of the exception in the args of its spans.
+    Reading the body of a response can finish long after the request, even
+    on another thread, so it is shown as a separate async span.
+
+    Register it with :py:meth:`requests_mock.Adapter.add_observer`.
+
+    :param str process_name: The name shown for the process in the trace.
+    """
+
+    def __init__(self, process_name='requests_mock'):
+        self.process_name = process_name
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._events = []
+        self._threads = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        # the events of a request all happen on the thread that sent it
+        self._local = threading.local()
+
+    def _ts(self, timestamp):
+        # trace timestamps are microseconds
+        return (timestamp - self._origin) / 1000.0
+
+    def _span(self, name, tid, start, end, args=None):
+        event = {'name': name,
+                 'cat': CATEGORY,
+                 'ph': 'X',
+                 'ts': self._ts(start),
+                 'dur': (end - start) / 1000.0,
+                 'pid': self._pid,
+                 'tid': tid}
+
+        if args:
+            event['args'] = args
+
+        return event
+
+    def _add(self, *events):
+        with self._lock:
+            self._events.extend(events)
+
+    def request_received(self, request, timestamp):
+        thread = threading.current_thread()
+        self._local.received = timestamp
+        self._local.matched = None
+
+        if thread.ident not in self._threads:
+            with self._lock:
+                self._threads[thread.ident] = thread.name
+
+    def request_missed(self, request, timestamp):
+        tid = threading.get_ident()
+        received = getattr(self._local, 'received', timestamp)
+        args = {'method': request.method, 'url': request.url}
+
+        self._add(self._span('request', tid, received, timestamp, args),
+                  self._span('match', tid, received, timestamp))
+
+    def request_matched(self, request, matcher, timestamp):
+        self._local.matched = timestamp
+
+    def request_failed(self, request, matcher, exception, timestamp):
+        tid = threading.get_ident()
+        received = getattr(self._local, 'received', timestamp)
+        matched = getattr(self._local, 'matched', None)
+        error = type(exception).__name__
+        args = {'method': request.method, 'url': request.url, 'error': error}
+        match_args = {'matcher': _matcher_name(matcher)}
+
+        if matched is None:
+            # the matcher raised while it was matching
+            match_args['error'] = error
+            self._add(self._span('request', tid, received, timestamp, args),
+                      self._span('match', tid, received, timestamp,
+                                 match_args))
+        else:
+            self._add(self._span('request', tid, received, timestamp, args),
+                      self._span('match', tid, received, matched,
+                                 match_args),
+                      self._span('build', tid, matched, timestamp,
+                                 {'error': error}))
+
+    def response_built(self, request, matcher, response, start, end):
+        tid = threading.get_ident()
+        received = getattr(self._local, 'received', start)
+        args = {'method': request.method,
+                'url': request.url,
+                'status': response.status_code}
+
+        self._add(self._span('request', tid, received, end, args),
+                  self._span('match',
+                             tid,
+                             received,
+                             start,
+                             {'matcher': _matcher_name(matcher)}),
+                  self._span('build', tid, start, end))
+
+        span_id = '0x%x' % next(self._ids)
+
+        def closed():
+            # Both ends are recorded together so an unread body doesn't
+            # leave a span that never ends.
+            event = {'name': 'stream',
+                     'cat': CATEGORY,
+                     'id': span_id,
+                     'pid': self._pid,
+                     'tid': tid}
+            self._add(dict(event, ph='b', ts=self._ts(end), args=args),
+                      dict(event, ph='e', ts=self._ts(time.perf_counter_ns())))
+
+        _call_on_close(response, closed)
+
+    def reset(self):
+        """Forget all recorded events."""
+        with self._lock:
+            self._events = []
+            self._threads = {}
+
+    def render(self):
+        """Return the trace.
+
+        :returns dict: The trace in the JSON object format, with the
+            events under ``traceEvents``.
+        """
+        with self._lock:
+            events = list(self._events)
+            threads = sorted(self._threads.items())
+
+        metadata = [{'name': 'process_name',
+                     'ph': 'M',
+                     'pid': self._pid,
+                     'args': {'name': self.process_name}}]
+
+        for tid, name in threads:
+            metadata.append({'name': 'thread_name',
+                             'ph': 'M',
+                             'pid': self._pid,
+                             'tid': tid,
+                             'args': {'name': name}})
+
+        return {'traceEvents': metadata + events,
+                'displayTimeUnit': 'ns'}
+
+    def write(self, path):
+        """Write the trace to a JSON file.
+
+        The file is replaced atomically so a viewer never loads a partial
+        trace.
+
+        :param str path: The file to write.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.requests_mock')
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.render(), f)
+
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+__all__ = ['CATEGORY', 'ChromeTraceExporter']
@@ -0,0 +1,14 @@
+# Stubs for requests_mock.trace
+
+from typing import Any, Dict
+
+from requests_mock.observer import Observer
+
+CATEGORY: str
+
+class ChromeTraceExporter(Observer):
+    process_name: str = ...
+    def __init__(self, process_name: str = ...) -> None: ...
+    def reset(self) -> None: ...
+    def render(self) -> Dict[str, Any]: ...
+    def write(self, path: str) -> None: ...
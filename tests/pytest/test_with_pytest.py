@@ -117,3 +117,48 @@ class TestClass(object):
     def test_one(self, requests_mock):
         self.configure(requests_mock)
         assert 'data' == requests.get('https://httpbin.org/get').text
+
+
+@pytest.fixture(scope='module')
+def shared_routes(module_requests_mock):
+    module_requests_mock.get('https://httpbin.org/shared', text='shared')
+    module_requests_mock.get('https://httpbin.org/sequence',
+                             [{'text': 'first'}, {'text': 'second'}])
+    module_requests_mock.get('https://httpbin.org/once', text='once', times=1)
+    return module_requests_mock
+
+
+class TestSharedMock(object):
+
+    def test_override(self, shared_routes):
+        assert 'shared' == requests.get('https://httpbin.org/shared').text
+        assert 'first' == requests.get('https://httpbin.org/sequence').text
+        assert 'once' == requests.get('https://httpbin.org/once').text
+
+        shared_routes.get('https://httpbin.org/shared', text='override')
+        shared_routes.get('https://httpbin.org/other', text='other')
+
+        assert 'override' == requests.get('https://httpbin.org/shared').text
+        assert 'other' == requests.get('https://httpbin.org/other').text
+        assert 5 == shared_routes.call_count
+
+    def test_override_does_not_leak(self, shared_routes):
+        assert 0 == shared_routes.call_count
+
+        assert 'shared' == requests.get('https://httpbin.org/shared').text
+        assert 'first' == requests.get('https://httpbin.org/sequence').text
+        assert 'once' == requests.get('https://httpbin.org/once').text
+
+        with pytest.raises(requests_mock.NoMockAddress):
+            requests.get('https://httpbin.org/other')
+
+    def test_function_mock_nests(self, shared_routes, requests_mock):
+        requests_mock.get('https://httpbin.org/inner', text='inner')
+        assert 'inner' == requests.get('https://httpbin.org/inner').text
+        assert 0 == shared_routes.call_count
+
+
+def test_session_mock(session_requests_mock):
+    session_requests_mock.get('https://httpbin.org/session', text='session')
+    assert 'session' == requests.get('https://httpbin.org/session').text
+    assert 1 == session_requests_mock.call_count
@@ -12,8 +12,11 @@
 
 import http.client
 import io
+import itertools
 import json
 import re
+import threading
+import time
 import urllib.parse
 
 import purl
@@ -207,6 +210,363 @@ class SessionAdapterTests(base.TestCase):
         for k, v in inp[-1].items():
             self.assertEqual(v, getattr(last, k))
 
+    def get_texts(self, count):
+        return [self.session.get(self.url).text for _ in range(count)]
+
+    def test_multiple_responses_cycle(self):
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  [{'text': 'a'}, {'text': 'b'}],
+                                  response_mode='cycle')
+
+        self.assertEqual(['a', 'b', 'a', 'b', 'a'], self.get_texts(5))
+
+    def test_response_generator(self):
+        consumed = []
+
+        def responses():
+            for text in ('a', 'b', 'c'):
+                consumed.append(text)
+                yield {'text': text}
+
+        self.adapter.register_uri('GET', self.url, responses())
+        self.assertEqual([], consumed)
+
+        self.assertEqual(['a'], self.get_texts(1))
+        self.assertEqual(['a'], consumed)
+
+        self.assertEqual(['b', 'c', 'c', 'c'], self.get_texts(4))
+
+    def test_response_generator_cycle(self):
+        responses = ({'text': t} for t in ('a', 'b', 'c'))
+
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  responses,
+                                  response_mode='cycle')
+
+        self.assertEqual(['a', 'b', 'c', 'a', 'b', 'c', 'a'],
+                         self.get_texts(7))
+
+    def test_infinite_response_generator(self):
+        responses = ({'text': str(i)} for i in itertools.count())
+        self.adapter.register_uri('GET', self.url, responses)
+
+        self.assertEqual([str(i) for i in range(100)], self.get_texts(100))
+
+    def test_empty_response_generator(self):
+        for mode in ('repeat_last', 'cycle'):
+            self.adapter.register_uri('GET',
+                                      self.url,
+                                      iter([]),
+                                      response_mode=mode)
+
+            for _ in range(2):
+                e = self.assertRaises(ValueError, self.session.get, self.url)
+                self.assertEqual(
+                    'response_list must have at least one response',
+                    str(e))
+
+    def test_invalid_response_mode(self):
+        self.assertRaises(ValueError,
+                          self.adapter.register_uri,
+                          'GET',
+                          self.url,
+                          text='a',
+                          response_mode='unknown')
+
+    def test_times(self):
+        self.adapter.register_uri('GET', self.url, text='fallback')
+        m = self.adapter.register_uri('GET',
+                                      self.url,
+                                      [{'text': 'a'}, {'text': 'b'}],
+                                      times=2)
+
+        self.assertEqual(['a', 'b', 'fallback'], self.get_texts(3))
+        self.assertEqual(2, m.call_count)
+        self.assertNotIn(m, self.adapter._matchers)
+        self.assertEqual(1, len(self.adapter._matchers))
+
+    def test_times_no_fallback(self):
+        self.adapter.register_uri('GET', self.url, text='a', times=1)
+
+        self.assertEqual(['a'], self.get_texts(1))
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          self.url)
+
+    def test_invalid_times(self):
+        self.assertRaises(ValueError,
+                          self.adapter.register_uri,
+                          'GET',
+                          self.url,
+                          text='a',
+                          times=0)
+
+    def get_statuses(self, count):
+        return [self.session.get(self.url).status_code for _ in range(count)]
+
+    def test_faults(self):
+        faults = {'rate': 0.25, 'status_code': 503}
+        m = self.adapter.register_uri('GET',
+                                      self.url,
+                                      text='ok',
+                                      faults=faults,
+                                      fault_seed=42)
+
+        statuses = self.get_statuses(400)
+
+        self.assertEqual({200, 503}, set(statuses))
+        self.assertAlmostEqual(100, statuses.count(503), delta=40)
+        self.assertEqual(statuses.count(503), m.stats.faults)
+
+        # the same seed faults the same requests
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  text='ok',
+                                  faults=faults,
+                                  fault_seed=42)
+        self.assertEqual(statuses, self.get_statuses(400))
+
+    def test_fault_exception(self):
+        self.adapter.register_uri(
+            'GET',
+            self.url,
+            text='ok',
+            faults={'rate': 1, 'exc': requests.exceptions.ConnectionError})
+
+        self.assertRaises(requests.exceptions.ConnectionError,
+                          self.session.get,
+                          self.url)
+
+    def test_multiple_faults(self):
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  text='ok',
+                                  faults=[{'rate': 0.2, 'status_code': 500},
+                                          {'rate': 0.2, 'status_code': 503}])
+
+        statuses = self.get_statuses(400)
+
+        self.assertAlmostEqual(80, statuses.count(500), delta=40)
+        self.assertAlmostEqual(80, statuses.count(503), delta=40)
+        self.assertAlmostEqual(240, statuses.count(200), delta=40)
+
+    def test_faults_replace_response_list(self):
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  [{'text': str(i)} for i in range(3)],
+                                  faults={'rate': 1, 'text': 'fault'})
+
+        self.assertEqual(['fault'] * 3, self.get_texts(3))
+
+    def test_restore_replays_faults(self):
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  faults={'rate': 0.5, 'status_code': 503})
+
+        snapshot = self.adapter.snapshot()
+        statuses = self.get_statuses(20)
+        self.adapter.restore(snapshot)
+
+        self.assertEqual(statuses, self.get_statuses(20))
+
+    def test_invalid_faults(self):
+        for faults in ({},
+                       [],
+                       {'status_code': 500},
+                       {'rate': -0.1, 'status_code': 500},
+                       [{'rate': 0.6, 'status_code': 500},
+                        {'rate': 0.6, 'status_code': 503}]):
+            self.assertRaises(ValueError,
+                              self.adapter.register_uri,
+                              'GET',
+                              self.url,
+                              faults=faults)
+
+    def test_priority(self):
+        self.adapter.register_uri('GET', self.url, text='high', priority=1)
+        self.adapter.register_uri('GET', self.url, text='default')
+        self.adapter.register_uri(requests_mock.ANY,
+                                  requests_mock.ANY,
+                                  text='catch all',
+                                  priority=-1)
+
+        self.assertEqual('high', self.session.get(self.url).text)
+        self.assertEqual('catch all',
+                         self.session.get(self.url + '/other').text)
+
+    def test_priority_custom_matcher(self):
+        def matcher(request):
+            return requests_mock.create_response(request, text='custom')
+
+        self.adapter.add_matcher(matcher, priority=-1)
+        self.adapter.register_uri('GET', self.url, text='resp')
+
+        self.assertEqual('resp', self.session.get(self.url).text)
+        self.assertEqual('custom', self.session.post(self.url).text)
+
+    def test_indexed_matchers_not_evaluated(self):
+        other = self.adapter.register_uri('GET', self.url + '/other')
+        post = self.adapter.register_uri('POST', self.url)
+        m = self.adapter.register_uri('get', self.url, text='resp')
+
+        self.assertEqual('resp', self.session.get(self.url).text)
+        self.assertEqual(1, m.stats.evaluations)
+        self.assertEqual(0, other.stats.evaluations)
+        self.assertEqual(0, post.stats.evaluations)
+
+    def test_wildcards_keep_registration_order(self):
+        self.adapter.register_uri('GET', self.url, text='first')
+        regex = self.adapter.register_uri('GET',
+                                          re.compile('example'),
+                                          text='regex')
+        self.assertEqual('regex', self.session.get(self.url).text)
+
+        self.adapter.register_uri('GET', self.url, text='last')
+        self.assertEqual('last', self.session.get(self.url).text)
+        self.assertEqual(1, regex.call_count)
+
+    def send_concurrently(self, url, threads=8, count=200):
+        barrier = threading.Barrier(threads)
+        texts = []
+
+        def send():
+            barrier.wait()
+            for _ in range(count):
+                texts.append(self.session.get(url).text)
+
+        workers = [threading.Thread(target=send) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        return texts
+
+    def test_concurrent_history(self):
+        m = self.adapter.register_uri('GET',
+                                      self.url,
+                                      [{'text': str(i)} for i in range(1600)])
+
+        texts = self.send_concurrently(self.url)
+
+        self.assertEqual(1600, self.adapter.call_count)
+        self.assertEqual(1600, m.call_count)
+        # every request got its own response
+        self.assertEqual(set(str(i) for i in range(1600)), set(texts))
+
+    def test_concurrent_times(self):
+        self.adapter.register_uri('GET', self.url, text='fallback')
+        m = self.adapter.register_uri('GET', self.url, text='once', times=1)
+
+        texts = self.send_concurrently(self.url, count=10)
+
+        self.assertEqual(1, texts.count('once'))
+        self.assertEqual(1, m.call_count)
+        self.assertNotIn(m, self.adapter._matchers)
+
+    def test_concurrency_parallel(self):
+        barrier = threading.Barrier(4)
+
+        def callback(request, context):
+            # every request is being built at once
+            barrier.wait(timeout=5)
+            return 'data'
+
+        m = self.adapter.register_uri('GET', self.url, text=callback)
+        self.send_concurrently(self.url, threads=4, count=1)
+
+        self.assertEqual(4, m.concurrency.peak)
+        self.assertEqual(0, m.concurrency.current)
+        self.assertEqual(4, self.adapter.concurrency.peak)
+        self.assertEqual(4,
+                         self.adapter.host_concurrency['example.com'].peak)
+
+    def test_concurrency_streamed(self):
+        m = self.adapter.register_uri('GET', self.url, text='data')
+        other = self.adapter.register_uri('GET', 'mock://other.com/')
+
+        first = self.session.get(self.url, stream=True)
+        second = self.session.get(self.url, stream=True)
+        self.session.get('mock://other.com/')
+
+        # the streamed bodies haven't been read
+        self.assertEqual(2, m.concurrency.current)
+        self.assertEqual(2, self.adapter.concurrency.current)
+        self.assertEqual(3, self.adapter.concurrency.peak)
+        self.assertEqual(1, other.concurrency.peak)
+        self.assertEqual(0, other.concurrency.current)
+
+        self.assertEqual('data', first.text)
+        self.assertEqual(1, m.concurrency.current)
+        second.close()
+        self.assertEqual(0, m.concurrency.current)
+
+        # the series is only kept when asked for
+        self.assertIsNone(m.concurrency.series)
+        hosts = self.adapter.host_concurrency
+        self.assertEqual(2, hosts['example.com'].peak)
+        self.assertEqual(1, hosts['other.com'].peak)
+
+    def test_concurrency_clock(self):
+        clock = iter(range(100)).__next__
+        adapter = requests_mock.Adapter(clock=clock, track_concurrency=True)
+        self.session.mount('clock', adapter)
+        m = adapter.register_uri('GET', 'clock://test/a')
+
+        self.session.get('clock://test/a')
+
+        self.assertEqual([(0, 1), (3, 0)], adapter.concurrency.series)
+        self.assertEqual([(1, 1), (2, 0)], m.concurrency.series)
+
+    def test_concurrency_series(self):
+        adapter = requests_mock.Adapter(track_concurrency=True)
+        self.session.mount('series', adapter)
+        m = adapter.register_uri('GET', 'series://test/a', text='data')
+
+        first = self.session.get('series://test/a', stream=True)
+        self.session.get('series://test/a')
+        first.close()
+
+        self.assertEqual([1, 2, 1, 0],
+                         [c for _, c in m.concurrency.series])
+        self.assertEqual([1, 2, 1, 0],
+                         [c for _, c in
+                          adapter.host_concurrency['test'].series])
+        self.assertEqual([], adapter.overlay().concurrency.series)
+
+        adapter.reset()
+        self.assertEqual([], m.concurrency.series)
+
+    def test_concurrency_failures(self):
+        m = self.adapter.register_uri('GET', self.url, exc=MyExc)
+
+        self.assertRaises(MyExc, self.session.get, self.url)
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          'mock://other.com/')
+
+        self.assertEqual(0, m.concurrency.current)
+        self.assertEqual(1, m.concurrency.peak)
+        self.assertEqual(0, self.adapter.concurrency.current)
+        self.assertEqual(1, self.adapter.concurrency.peak)
+
+    def test_concurrency_reset(self):
+        m = self.adapter.register_uri('GET', self.url, text='data')
+        self.session.get(self.url)
+        resp = self.session.get(self.url, stream=True)
+
+        self.adapter.reset()
+
+        # the open response is still in flight
+        self.assertEqual(1, m.concurrency.peak)
+        self.assertIsNone(m.concurrency.series)
+        self.assertEqual(1, self.adapter.concurrency.current)
+
+        resp.close()
+        self.assertEqual(0, self.adapter.concurrency.current)
+
     def test_callback_optional_status(self):
         headers = {'a': 'b'}
 
@@ -373,6 +733,54 @@ class SessionAdapterTests(base.TestCase):
 
         self.assertEqual(self.url, self.adapter.last_request.url)
 
+    def test_request_timing(self):
+        def callback(request, context):
+            self.assertIsNone(request.build_time)
+            self.assertGreater(request.match_time, 0)
+            return 'resp'
+
+        self.adapter.register_uri('GET', self.url, text=callback)
+        self.adapter.register_uri('POST', self.url, text='resp')
+
+        before = time.monotonic_ns()
+        self.session.get(self.url)
+        self.session.get(self.url)
+        after = time.monotonic_ns()
+
+        first, second = self.adapter.request_history
+        self.assertTrue(before <= first.received <= second.received <= after)
+        self.assertGreater(first.match_time, 0)
+        self.assertGreater(first.build_time, 0)
+        self.assertEqual([first.received, second.received],
+                         self.adapter.history_table().timestamp.tolist())
+
+    def test_request_timing_observed(self):
+        self.adapter.add_observer(requests_mock.observer.Observer())
+        self.adapter.register_uri('GET', self.url, text='resp')
+
+        self.session.get(self.url)
+
+        self.assertGreater(self.adapter.last_request.match_time, 0)
+        self.assertGreater(self.adapter.last_request.build_time, 0)
+
+    def test_request_timing_no_match(self):
+        self.adapter.add_matcher(lambda request: None)
+
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          self.url)
+
+        self.assertGreater(self.adapter.last_request.match_time, 0)
+        self.assertIsNone(self.adapter.last_request.build_time)
+
+    def test_request_timing_not_sent(self):
+        request = requests_mock.request._RequestObjectProxy._create(
+            'GET', self.url)
+
+        self.assertIsNone(request.received)
+        self.assertIsNone(request.match_time)
+        self.assertIsNone(request.build_time)
+
     def test_not_called_and_called_count(self):
         m = self.adapter.register_uri('GET', self.url, text='resp')
         self.assertEqual(0, m.call_count)
@@ -422,6 +830,356 @@ class SessionAdapterTests(base.TestCase):
         for matcher in self.adapter._matchers:
             self.assertEqual(matcher.call_count, 0)
 
+    def test_matcher_stats(self):
+        # share a path so that they are all evaluated
+        m1 = self.adapter.register_uri('GET', self.url + '?id=1', text='resp')
+        m2 = self.adapter.register_uri('GET', self.url + '?id=2', text='resp')
+        m3 = self.adapter.register_uri('GET', self.url + '?id=3', text='resp')
+
+        self.session.get(self.url + '?id=1')
+        self.session.get(self.url + '?id=2')
+        self.session.get(self.url + '?id=2')
+
+        self.assertEqual(3, m3.stats.evaluations)
+        self.assertEqual(0, m3.stats.hits)
+        self.assertEqual(0, m3.stats.build_time)
+
+        self.assertEqual(3, m2.stats.evaluations)
+        self.assertEqual(2, m2.stats.hits)
+
+        self.assertEqual(1, m1.stats.evaluations)
+        self.assertEqual(1, m1.stats.hits)
+        self.assertGreater(m1.stats.match_time, 0)
+        self.assertGreater(m1.stats.build_time, 0)
+
+        stats = self.adapter.stats()
+        self.assertEqual({m1, m2, m3}, set(m for m, _ in stats))
+        self.assertIs(m2.stats, dict(stats)[m2])
+
+        times = [s.total_time for _, s in stats]
+        self.assertEqual(sorted(times, reverse=True), times)
+
+        self.adapter.reset()
+        self.assertEqual(0, m2.stats.evaluations)
+        self.assertEqual(0, m2.stats.hits)
+
+    def test_matcher_stats_exclude_custom_matchers(self):
+        self.adapter.add_matcher(lambda request: None)
+        m = self.adapter.register_uri('GET', self.url, text='resp')
+
+        self.assertEqual([m], [s[0] for s in self.adapter.stats()])
+
+    def test_snapshot_restore(self):
+        base = self.adapter.register_uri('GET',
+                                         self.url,
+                                         [{'text': 'first'},
+                                          {'text': 'second'}])
+        self.assertEqual('first', self.session.get(self.url).text)
+
+        snapshot = self.adapter.snapshot()
+
+        self.assertEqual('second', self.session.get(self.url).text)
+        self.assertEqual('second', self.session.get(self.url).text)
+        self.adapter.register_uri('GET', self.url + '/new', text='new')
+        self.assertEqual('new', self.session.get(self.url + '/new').text)
+        self.adapter.register_uri('GET', self.url, text='override')
+        self.assertEqual('override', self.session.get(self.url).text)
+
+        self.adapter.restore(snapshot)
+
+        self.assertEqual(1, self.adapter.call_count)
+        self.assertEqual(1, base.call_count)
+        self.assertEqual([base], list(self.adapter._matchers))
+
+        self.assertEqual('second', self.session.get(self.url).text)
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          self.url + '/new')
+
+    def test_restore_retired_matcher(self):
+        first = self.adapter.register_uri('GET', self.url, text='first')
+        once = self.adapter.register_uri('GET', self.url, text='once',
+                                         times=1)
+        last = self.adapter.register_uri('GET', self.url + '/b', text='b')
+
+        snapshot = self.adapter.snapshot()
+
+        self.assertEqual(['once', 'first'], self.get_texts(2))
+        self.assertEqual([first, last], list(self.adapter._matchers))
+
+        self.adapter.restore(snapshot)
+
+        self.assertEqual([first, once, last], list(self.adapter._matchers))
+        self.assertEqual(['once', 'first'], self.get_texts(2))
+
+    def test_restore_removed_out_of_order(self):
+        matchers = [self.adapter.register_uri('GET', '%s/%d' % (self.url, i))
+                    for i in range(10)]
+        snapshot = self.adapter.snapshot()
+
+        for i in (5, 0, 9, 3):
+            self.adapter.remove_matcher(matchers[i])
+
+        self.adapter.restore(snapshot)
+
+        self.assertEqual(matchers, list(self.adapter._matchers))
+
+    def test_restore_after_unmatched_requests(self):
+        self.adapter.register_uri('GET', self.url, text='resp')
+        snapshot = self.adapter.snapshot()
+
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          self.url + '/missing')
+        self.adapter.restore(snapshot)
+
+        self.assertEqual(0, self.adapter.call_count)
+
+    def test_remove_matcher(self):
+        first = self.adapter.register_uri('GET', self.url, text='first')
+        second = self.adapter.register_uri('GET', self.url, text='second')
+
+        self.assertEqual(['second'], self.get_texts(1))
+        self.adapter.remove_matcher(second)
+        self.assertEqual(['first'], self.get_texts(1))
+        self.assertEqual([first], list(self.adapter._matchers))
+
+        self.assertRaises(ValueError, self.adapter.remove_matcher, second)
+
+    def test_remove_custom_matcher(self):
+        def matcher(request):
+            return None
+
+        self.assertIs(matcher, self.adapter.add_matcher(matcher))
+        self.adapter.remove_matcher(matcher)
+        self.assertEqual(0, len(self.adapter._matchers))
+
+    def test_replace_matcher(self):
+        first = self.adapter.register_uri('GET', self.url, text='first')
+        healthy = self.adapter.register_uri('GET', self.url, text='healthy')
+        degraded = self.adapter.register_uri('GET', self.url, text='degraded')
+        last = self.adapter.register_uri('GET', self.url + '/b', text='b')
+        self.adapter.remove_matcher(degraded)
+
+        self.assertIs(degraded,
+                      self.adapter.replace_matcher(healthy, degraded))
+        self.assertEqual(['degraded'], self.get_texts(1))
+        self.assertEqual([first, degraded, last],
+                         list(self.adapter._matchers))
+
+        self.adapter.replace_matcher(degraded, healthy)
+        self.assertEqual(['healthy'], self.get_texts(1))
+        self.assertEqual([first, healthy, last], list(self.adapter._matchers))
+
+        self.assertRaises(ValueError,
+                          self.adapter.replace_matcher,
+                          degraded,
+                          healthy)
+
+    def test_replace_matcher_other_bucket(self):
+        a = self.adapter.register_uri('GET', self.url, text='a')
+        b = self.adapter.register_uri('GET', self.url, text='b')
+        regex = self.adapter.register_uri('GET', re.compile('.*'), text='re')
+        self.adapter.remove_matcher(regex)
+
+        # the regex takes the literal's place between the two
+        self.adapter.replace_matcher(b, regex)
+        self.assertEqual(['re'], self.get_texts(1))
+        self.assertEqual([a, regex], list(self.adapter._matchers))
+
+        self.adapter.replace_matcher(regex, b)
+        self.assertEqual(['b'], self.get_texts(1))
+        self.assertEqual([a, b], list(self.adapter._matchers))
+
+    def test_restore_replaced_matcher(self):
+        first = self.adapter.register_uri('GET', self.url, text='first')
+        second = self.adapter.register_uri('GET', self.url, text='second')
+        other = self.adapter.register_uri('GET', self.url, text='other')
+        self.adapter.remove_matcher(other)
+
+        snapshot = self.adapter.snapshot()
+
+        self.adapter.replace_matcher(second, other)
+        self.adapter.remove_matcher(first)
+        self.adapter.replace_matcher(other, first)
+        self.assertEqual([first], list(self.adapter._matchers))
+
+        self.adapter.restore(snapshot)
+
+        self.assertEqual([first, second], list(self.adapter._matchers))
+        self.assertEqual(['second'], self.get_texts(1))
+
+    def test_restore_keeps_priority(self):
+        m = self.adapter.register_uri('GET', self.url, text='high', priority=1)
+        self.adapter.register_uri('GET', self.url, text='default')
+
+        snapshot = self.adapter.snapshot()
+        self.adapter.remove_matcher(m)
+        self.assertEqual('default', self.session.get(self.url).text)
+
+        self.adapter.restore(snapshot)
+        self.assertEqual('high', self.session.get(self.url).text)
+
+    def test_replace_keeps_priority(self):
+        m = self.adapter.register_uri('GET', self.url, text='high', priority=1)
+        other = self.adapter.register_uri('GET', self.url, text='other')
+        self.adapter.register_uri('GET', self.url, text='default')
+        self.adapter.remove_matcher(other)
+
+        self.adapter.replace_matcher(m, other)
+        self.assertEqual('other', self.session.get(self.url).text)
+
+    def test_overlay_priority(self):
+        self.adapter.register_uri('GET', self.url, text='base', priority=1)
+        self.adapter.register_uri('GET', self.url + '/b', text='base b')
+
+        overlay = self.adapter.overlay()
+        self.session.mount(self.PREFIX, overlay)
+        overlay.register_uri('GET', self.url, text='overlay')
+        overlay.register_uri('GET', self.url + '/b', text='overlay b')
+
+        self.assertEqual('base', self.session.get(self.url).text)
+        self.assertEqual('overlay b', self.session.get(self.url + '/b').text)
+
+    def test_overlay_remove_parent_matcher(self):
+        m = self.adapter.register_uri('GET', self.url, text='base')
+        overlay = self.adapter.overlay()
+
+        self.assertRaises(ValueError, overlay.remove_matcher, m)
+        self.assertRaises(ValueError, overlay.replace_matcher, m, m)
+
+    def test_overlay(self):
+        self.adapter.register_uri('GET', self.url, text='base')
+        self.adapter.register_uri('GET', self.url + '/other', text='other')
+
+        overlay = self.adapter.overlay()
+        self.session.mount(self.PREFIX, overlay)
+        m = overlay.register_uri('GET', self.url, text='overlay')
+
+        self.assertEqual('overlay', self.session.get(self.url).text)
+        self.assertEqual('other', self.session.get(self.url + '/other').text)
+
+        self.assertEqual(1, m.call_count)
+        self.assertEqual(2, overlay.call_count)
+        self.assertEqual(0, self.adapter.call_count)
+        self.assertEqual([m], list(overlay._matchers))
+        self.assertEqual(2, len(self.adapter._matchers))
+
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          self.url + '/missing')
+
+    def test_overlay_is_independent(self):
+        self.adapter.register_uri('GET', self.url, text='base')
+
+        overlay1 = self.adapter.overlay()
+        overlay1.register_uri('GET', self.url, text='one')
+        overlay2 = self.adapter.overlay()
+
+        self.session.mount(self.PREFIX, overlay2)
+        self.assertEqual('base', self.session.get(self.url).text)
+
+        self.session.mount(self.PREFIX, overlay1)
+        self.assertEqual('one', self.session.get(self.url).text)
+
+        # overlays can themselves be overlayed
+        overlay3 = overlay1.overlay()
+        self.session.mount(self.PREFIX, overlay3)
+        self.assertEqual('one', self.session.get(self.url).text)
+
+        self.session.mount(self.PREFIX, self.adapter)
+        self.assertEqual('base', self.session.get(self.url).text)
+
+    def test_overlay_parent_times(self):
+        self.adapter.register_uri('GET', self.url, text='base')
+        m = self.adapter.register_uri('GET', self.url, text='once', times=1)
+
+        overlay = self.adapter.overlay()
+        self.session.mount(self.PREFIX, overlay)
+
+        self.assertEqual(['once', 'base'], self.get_texts(2))
+
+        # the parent's matcher is left as it was
+        self.assertIn(m, self.adapter._matchers)
+        self.assertTrue(m._evaluate(overlay.last_request))
+        self.assertEqual(0, m.call_count)
+        self.assertEqual(1, overlay.last_request.matcher.call_count)
+
+    def test_overlay_siblings(self):
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  [{'text': 'first'}, {'text': 'second'}])
+        self.adapter.register_uri('GET', self.url + '/once', text='once',
+                                  times=1)
+
+        def scenario():
+            overlay = self.adapter.overlay()
+            self.session.mount(self.PREFIX, overlay)
+
+            self.assertEqual('first', self.session.get(self.url).text)
+            self.assertEqual('once',
+                             self.session.get(self.url + '/once').text)
+            self.assertRaises(requests_mock.NoMockAddress,
+                              self.session.get,
+                              self.url + '/once')
+            return overlay
+
+        a = scenario()
+        b = scenario()
+
+        self.assertEqual(3, a.call_count)
+        self.assertEqual(3, b.call_count)
+
+        # nor is the parent
+        self.session.mount(self.PREFIX, self.adapter)
+        self.assertEqual('first', self.session.get(self.url).text)
+        self.assertEqual('once', self.session.get(self.url + '/once').text)
+
+    def test_overlay_nested_starts_from_parent(self):
+        self.adapter.register_uri('GET', self.url, [{'text': str(i)}
+                                                    for i in range(4)])
+
+        overlay = self.adapter.overlay()
+        self.session.mount(self.PREFIX, overlay)
+        self.assertEqual('0', self.session.get(self.url).text)
+
+        nested = overlay.overlay()
+        self.session.mount(self.PREFIX, nested)
+        self.assertEqual('1', self.session.get(self.url).text)
+
+        self.session.mount(self.PREFIX, overlay)
+        self.assertEqual('1', self.session.get(self.url).text)
+
+    def test_overlay_iterator_responses(self):
+        self.adapter.register_uri('GET', self.url,
+                                  iter([{'text': 'a'}, {'text': 'b'}]))
+
+        for _ in range(2):
+            self.session.mount(self.PREFIX, self.adapter.overlay())
+            self.assertEqual(['a', 'b', 'b'], self.get_texts(3))
+
+    def test_overlay_reset(self):
+        self.adapter.register_uri('GET', self.url, text='once', times=1)
+        overlay = self.adapter.overlay()
+        self.session.mount(self.PREFIX, overlay)
+
+        self.assertEqual('once', self.session.get(self.url).text)
+        overlay.reset()
+        self.assertEqual('once', self.session.get(self.url).text)
+
+    def test_overlay_case_sensitive(self):
+        adapter = requests_mock.Adapter(case_sensitive=True)
+        self.assertTrue(adapter.overlay()._case_sensitive)
+
+    def test_matcher_str(self):
+        m = self.adapter.register_uri('GET', self.url, text='resp')
+        self.assertEqual('GET %s' % self.url, str(m))
+
+        m = self.adapter.register_uri(requests_mock.ANY,
+                                      requests_mock.ANY,
+                                      text='resp')
+        self.assertEqual('ANY ANY', str(m))
+
     def test_adapter_picks_correct_adapter(self):
         good = '%s://test3.url/' % self.PREFIX
         self.adapter.register_uri('GET',
@@ -0,0 +1,86 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import tempfile
+
+from requests_mock import bench
+from . import base
+
+
+class BenchTests(base.TestCase):
+
+    def run_bench(self, *args):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        argv = ['--quick', '--repeat', '1', '--format', 'json',
+                '--output', path]
+        argv.extend(args)
+        ret = bench.main(argv)
+
+        with open(path) as f:
+            return ret, path, json.load(f)
+
+    def test_quick_run_covers_hot_paths(self):
+        names = [b.name for b in bench.get_benchmarks(quick=True)]
+
+        for prefix in ('register_uri', 'send[string', 'send[regex',
+                       'send[query', 'send[header', 'create_response',
+                       'history', 'mocker', 'import[requests_mock]',
+                       'import[requests_mock.contrib._pytest_plugin]'):
+            self.assertTrue(any(n.startswith(prefix) for n in names), prefix)
+
+    def test_json_output(self):
+        ret, _, results = self.run_bench('--filter', 'send\\[string')
+
+        self.assertEqual(0, ret)
+        self.assertEqual(['send[string-10]', 'send[string-100]'],
+                         [b['name'] for b in results['benchmarks']])
+
+        for b in results['benchmarks']:
+            self.assertGreater(b['min'], 0)
+            self.assertLessEqual(b['min'], b['median'])
+            self.assertLessEqual(b['median'], b['max'])
+
+    def test_import(self):
+        ret, _, results = self.run_bench('--filter',
+                                         'import\\[requests_mock\\]')
+
+        self.assertEqual(0, ret)
+        self.assertEqual(['import[requests_mock]'],
+                         [b['name'] for b in results['benchmarks']])
+        self.assertGreater(results['benchmarks'][0]['min'], 0)
+
+    def test_compare(self):
+        baseline = {'benchmarks': [{'name': 'a', 'min': 1.0},
+                                   {'name': 'b', 'min': 1.0}]}
+        results = {'benchmarks': [{'name': 'a', 'min': 1.1},
+                                  {'name': 'b', 'min': 2.0},
+                                  {'name': 'c', 'min': 5.0}]}
+
+        regressions = bench.compare(baseline, results, threshold=0.25)
+        self.assertEqual([('b', 1.0, 2.0, 2.0)], regressions)
+
+    def test_compare_exit_code(self):
+        _, path, results = self.run_bench('--filter', 'mocker')
+
+        for b in results['benchmarks']:
+            b['min'] /= 100.0
+
+        with open(path, 'w') as f:
+            json.dump(results, f)
+
+        ret, _, _ = self.run_bench('--filter', 'mocker', '--compare', path)
+        self.assertEqual(1, ret)
@@ -72,3 +72,12 @@ class CustomMatchersTests(base.TestCase):
         self.assertRaises(requests_mock.NoMockAddress,
                           requests.get,
                           'http://other/thing')
+
+    @requests_mock.Mocker()
+    def test_response_without_status(self, mocker):
+        mocker.add_matcher(lambda request: requests.Response())
+
+        resp = requests.get('http://any/thing')
+
+        self.assertIsNone(resp.status_code)
+        self.assertEqual([0], mocker.history_table().status.tolist())
@@ -0,0 +1,149 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import re
+
+import requests
+
+import requests_mock
+from requests_mock import Expectation
+from . import base
+
+
+class VerifyTests(base.TestCase):
+
+    def setUp(self):
+        super(VerifyTests, self).setUp()
+
+        self.mocker = requests_mock.Mocker()
+        self.mocker.start()
+        self.addCleanup(self.mocker.stop)
+        self.mocker.register_uri(requests_mock.ANY, requests_mock.ANY)
+
+    def get(self, *paths):
+        for path in paths:
+            requests.get('http://test.com/%s' % path)
+
+    def assertViolations(self, violations, expectations, **kwargs):
+        e = self.assertRaises(requests_mock.VerificationError,
+                              self.mocker.verify,
+                              expectations,
+                              **kwargs)
+        self.assertEqual(violations, e.violations)
+        return e
+
+    def test_met(self):
+        self.get('a', 'b', 'b', 'c?x=1')
+
+        self.mocker.verify([
+            Expectation('GET', 'http://test.com/a', times=1),
+            Expectation('GET', 'http://test.com/b', times=2),
+            Expectation('GET', 'http://test.com/c?x=1'),
+            Expectation('GET', re.compile('test.com/[ab]'), times=3),
+            Expectation('POST', 'http://test.com/a', times=0),
+        ])
+
+    def test_all_violations_reported(self):
+        self.get('a', 'b', 'b')
+
+        e = self.assertViolations(
+            ['GET http://test.com/a: expected 2 calls, got 1',
+             'GET http://test.com/b: expected 1 call, got 2',
+             'GET http://test.com/c: expected at least 1 call, got 0',
+             'GET test.com/[ab]: expected 0 calls, got 3'],
+            [Expectation('GET', 'http://test.com/a', times=2),
+             Expectation('GET', 'http://test.com/b', times=1),
+             Expectation('GET', 'http://test.com/c'),
+             Expectation('GET', re.compile('test.com/[ab]'), times=0)])
+
+        self.assertIsInstance(e, AssertionError)
+        self.assertTrue(str(e).startswith('4 expectations not met:\n  GET'))
+
+    def test_ordered(self):
+        self.get('a', 'b', 'b', 'c')
+        expectations = [Expectation('GET', 'http://test.com/%s' % p)
+                        for p in 'abc']
+
+        self.mocker.verify(expectations, ordered=True)
+        self.get('a')
+
+        self.assertViolations(
+            ['request 4 GET http://test.com/a came after requests for '
+             'GET http://test.com/c'],
+            expectations,
+            ordered=True)
+
+    def test_ordered_overlapping(self):
+        expectations = [Expectation('GET', 'http://test.com/a'),
+                        Expectation(requests_mock.ANY, requests_mock.ANY),
+                        Expectation('GET', 'http://test.com/b')]
+        self.get('a', 'b')
+
+        # each request only counts towards one expectation
+        self.assertViolations(
+            ['GET http://test.com/b: expected at least 1 call, got 0'],
+            expectations,
+            ordered=True)
+
+        self.get('b')
+        self.mocker.verify(expectations, ordered=True)
+
+    def test_ordered_repeated(self):
+        self.get('a', 'b', 'a')
+        expectations = [Expectation('GET', 'http://test.com/a', times=1),
+                        Expectation('GET', 'http://test.com/b', times=1),
+                        Expectation('GET', 'http://test.com/a', times=1)]
+
+        self.mocker.verify(expectations, ordered=True)
+        self.get('a')
+
+        self.assertViolations(
+            ['GET http://test.com/a: expected 1 call, got 2'],
+            expectations,
+            ordered=True)
+
+    def test_ordered_out_of_order(self):
+        self.get('b', 'a')
+
+        self.assertViolations(
+            ['request 1 GET http://test.com/a came after requests for '
+             'GET http://test.com/b'],
+            [Expectation('GET', 'http://test.com/a', times=1),
+             Expectation('GET', 'http://test.com/b', times=1)],
+            ordered=True)
+
+    def test_conditions(self):
+        requests.post('http://test.com/a', json={'a': 1, 'b': 2})
+        requests.post('http://test.com/a',
+                      data={'f': 'v'},
+                      headers={'X-Test': 'yes'})
+
+        self.mocker.verify([
+            Expectation('POST', 'http://test.com/a', json_body={'a': 1},
+                        times=1),
+            Expectation('POST', 'http://test.com/a', form={'f': 'v'},
+                        request_headers={'X-Test': 'yes'}, times=1),
+        ])
+
+    def test_matchers_untouched(self):
+        self.get('a')
+        matcher = self.mocker.request_history[0].matcher
+
+        self.mocker.verify([Expectation('GET', 'http://test.com/a')])
+
+        self.assertEqual(1, matcher.call_count)
+        self.assertEqual(1, self.mocker.call_count)
+
+    def test_invalid(self):
+        self.assertRaises(TypeError, Expectation, 'GET', 'http://a', text='')
+        self.assertRaises(ValueError, Expectation, 'GET', 'http://a',
+                          times=-1)
@@ -0,0 +1,159 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sys
+from unittest import mock
+
+import requests
+
+import requests_mock
+from . import base
+
+
+class HistoryTableTests(base.TestCase):
+
+    def setUp(self):
+        super(HistoryTableTests, self).setUp()
+
+        self.adapter = requests_mock.Adapter()
+        self.session = requests.Session()
+        self.session.mount('mock', self.adapter)
+
+        self.adapter.register_uri('GET', 'mock://test/a', text='abc')
+        self.adapter.register_uri('POST', 'mock://test/b', status_code=201)
+
+    def test_columns(self):
+        self.session.get('mock://test/a')
+        self.session.post('mock://test/b', data=b'12345')
+        self.session.get('mock://test/a')
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          'mock://test/c')
+
+        table = self.adapter.history_table()
+
+        self.assertEqual(4, len(table))
+        self.assertEqual(('GET', 'POST'), table.methods)
+        self.assertEqual(('mock://test/a', 'mock://test/b', 'mock://test/c'),
+                         table.urls)
+        self.assertEqual([0, 1, 0, 0], table.method.tolist())
+        self.assertEqual([0, 1, 0, 2], table.url.tolist())
+        self.assertEqual([200, 201, 200, 0], table.status.tolist())
+        self.assertEqual([0, 5, 0, 0], table.request_size.tolist())
+        self.assertEqual([3, 0, 3, -1], table.response_size.tolist())
+
+        self.assertEqual(sorted(table.timestamp), table.timestamp.tolist())
+        self.assertTrue(all(d >= 0 for d in table.duration))
+
+    def test_request_sizes(self):
+        self.session.post('mock://test/b', data='é')
+        self.session.post('mock://test/b', data=iter([b'a']))
+
+        self.assertEqual([2, -1],
+                         self.adapter.history_table().request_size.tolist())
+
+    def test_table_is_a_copy(self):
+        self.session.get('mock://test/a')
+        table = self.adapter.history_table()
+        self.session.get('mock://test/a')
+
+        self.assertEqual(1, len(table))
+        self.assertEqual(2, len(self.adapter.history_table()))
+
+    def test_in_flight(self):
+        def callback(request, context):
+            table = self.adapter.history_table()
+            self.assertEqual([0], table.status.tolist())
+            self.assertEqual([-1], table.duration.tolist())
+            return ''
+
+        self.adapter.register_uri('GET', 'mock://test/cb', text=callback)
+        self.session.get('mock://test/cb')
+
+        self.assertEqual([200],
+                         self.adapter.history_table().status.tolist())
+
+    def test_reset(self):
+        self.session.get('mock://test/a')
+        self.adapter.reset()
+        self.session.post('mock://test/b')
+
+        table = self.adapter.history_table()
+        self.assertEqual([201], table.status.tolist())
+        self.assertEqual(('POST',), table.methods)
+
+    def test_restore(self):
+        self.session.get('mock://test/a')
+        snapshot = self.adapter.snapshot()
+        self.session.post('mock://test/b')
+        self.adapter.restore(snapshot)
+        self.session.get('mock://test/a')
+
+        self.assertEqual([200, 200],
+                         self.adapter.history_table().status.tolist())
+        self.assertEqual(len(self.adapter.request_history),
+                         len(self.adapter.history_table()))
+
+    def test_history_cleared(self):
+        self.session.get('mock://test/a')
+        self.session.post('mock://test/b')
+        self.adapter.request_history.clear()
+        self.session.post('mock://test/b')
+
+        table = self.adapter.history_table()
+        self.assertEqual(1, len(table))
+        self.assertEqual([201], table.status.tolist())
+        self.assertEqual(['mock://test/b'],
+                         [table.urls[u] for u in table.url])
+
+        del self.adapter.request_history[:]
+        self.assertEqual(0, len(self.adapter.history_table()))
+
+    def test_restore_after_clear(self):
+        self.session.get('mock://test/a')
+        self.adapter.request_history.clear()
+        self.session.post('mock://test/b')
+        snapshot = self.adapter.snapshot()
+        self.session.get('mock://test/a')
+        self.adapter.restore(snapshot)
+        self.session.get('mock://test/a')
+
+        self.assertEqual([201, 200],
+                         self.adapter.history_table().status.tolist())
+
+    def test_mocker(self):
+        with requests_mock.Mocker() as m:
+            m.get('http://test.com/a', status_code=204)
+            requests.get('http://test.com/a')
+
+            self.assertEqual([204], m.history_table().status.tolist())
+
+    def test_to_numpy(self):
+        try:
+            import numpy  # noqa
+        except ImportError:
+            self.skipTest('NumPy is not installed')
+
+        self.session.get('mock://test/a')
+        self.session.post('mock://test/b')
+        columns = self.adapter.history_table().to_numpy()
+
+        self.assertEqual([200, 201], columns['status'].tolist())
+        self.assertEqual(['GET', 'POST'], columns['method_name'].tolist())
+        self.assertEqual(['mock://test/a', 'mock://test/b'],
+                         columns['url_name'].tolist())
+
+    def test_to_numpy_not_installed(self):
+        table = self.adapter.history_table()
+
+        with mock.patch.dict(sys.modules, {'numpy': None}):
+            self.assertRaises(ImportError, table.to_numpy)
@@ -0,0 +1,52 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import subprocess
+import sys
+
+import requests_mock
+from . import base
+
+
+class ImportTests(base.TestCase):
+
+    def run_python(self, code):
+        return subprocess.check_output([sys.executable, '-c', code],
+                                       universal_newlines=True).strip()
+
+    def test_import_does_not_load_requests(self):
+        code = ('import sys; '
+                'import requests_mock; '
+                'import requests_mock.contrib._pytest_plugin; '
+                'print(sorted(m for m in ("requests", "urllib3", "purl") '
+                '             if m in sys.modules))')
+
+        self.assertEqual('[]', self.run_python(code))
+
+    def test_attribute_loads_module(self):
+        code = ('import sys; '
+                'import requests_mock; '
+                'requests_mock.Mocker; '
+                'print("requests" in sys.modules)')
+
+        self.assertEqual('True', self.run_python(code))
+
+    def test_public_names(self):
+        for name in requests_mock.__all__:
+            self.assertIsNotNone(getattr(requests_mock, name))
+            self.assertIn(name, dir(requests_mock))
+
+        self.assertIs(requests_mock.mocker.Mocker, requests_mock.Mocker)
+        self.assertIs(requests_mock.adapter.ANY, requests_mock.ANY)
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, getattr, requests_mock, 'unknown')
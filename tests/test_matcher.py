@@ -10,7 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
 import re
+from unittest import mock
 
 from requests_mock import adapter
 from . import base
@@ -29,10 +31,17 @@ class TestMatcher(base.TestCase):
               complete_qs=False,
               headers=None,
               request_data=None,
+              request_files=None,
               request_headers={},
               additional_matcher=None,
               real_http=False,
-              case_sensitive=False):
+              case_sensitive=False,
+              json_body=None,
+              complete_json=False,
+              form=None):
+        if json_body is not None:
+            json_body = adapter._JSONBodyMatcher(json_body, complete_json)
+
         matcher = adapter._Matcher(matcher_method,
                                    target,
                                    [],
@@ -40,11 +49,14 @@ class TestMatcher(base.TestCase):
                                    additional_matcher=additional_matcher,
                                    request_headers=request_headers,
                                    real_http=real_http,
-                                   case_sensitive=case_sensitive)
+                                   case_sensitive=case_sensitive,
+                                   json_body=json_body,
+                                   form=form)
         request = adapter._RequestObjectProxy._create(request_method,
                                                       url,
                                                       headers,
-                                                      data=request_data)
+                                                      data=request_data,
+                                                      files=request_files)
         return matcher._match(request)
 
     def assertMatch(self,
@@ -303,6 +315,74 @@ class TestMatcher(base.TestCase):
                            request_data='goodbye world',
                            additional_matcher=test_match_body)
 
+    def test_json_body(self):
+        body = json.dumps({'a': 1, 'b': {'c': [1, {'d': 2, 'e': 3}]}})
+
+        for expected in ({'a': 1},
+                         {'b': {'c': [1, {'d': 2}]}},
+                         {'a': 1, 'b': {'c': [1, {}]}}):
+            self.assertMatch(request_data=body, json_body=expected)
+
+        for expected in ({'a': 2},
+                         {'z': 1},
+                         {'b': {'c': [1]}},
+                         {'b': {'c': [{'d': 2}, 1]}},
+                         {'b': []},
+                         [1]):
+            self.assertNoMatch(request_data=body, json_body=expected)
+
+    def test_complete_json(self):
+        body = json.dumps({'a': 1, 'b': [1, 2]})
+
+        self.assertMatch(request_data=body,
+                         json_body={'b': [1, 2], 'a': 1},
+                         complete_json=True)
+        self.assertNoMatch(request_data=body,
+                           json_body={'a': 1},
+                           complete_json=True)
+
+    def test_json_body_not_json(self):
+        self.assertNoMatch(request_data='hello', json_body={'a': 1})
+        self.assertNoMatch(json_body={'a': 1})
+        self.assertNoMatch(request_data=b'\xff', json_body={'a': 1})
+
+    def test_json_body_parsed_once(self):
+        request = adapter._RequestObjectProxy._create('POST',
+                                                      'http://test.com',
+                                                      data='{"a": [1, 2]}')
+        matchers = [adapter._JSONBodyMatcher({'a': [1, 2]}),
+                    adapter._JSONBodyMatcher({'a': [1, 2]}, complete=True),
+                    adapter._JSONBodyMatcher({'b': 1})]
+
+        with mock.patch('json.loads', wraps=json.loads) as loads:
+            self.assertEqual([True, True, False],
+                             [m(request) for m in matchers])
+
+        self.assertEqual(1, loads.call_count)
+
+        # json() still returns a value of its own each time
+        self.assertIsNot(request.json(), request.json())
+
+    def test_form(self):
+        data = {'a': '1', 'b': ['2', '3']}
+
+        for form in ({'a': '1'}, {'a': 1, 'b': '3'}, {'b': ['3', '2']}, {}):
+            self.assertMatch(request_data=data, form=form)
+
+        for form in ({'a': '2'}, {'c': '1'}, {'b': ['2', '2']}):
+            self.assertNoMatch(request_data=data, form=form)
+
+        self.assertNoMatch(form={'a': '1'})
+
+    def test_form_multipart(self):
+        self.assertMatch(request_data={'a': '1'},
+                         request_files={'f': b'data'},
+                         form={'a': '1'})
+        # uploaded files aren't form fields
+        self.assertNoMatch(request_data={'a': '1'},
+                           request_files={'f': b'data'},
+                           form={'f': 'data'})
+
     def test_reset_reverts_count(self):
         url = 'mock://test/site/'
         matcher = adapter._Matcher('GET',
@@ -0,0 +1,191 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+
+import requests
+
+import requests_mock
+from requests_mock import metrics
+from . import base
+
+
+class OpenMetricsExporterTests(base.TestCase):
+
+    def setUp(self):
+        super(OpenMetricsExporterTests, self).setUp()
+
+        self.adapter = requests_mock.Adapter()
+        self.session = requests.Session()
+        self.session.mount('mock', self.adapter)
+        self.exporter = metrics.OpenMetricsExporter(buckets=(0.5, 1))
+        self.adapter.add_observer(self.exporter)
+
+    def samples(self):
+        samples = {}
+
+        for line in self.exporter.render().splitlines():
+            if not line.startswith('#'):
+                name, value = line.rsplit(' ', 1)
+                samples[name] = value
+
+        return samples
+
+    def test_render(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.adapter.register_uri('POST', 'mock://test/a', status_code=201)
+
+        self.session.get('mock://test/a')
+        self.session.get('mock://test/a')
+        self.session.post('mock://test/a')
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          'mock://other:8080/b')
+
+        samples = self.samples()
+        get = ('matcher="GET mock://test/a",method="GET",host="test",'
+               'status="200"')
+        post = ('matcher="POST mock://test/a",method="POST",host="test",'
+                'status="201"')
+
+        self.assertEqual('2', samples['requests_mock_requests_total{%s}' %
+                                      get])
+        self.assertEqual('1', samples['requests_mock_requests_total{%s}' %
+                                      post])
+
+        name = 'requests_mock_request_duration_seconds'
+        self.assertEqual('2', samples['%s_bucket{%s,le="0.5"}' % (name, get)])
+        self.assertEqual('2', samples['%s_bucket{%s,le="1"}' % (name, get)])
+        self.assertEqual('2',
+                         samples['%s_bucket{%s,le="+Inf"}' % (name, get)])
+        self.assertEqual('2', samples['%s_count{%s}' % (name, get)])
+        self.assertGreater(float(samples['%s_sum{%s}' % (name, get)]), 0)
+
+        self.assertEqual('1',
+                         samples['requests_mock_unmatched_requests_total'
+                                 '{method="GET",host="other:8080"}'])
+
+    def test_format(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.session.get('mock://test/a')
+
+        lines = self.exporter.render().splitlines()
+
+        self.assertEqual('# EOF', lines[-1])
+        self.assertIn('# TYPE requests_mock_requests counter', lines)
+        self.assertIn('# TYPE requests_mock_request_duration_seconds '
+                      'histogram', lines)
+        self.assertIn('# UNIT requests_mock_request_duration_seconds seconds',
+                      lines)
+
+    def test_custom_matcher(self):
+        def matcher(request):
+            return requests_mock.create_response(request, status_code=202)
+
+        self.adapter.add_matcher(matcher)
+        self.session.get('mock://test/a')
+
+        samples = self.samples()
+        key = ('requests_mock_requests_total{matcher="%s",method="GET",'
+               'host="test",status="202"}' % matcher.__qualname__)
+        self.assertEqual('1', samples[key])
+
+    def test_matchers_with_the_same_name(self):
+        self.adapter.register_uri('GET', 'mock://test/a', times=1)
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.session.get('mock://test/a')
+        self.session.get('mock://test/a')
+
+        lines = [line for line in self.exporter.render().splitlines()
+                 if not line.startswith('#')]
+        self.assertEqual(len(lines), len(set(lines)))
+
+        samples = self.samples()
+        labels = ('matcher="GET mock://test/a",method="GET",host="test",'
+                  'status="200"')
+        name = 'requests_mock_request_duration_seconds'
+        self.assertEqual('2',
+                         samples['requests_mock_requests_total{%s}' % labels])
+        self.assertEqual('2',
+                         samples['%s_bucket{%s,le="+Inf"}' % (name, labels)])
+
+    def test_exceptions(self):
+        self.adapter.register_uri('GET',
+                                  'mock://test/exc',
+                                  exc=requests.exceptions.ConnectTimeout)
+        self.adapter.register_uri('GET',
+                                  'mock://test/fault',
+                                  faults={'rate': 1,
+                                          'exc': requests.ConnectionError})
+
+        for url in ('mock://test/exc', 'mock://test/fault'):
+            self.assertRaises(requests.ConnectionError, self.session.get, url)
+
+        samples = self.samples()
+
+        for path in ('exc', 'fault'):
+            self.assertEqual(
+                '1',
+                samples['requests_mock_requests_total{matcher="GET '
+                        'mock://test/%s",method="GET",host="test",'
+                        'status="exception"}' % path])
+
+    def test_escape(self):
+        self.assertEqual('a\\"b\\\\c\\nd', metrics._escape('a"b\\c\nd'))
+
+    def test_buckets(self):
+        exporter = metrics.OpenMetricsExporter(buckets=(0.001, 0.002))
+        request = requests_mock.adapter._RequestObjectProxy._create(
+            'GET', 'mock://test/a')
+        response = requests_mock.create_response(request)
+
+        for duration in (500000, 1000000, 1500000, 5000000):
+            exporter.request_received(request, 0)
+            exporter.response_built(request, 'm', response, 0, duration)
+
+        lines = [line for line in exporter.render().splitlines()
+                 if '_bucket' in line]
+        self.assertEqual(['2', '3', '4'], [line[-1] for line in lines])
+
+    def test_reset(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.session.get('mock://test/a')
+
+        self.exporter.reset()
+
+        self.assertEqual({}, self.samples())
+
+    def test_prefix(self):
+        exporter = metrics.OpenMetricsExporter(prefix='sim')
+        self.adapter.add_observer(exporter)
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.session.get('mock://test/a')
+
+        self.assertIn('# TYPE sim_requests counter',
+                      exporter.render().splitlines())
+
+    def test_write(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.session.get('mock://test/a')
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'mock.prom')
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(os.unlink, path)
+
+        self.exporter.write(path)
+
+        with open(path) as f:
+            self.assertEqual(self.exporter.render(), f.read())
+
+        self.assertEqual(['mock.prom'], os.listdir(directory))
@@ -12,6 +12,8 @@
 
 import json
 import pickle
+import threading
+import time
 
 try:
     from unittest import mock
@@ -195,6 +197,60 @@ class MockerTests(base.TestCase):
         self.assertEqual(test_text, resp.text)
         self.assertEqual(test_bytes, resp.content)
 
+    def test_sessions_in_parallel(self):
+        barrier = threading.Barrier(4)
+        texts = []
+
+        def callback(request, context):
+            # only passes if every session is sending at once
+            barrier.wait(timeout=5)
+            return 'resp'
+
+        def send():
+            session = requests.Session()
+            with requests_mock.Mocker(session=session) as m:
+                m.get('http://www.example.com', text=callback)
+                texts.append(session.get('http://www.example.com').text)
+
+        workers = [threading.Thread(target=send) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(['resp'] * 4, texts)
+
+    @mock.patch('requests.adapters.HTTPAdapter.send')
+    def test_session_shared_between_threads(self, real_send):
+        def real(request, **kwargs):
+            return response.create_response(request, text='real')
+
+        real_send.side_effect = real
+        session = requests.Session()
+        results = []
+
+        def send(url):
+            for _ in range(50):
+                results.append((url, session.get(url).text))
+
+        with requests_mock.Mocker(session=session, real_http=True) as m:
+            m.get('http://www.example.com/mocked', text='mocked')
+
+            workers = [threading.Thread(target=send, args=(url,))
+                       for url in ['http://www.example.com/mocked',
+                                   'http://www.example.com/real'] * 4]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        self.assertEqual(400, len(results))
+        for url, text in results:
+            self.assertEqual(url.rsplit('/', 1)[1], text)
+
+        self.assertIsInstance(session.get_adapter('http://www.example.com'),
+                              requests.adapters.HTTPAdapter)
+
     @requests_mock.mock()
     def test_with_test_decorator(self, m):
         self._do_test(m)
@@ -328,6 +384,33 @@ class MockerTests(base.TestCase):
         self.assertEqual(copy_of_mocker._kw, mocker._kw)
         self.assertEqual(copy_of_mocker.real_http, mocker.real_http)
 
+    def test_overlay(self):
+        base = requests_mock.Mocker(real_http=True, case_sensitive=True)
+        base.get('http://www.example.com/a', text='base-a')
+        base.get('http://www.example.com/b', text='base-b')
+
+        with base.overlay() as m:
+            m.get('http://www.example.com/a', text='overlay-a')
+
+            self.assertEqual('overlay-a',
+                             requests.get('http://www.example.com/a').text)
+            self.assertEqual('base-b',
+                             requests.get('http://www.example.com/b').text)
+
+            self.assertTrue(m.real_http)
+            self.assertTrue(m.case_sensitive)
+            self.assertEqual(2, m.call_count)
+
+        with base:
+            self.assertEqual('base-a',
+                             requests.get('http://www.example.com/a').text)
+
+    def test_overlay_session(self):
+        session = requests.Session()
+        base = requests_mock.Mocker(session=session)
+
+        self.assertIs(session, base.overlay()._mock_target)
+
     @requests_mock.mock()
     def test_reset_mock_reverts_call_count(self, request_mock):
         url = 'http://test.url/path'
@@ -576,6 +659,23 @@ class MockerHttpMethodsTests(base.TestCase):
                           url,
                           data='goodbye world')
 
+    @requests_mock.mock()
+    def test_mocker_stats(self, m):
+        expensive = m.get('http://www.example.com/a',
+                          additional_matcher=lambda r: time.sleep(0.01))
+        cheap = m.get('http://www.example.com/a?cheap')
+
+        requests.get('http://www.example.com/a?cheap')
+        self.assertRaises(exceptions.NoMockAddress,
+                          requests.get,
+                          'http://www.example.com/a')
+
+        self.assertEqual([expensive, cheap], [s[0] for s in m.stats()])
+        self.assertEqual(1, expensive.stats.evaluations)
+        self.assertEqual(0, expensive.stats.hits)
+        self.assertEqual(2, cheap.stats.evaluations)
+        self.assertEqual(1, cheap.stats.hits)
+
     @requests_mock.mock()
     def test_mocker_pickle(self, m):
         url = 'http://www.example.com'
@@ -0,0 +1,159 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import requests
+
+import requests_mock
+from requests_mock import observer
+from . import base
+
+
+class RecordingObserver(observer.Observer):
+
+    def __init__(self):
+        self.events = []
+
+    def request_received(self, request, timestamp):
+        self.events.append(('received', timestamp))
+
+    def matcher_evaluated(self, request, matcher, matched, start, end):
+        self.events.append(('evaluated', matcher, matched, start, end))
+
+    def request_matched(self, request, matcher, timestamp):
+        self.events.append(('matched', matcher, timestamp))
+
+    def request_missed(self, request, timestamp):
+        self.events.append(('missed', timestamp))
+
+    def response_built(self, request, matcher, response, start, end):
+        self.events.append(
+            ('built', matcher, response.status_code, start, end))
+
+    def request_failed(self, request, matcher, exception, timestamp):
+        self.events.append(('failed', matcher, type(exception), timestamp))
+
+
+class ObserverTests(base.TestCase):
+
+    def setUp(self):
+        super(ObserverTests, self).setUp()
+
+        self.adapter = requests_mock.Adapter()
+        self.session = requests.Session()
+        self.session.mount('mock', self.adapter)
+        self.observer = RecordingObserver()
+        self.adapter.add_observer(self.observer)
+
+    def test_events(self):
+        m1 = self.adapter.register_uri('GET', 'mock://test/a', status_code=201)
+        m2 = self.adapter.register_uri('GET', 'mock://test/a?b')
+
+        self.session.get('mock://test/a')
+
+        events = self.observer.events
+        self.assertEqual(['received', 'evaluated', 'evaluated', 'matched',
+                          'built'],
+                         [e[0] for e in events])
+
+        self.assertEqual((m2, False), events[1][1:3])
+        self.assertEqual((m1, True), events[2][1:3])
+        self.assertIs(m1, events[3][1])
+        self.assertEqual((m1, 201), events[4][1:3])
+
+        timestamps = [events[0][1]]
+        timestamps.extend(events[1][3:])
+        timestamps.extend(events[2][3:])
+        timestamps.extend(events[4][3:])
+        self.assertEqual(sorted(timestamps), timestamps)
+
+    def test_missed(self):
+        self.adapter.register_uri('GET', 'mock://test/a?b')
+
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          'mock://test/a')
+
+        self.assertEqual(['received', 'evaluated', 'missed'],
+                         [e[0] for e in self.observer.events])
+
+    def test_custom_matcher(self):
+        def matcher(request):
+            return requests_mock.create_response(request, status_code=202)
+
+        self.adapter.add_matcher(matcher)
+        self.session.get('mock://test/a')
+
+        self.assertEqual(['received', 'evaluated', 'matched', 'built'],
+                         [e[0] for e in self.observer.events])
+        self.assertEqual((matcher, True), self.observer.events[1][1:3])
+        self.assertEqual((matcher, 202), self.observer.events[3][1:3])
+
+    def test_exception_still_sets_matcher(self):
+        m = self.adapter.register_uri('GET', 'mock://test/a', exc=ValueError)
+
+        self.assertRaises(ValueError, self.session.get, 'mock://test/a')
+        self.assertIs(m, self.adapter.last_request.matcher)
+        self.assertEqual(['received', 'evaluated', 'matched', 'failed'],
+                         [e[0] for e in self.observer.events])
+        self.assertEqual((m, ValueError), self.observer.events[3][1:3])
+
+    def test_remove_observer(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.adapter.remove_observer(self.observer)
+
+        self.session.get('mock://test/a')
+        self.assertEqual([], self.observer.events)
+
+    def test_mocker_observer(self):
+        stats = observer.MatcherStatsObserver()
+
+        with requests_mock.Mocker() as m:
+            m.add_observer(stats)
+            m.get('http://test.com/a')
+
+            requests.get('http://test.com/a')
+
+        self.assertEqual(1, stats.requests)
+
+
+class MatcherStatsObserverTests(base.TestCase):
+
+    def test_stats(self):
+        adapter = requests_mock.Adapter()
+        session = requests.Session()
+        session.mount('mock', adapter)
+        stats = observer.MatcherStatsObserver()
+        adapter.add_observer(stats)
+
+        m1 = adapter.register_uri('GET', 'mock://test/a', complete_qs=True)
+        m2 = adapter.register_uri('GET', 'mock://test/a?b')
+
+        session.get('mock://test/a')
+        session.get('mock://test/a')
+        session.get('mock://test/a?b')
+        self.assertRaises(requests_mock.NoMockAddress,
+                          session.get,
+                          'mock://test/a?c')
+
+        self.assertEqual(4, stats.requests)
+        self.assertEqual(1, stats.misses)
+
+        self.assertEqual(3, stats.matchers[m1].evaluations)
+        self.assertEqual(2, stats.matchers[m1].hits)
+        self.assertEqual(4, stats.matchers[m2].evaluations)
+        self.assertEqual(1, stats.matchers[m2].hits)
+
+        self.assertEqual(stats.match_time,
+                         sum(s.match_time for s in stats.matchers.values()))
+        self.assertEqual(stats.build_time,
+                         sum(s.build_time for s in stats.matchers.values()))
+        self.assertGreater(stats.build_time, 0)
@@ -0,0 +1,213 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+
+import requests
+from urllib3.exceptions import EmptyPoolError
+
+import requests_mock
+from requests_mock import pool
+from . import base
+
+
+class ConnectionPoolTests(base.TestCase):
+
+    def test_reuse(self):
+        connections = pool.ConnectionPool(2)
+
+        for _ in range(3):
+            connections._get()
+            connections._put()
+
+        self.assertEqual(1, connections.created)
+        self.assertEqual(1, connections.idle)
+        self.assertEqual(0, connections.in_use)
+
+    def test_overflow_discarded(self):
+        connections = pool.ConnectionPool(1)
+
+        connections._get()
+        connections._get()
+        self.assertEqual(2, connections.in_use)
+
+        connections._put()
+        connections._put()
+
+        self.assertEqual(2, connections.created)
+        self.assertEqual(1, connections.discarded)
+        self.assertEqual(1, connections.idle)
+
+    def test_timeout(self):
+        connections = pool.ConnectionPool(1, block=True, timeout=0.01)
+        connections._get()
+
+        self.assertRaises(EmptyPoolError, connections._get)
+        self.assertEqual(1, connections.waits)
+        self.assertEqual(1, connections.timeouts)
+        self.assertGreater(connections.wait_time, 0)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, pool.ConnectionPool, 0)
+
+
+class AdapterPoolTests(base.TestCase):
+
+    def setUp(self):
+        super(AdapterPoolTests, self).setUp()
+
+        self.session = requests.Session()
+        self.url = 'mock://test/a'
+
+    def mount(self, **kwargs):
+        adapter = requests_mock.Adapter(**kwargs)
+        self.session.mount('mock', adapter)
+        adapter.register_uri('GET', self.url, text='data')
+        adapter.register_uri('GET', 'mock://other/a', text='data')
+        return adapter
+
+    def test_no_pool(self):
+        adapter = self.mount()
+
+        self.session.get(self.url)
+
+        self.assertEqual({}, adapter.pools)
+
+    def test_streamed_hold_connection(self):
+        adapter = self.mount(pool_maxsize=1)
+
+        first = self.session.get(self.url, stream=True)
+        second = self.session.get(self.url, stream=True)
+        self.session.get('mock://other/a')
+
+        connections = adapter.pools['test']
+        self.assertEqual(2, connections.in_use)
+        self.assertEqual(2, connections.created)
+
+        first.close()
+        second.close()
+
+        self.assertEqual(0, connections.in_use)
+        self.assertEqual(1, connections.discarded)
+        self.assertEqual(1, adapter.pools['other'].created)
+
+    def test_block(self):
+        adapter = self.mount(pool_maxsize=1, pool_block=True)
+        first = self.session.get(self.url, stream=True)
+        texts = []
+
+        def send():
+            texts.append(self.session.get(self.url).text)
+
+        worker = threading.Thread(target=send)
+        worker.start()
+
+        connections = adapter.pools['test']
+        self.assertEqual(['data'], [first.text])
+        worker.join()
+
+        self.assertEqual(['data'], texts)
+        self.assertEqual(1, connections.created)
+        self.assertEqual(0, connections.discarded)
+        self.assertLessEqual(connections.waits, 1)
+
+    def test_block_timeout(self):
+        adapter = self.mount(pool_maxsize=1, pool_block=True, pool_timeout=0)
+        resp = self.session.get(self.url, stream=True)
+
+        self.assertRaises(EmptyPoolError, self.session.get, self.url)
+        self.assertEqual(1, adapter.pools['test'].timeouts)
+
+        # the request that timed out never got a connection
+        resp.close()
+        self.assertEqual(0, adapter.pools['test'].in_use)
+        self.assertEqual('data', self.session.get(self.url).text)
+
+        table = adapter.history_table()
+        self.assertEqual([200, 0, 200], list(table.status))
+        self.assertNotIn(-1, table.duration)
+        self.assertEqual(0, adapter.concurrency.current)
+
+    def test_unmatched_gives_back(self):
+        adapter = self.mount(pool_maxsize=1, pool_block=True, pool_timeout=0)
+
+        for _ in range(2):
+            self.assertRaises(requests_mock.NoMockAddress,
+                              self.session.get,
+                              'mock://test/missing')
+
+        self.assertEqual(0, adapter.pools['test'].in_use)
+
+    def test_overlay(self):
+        adapter = self.mount(pool_maxsize=1, pool_block=True, pool_timeout=0)
+        overlay = adapter.overlay()
+        self.session.mount('mock', overlay)
+
+        resp = self.session.get(self.url, stream=True)
+
+        self.assertRaises(EmptyPoolError, self.session.get, self.url)
+        self.assertEqual({}, adapter.pools)
+        resp.close()
+
+
+class MockerPoolTests(base.TestCase):
+
+    def setUp(self):
+        super(MockerPoolTests, self).setUp()
+
+        self.adapter = requests_mock.Adapter(pool_maxsize=1,
+                                             pool_block=True,
+                                             pool_timeout=5)
+        self.adapter.register_uri('GET', requests_mock.ANY, text='data')
+
+        mocker = requests_mock.Mocker(adapter=self.adapter)
+        mocker.start()
+        self.addCleanup(mocker.stop)
+
+    def test_wait_does_not_block_other_hosts(self):
+        first = requests.get('http://a.com/', stream=True)
+        texts = []
+
+        def send():
+            texts.append(requests.get('http://a.com/').text)
+
+        worker = threading.Thread(target=send)
+        worker.start()
+
+        connections = self.adapter.pools['a.com']
+        deadline = time.monotonic() + 5
+        while not connections.waits and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # the worker is waiting for host a but host b has a free connection
+        start = time.monotonic()
+        self.assertEqual('data', requests.get('http://b.com/').text)
+        self.assertLess(time.monotonic() - start, 1)
+
+        first.close()
+        worker.join()
+        self.assertEqual(['data'], texts)
+
+    def test_timeout_recorded(self):
+        self.adapter.pools['a.com'] = pool.ConnectionPool(1,
+                                                          block=True,
+                                                          timeout=0)
+        resp = requests.get('http://a.com/', stream=True)
+
+        self.assertRaises(EmptyPoolError, requests.get, 'http://a.com/')
+        resp.close()
+
+        table = self.adapter.history_table()
+        self.assertEqual([200, 0], list(table.status))
+        self.assertNotIn(-1, table.duration)
+        self.assertEqual(0, self.adapter.pools['a.com'].in_use)
@@ -0,0 +1,186 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import requests
+
+import requests_mock
+from requests_mock import ratelimit
+from . import base
+
+
+class VirtualClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTests(base.TestCase):
+
+    def test_burst_then_rate(self):
+        bucket = ratelimit.TokenBucket(rate=2, burst=3)
+
+        self.assertEqual([0, 0, 0], [bucket.take(0) for _ in range(3)])
+        self.assertEqual(0.5, bucket.take(0))
+
+        # refills at 2 a second
+        self.assertEqual(0, bucket.take(0.5))
+        self.assertEqual(0.5, bucket.take(0.5))
+
+        # never more than burst
+        self.assertEqual([0, 0, 0], [bucket.take(100) for _ in range(3)])
+        self.assertNotEqual(0, bucket.take(100))
+
+        self.assertEqual(7, bucket.accepted)
+        self.assertEqual(3, bucket.rejected)
+
+    def test_default_burst(self):
+        self.assertEqual(5, ratelimit.TokenBucket(rate=5).burst)
+        self.assertEqual(1, ratelimit.TokenBucket(rate=0.1).burst)
+
+    def test_clock_going_backwards(self):
+        bucket = ratelimit.TokenBucket(rate=1)
+
+        self.assertEqual(0, bucket.take(10))
+        self.assertEqual(1, bucket.take(5))
+        self.assertEqual(0, bucket.take(6))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, ratelimit.TokenBucket, rate=0)
+        self.assertRaises(ValueError, ratelimit.TokenBucket, rate=1, burst=0)
+
+
+class RateLimitTests(base.TestCase):
+
+    def setUp(self):
+        super(RateLimitTests, self).setUp()
+
+        self.clock = VirtualClock()
+        self.adapter = requests_mock.Adapter(clock=self.clock)
+        self.session = requests.Session()
+        self.session.mount('mock', self.adapter)
+        self.url = 'mock://test/a'
+
+    def test_rate_limit(self):
+        m = self.adapter.register_uri('GET',
+                                      self.url,
+                                      [{'text': 'a'}, {'text': 'b'}],
+                                      rate_limit={'rate': 0.5})
+
+        self.assertEqual('a', self.session.get(self.url).text)
+
+        resp = self.session.get(self.url)
+        self.assertEqual(429, resp.status_code)
+        self.assertEqual('2', resp.headers['Retry-After'])
+
+        # a rejected request doesn't use up a response
+        self.clock.now += 2
+        self.assertEqual('b', self.session.get(self.url).text)
+
+        self.assertEqual(3, m.call_count)
+        self.assertEqual(2, m.rate_limit.accepted)
+        self.assertEqual(1, m.rate_limit.rejected)
+
+    def test_achieved_rate(self):
+        m = self.adapter.register_uri('GET',
+                                      self.url,
+                                      rate_limit={'rate': 8, 'burst': 1})
+
+        # a client sending 16 a second only gets every other request through
+        for _ in range(100):
+            self.session.get(self.url)
+            self.clock.now += 0.0625
+
+        self.assertEqual(50, m.rate_limit.accepted)
+        self.assertEqual(50, m.rate_limit.rejected)
+
+    def test_shared_bucket(self):
+        bucket = ratelimit.TokenBucket(rate=1)
+        self.adapter.register_uri('GET', self.url, rate_limit=bucket)
+        self.adapter.register_uri('GET', 'mock://test/b', rate_limit=bucket)
+
+        self.assertEqual(200, self.session.get(self.url).status_code)
+        self.assertEqual(429,
+                         self.session.get('mock://test/b').status_code)
+        self.assertEqual(1, bucket.rejected)
+
+    def test_times_counts_accepted(self):
+        self.adapter.register_uri('GET', self.url, text='fallback')
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  text='once',
+                                  times=1,
+                                  rate_limit={'rate': 1, 'burst': 1})
+
+        self.assertEqual('once', self.session.get(self.url).text)
+        self.assertEqual('fallback', self.session.get(self.url).text)
+
+    def test_restore(self):
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  [{'text': 'a'}, {'text': 'b'}],
+                                  rate_limit={'rate': 1})
+        snapshot = self.adapter.snapshot()
+
+        self.assertEqual('a', self.session.get(self.url).text)
+        self.assertEqual(429, self.session.get(self.url).status_code)
+
+        self.adapter.restore(snapshot)
+        self.clock.now += 1
+
+        self.assertEqual('a', self.session.get(self.url).text)
+
+    def test_restore_refills(self):
+        self.adapter.register_uri('GET',
+                                  self.url,
+                                  rate_limit={'rate': 1, 'burst': 2})
+        snapshot = self.adapter.snapshot()
+
+        for _ in range(2):
+            statuses = [self.session.get(self.url).status_code
+                        for _ in range(3)]
+            self.assertEqual([200, 200, 429], statuses)
+            self.adapter.restore(snapshot)
+
+    def test_reset(self):
+        m = self.adapter.register_uri('GET',
+                                      self.url,
+                                      rate_limit={'rate': 1, 'burst': 1})
+
+        self.session.get(self.url)
+        self.assertEqual(429, self.session.get(self.url).status_code)
+
+        self.adapter.reset()
+        self.assertEqual(0, m.rate_limit.accepted)
+        self.assertEqual(0, m.rate_limit.rejected)
+        self.assertEqual(200, self.session.get(self.url).status_code)
+
+    def test_mocker_clock(self):
+        with requests_mock.Mocker(clock=self.clock) as m:
+            m.get('http://test.com', rate_limit={'rate': 1})
+
+            self.assertEqual(200, requests.get('http://test.com').status_code)
+            self.assertEqual(429, requests.get('http://test.com').status_code)
+            self.clock.now += 1
+            self.assertEqual(200, requests.get('http://test.com').status_code)
+
+    def test_overlay_clock(self):
+        overlay = self.adapter.overlay()
+        self.session.mount('mock', overlay)
+        overlay.register_uri('GET', self.url, rate_limit={'rate': 1})
+
+        self.assertEqual(200, self.session.get(self.url).status_code)
+        self.assertEqual(429, self.session.get(self.url).status_code)
+        self.clock.now += 1
+        self.assertEqual(200, self.session.get(self.url).status_code)
@@ -137,3 +137,77 @@ class RequestTests(base.TestCase):
     def test_empty_query_string(self):
         req = self.do_request(url='https://host.example.com/path?key')
         self.assertEqual([''], req.qs['key'])
+
+    def test_qs_is_not_shared(self):
+        url = 'https://host.example.com/path?a=1'
+        req1 = self.do_request(url=url)
+        req1.qs['a'].append('2')
+        req2 = self.do_request(url=url)
+
+        self.assertEqual(['1'], req2.qs['a'])
+
+    def test_url_cache(self):
+        requests_mock.request.url_cache_clear()
+        url = 'https://host.example.com/cached?a=1'
+
+        self.mocker.get(url, text='resp')
+        for _ in range(3):
+            requests.get(url)
+
+        # one miss parsing the registered url and one for the first request
+        info = requests_mock.request.url_cache_info()
+        self.assertEqual(2, info.misses)
+        self.assertEqual(2, info.hits)
+
+    def test_form(self):
+        req = self.do_request(method='POST', data={'a': '1', 'b': ['2', '3']})
+
+        self.assertEqual({'a': ['1'], 'b': ['2', '3']}, req.form)
+        self.assertEqual({}, req.files)
+
+    def test_multipart(self):
+        req = self.do_request(method='POST',
+                              data={'a': 'é'},
+                              files={'f': ('a.txt', b'x\r\n--y', 'text/plain'),
+                                     'g': b'raw'})
+
+        self.assertEqual({'a': ['é']}, req.form)
+        self.assertEqual({'f': [('a.txt', 'text/plain', b'x\r\n--y')],
+                          'g': [('g', None, b'raw')]},
+                         req.files)
+        self.assertEqual('a.txt', req.files['f'][0].filename)
+
+    def test_form_undecodable(self):
+        req = self.do_request(method='POST',
+                              data=b'a=\xe9',
+                              headers={'Content-Type':
+                                       'application/x-www-form-urlencoded'})
+        self.assertEqual({'a': ['\ufffd']}, req.form)
+
+        req = self.do_request(method='POST', files={'a': (None, b'\xff\xfe')})
+        self.assertEqual({'a': ['\ufffd\ufffd']}, req.form)
+        self.assertEqual({}, req.files)
+
+    def test_form_unknown_charset(self):
+        body = (b'--b\r\n'
+                b'Content-Disposition: form-data; name="a"\r\n'
+                b'Content-Type: text/plain; charset=nope\r\n'
+                b'\r\n'
+                b'1\r\n'
+                b'--b--\r\n')
+        req = self.do_request(method='POST',
+                              data=body,
+                              headers={'Content-Type':
+                                       'multipart/form-data; boundary=b'})
+        self.assertEqual({'a': ['1']}, req.form)
+
+    def test_form_not_encoded(self):
+        self.assertEqual({}, self.do_request(method='POST', data='a=1').form)
+        self.assertEqual({}, self.do_request(method='PUT', json={}).form)
+        self.assertEqual({}, self.do_request().files)
+
+    def test_form_is_not_shared(self):
+        req = self.do_request(method='POST', data={'a': '1'})
+        req.form['a'].append('2')
+
+        self.assertEqual(['1'], req.form['a'])
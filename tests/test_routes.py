@@ -0,0 +1,211 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import re
+import shutil
+import tempfile
+
+import requests
+
+import requests_mock
+from . import base
+
+
+def text_callback(request, context):
+    context.status_code = 201
+    return request.path
+
+
+def custom_matcher(request):
+    if request.path == '/custom':
+        return requests_mock.create_response(request, text='custom')
+
+    return None
+
+
+class RoutesTests(base.TestCase):
+
+    def setUp(self):
+        super(RoutesTests, self).setUp()
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'routes.pickle')
+
+    def session(self, adapter):
+        session = requests.Session()
+        session.mount('mock', adapter)
+        return session
+
+    def build(self):
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET', 'mock://test/a', text='a')
+        adapter.register_uri('GET', 'mock://test/a', text='b', priority=1)
+        adapter.register_uri('GET', re.compile('regex'), json={'r': 1})
+        adapter.register_uri('POST', 'mock://test/cb', text=text_callback)
+        adapter.register_uri('POST',
+                             'mock://test/json',
+                             json_body={'a': [1]},
+                             text='json')
+        adapter.register_uri('GET',
+                             'mock://test/list',
+                             [{'text': '1'}, {'text': '2'}],
+                             rate_limit={'rate': 1, 'burst': 2})
+        adapter.add_matcher(custom_matcher)
+        return adapter
+
+    def test_round_trip(self):
+        self.build().save_routes(self.path, key='v1')
+
+        adapter = requests_mock.Adapter()
+        self.assertTrue(adapter.load_routes(self.path, key='v1'))
+        session = self.session(adapter)
+
+        self.assertEqual('b', session.get('mock://test/a').text)
+        self.assertEqual({'r': 1}, session.get('mock://test/regex').json())
+
+        resp = session.post('mock://test/cb')
+        self.assertEqual(201, resp.status_code)
+        self.assertEqual('/cb', resp.text)
+
+        self.assertEqual('1', session.get('mock://test/list').text)
+        self.assertEqual('2', session.get('mock://test/list').text)
+        self.assertEqual(429, session.get('mock://test/list').status_code)
+        self.assertEqual('custom', session.get('mock://test/custom').text)
+        self.assertEqual('json',
+                         session.post('mock://test/json',
+                                      json={'a': [1], 'b': 2}).text)
+        self.assertRaises(requests_mock.NoMockAddress,
+                          session.post,
+                          'mock://test/json',
+                          json={'a': [2]})
+
+    def test_any(self):
+        adapter = requests_mock.Adapter()
+        adapter.register_uri(requests_mock.ANY,
+                             requests_mock.ANY,
+                             text='any',
+                             priority=-1)
+        adapter.register_uri('POST', requests_mock.ANY, text='post')
+        adapter.save_routes(self.path)
+
+        loaded = requests_mock.Adapter()
+        loaded.load_routes(self.path)
+        session = self.session(loaded)
+
+        self.assertEqual('any', session.get('mock://test/other').text)
+        self.assertEqual('post', session.post('mock://test/other').text)
+
+    def test_faults(self):
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET',
+                             'mock://test/a',
+                             faults={'rate': 0.5, 'status_code': 503},
+                             fault_seed=42)
+        adapter.save_routes(self.path)
+
+        statuses = [self.session(adapter).get('mock://test/a').status_code
+                    for _ in range(20)]
+
+        loaded = requests_mock.Adapter()
+        loaded.load_routes(self.path)
+        session = self.session(loaded)
+
+        self.assertIn(503, statuses)
+        self.assertEqual(statuses,
+                         [session.get('mock://test/a').status_code
+                          for _ in range(20)])
+
+    def test_state_not_saved(self):
+        adapter = self.build()
+        session = self.session(adapter)
+        session.get('mock://test/list')
+        adapter.save_routes(self.path)
+
+        loaded = requests_mock.Adapter()
+        loaded.load_routes(self.path)
+        m = [m for m in loaded._matchers if str(m) == 'GET mock://test/list']
+
+        self.assertEqual(0, m[0].call_count)
+        self.assertEqual(0, m[0].stats.hits)
+        self.assertEqual('1', self.session(loaded).get(
+            'mock://test/list').text)
+
+    def test_remove_loaded(self):
+        adapter = self.build()
+        adapter.save_routes(self.path)
+
+        loaded = requests_mock.Adapter()
+        loaded.load_routes(self.path)
+        session = self.session(loaded)
+
+        session.get('mock://test/a')
+        loaded.remove_matcher(loaded.last_request.matcher)
+        self.assertEqual('a', session.get('mock://test/a').text)
+
+    def test_stale(self):
+        self.build().save_routes(self.path, key='v1')
+
+        self.assertFalse(requests_mock.Adapter().load_routes(self.path,
+                                                             key='v2'))
+        self.assertFalse(requests_mock.Adapter(case_sensitive=True)
+                         .load_routes(self.path, key='v1'))
+        self.assertFalse(requests_mock.Adapter().load_routes(self.path + '2'))
+
+        with open(self.path, 'wb') as f:
+            f.write(b'garbage')
+
+        self.assertFalse(requests_mock.Adapter().load_routes(self.path,
+                                                             key='v1'))
+
+    def test_load_into_used_adapter(self):
+        self.build().save_routes(self.path)
+
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET', 'mock://test/a')
+
+        self.assertRaises(ValueError, adapter.load_routes, self.path)
+
+    def test_unpicklable(self):
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET',
+                             'mock://test/a',
+                             text=lambda r, c: 'lambda')
+
+        self.assertRaises(ValueError, adapter.save_routes, self.path)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual([], os.listdir(os.path.dirname(self.path)))
+
+    def test_clock(self):
+        adapter = requests_mock.Adapter()
+        adapter.register_uri('GET', 'mock://test/a', rate_limit={'rate': 1})
+        adapter.save_routes(self.path)
+
+        now = [0]
+        loaded = requests_mock.Adapter(clock=lambda: now[0])
+        loaded.load_routes(self.path)
+        session = self.session(loaded)
+
+        self.assertEqual(200, session.get('mock://test/a').status_code)
+        self.assertEqual(429, session.get('mock://test/a').status_code)
+        now[0] += 1
+        self.assertEqual(200, session.get('mock://test/a').status_code)
+
+    def test_mocker(self):
+        with requests_mock.Mocker() as m:
+            m.get('http://test.com/a', text='a')
+            m.save_routes(self.path)
+
+        with requests_mock.Mocker() as m:
+            self.assertTrue(m.load_routes(self.path))
+            self.assertEqual('a', requests.get('http://test.com/a').text)
@@ -0,0 +1,180 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import tempfile
+import threading
+
+import requests
+
+import requests_mock
+from requests_mock import trace
+from . import base
+
+
+class ChromeTraceExporterTests(base.TestCase):
+
+    def setUp(self):
+        super(ChromeTraceExporterTests, self).setUp()
+
+        self.adapter = requests_mock.Adapter()
+        self.session = requests.Session()
+        self.session.mount('mock', self.adapter)
+        self.exporter = trace.ChromeTraceExporter(process_name='test')
+        self.adapter.add_observer(self.exporter)
+
+    def events(self, ph):
+        return [e for e in self.exporter.render()['traceEvents']
+                if e['ph'] == ph]
+
+    def spans(self, name):
+        return [e for e in self.events('X') if e['name'] == name]
+
+    def test_spans(self):
+        self.adapter.register_uri('GET', 'mock://test/a', status_code=201)
+
+        self.session.get('mock://test/a')
+
+        request, = self.spans('request')
+        match, = self.spans('match')
+        build, = self.spans('build')
+
+        self.assertEqual({'method': 'GET',
+                          'url': 'mock://test/a',
+                          'status': 201},
+                         request['args'])
+        self.assertEqual({'matcher': 'GET mock://test/a'}, match['args'])
+        self.assertEqual(threading.get_ident(), request['tid'])
+        self.assertEqual(os.getpid(), request['pid'])
+
+        self.assertEqual(request['ts'], match['ts'])
+        self.assertAlmostEqual(match['ts'] + match['dur'], build['ts'])
+        self.assertAlmostEqual(request['ts'] + request['dur'],
+                               build['ts'] + build['dur'])
+
+    def test_missed(self):
+        self.assertRaises(requests_mock.NoMockAddress,
+                          self.session.get,
+                          'mock://test/a')
+
+        request, = self.spans('request')
+        self.assertEqual({'method': 'GET', 'url': 'mock://test/a'},
+                         request['args'])
+        self.assertEqual(1, len(self.spans('match')))
+        self.assertEqual([], self.spans('build'))
+
+    def test_failed(self):
+        self.adapter.register_uri('GET',
+                                  'mock://test/a',
+                                  exc=requests.exceptions.ConnectionError)
+
+        self.assertRaises(requests.exceptions.ConnectionError,
+                          self.session.get,
+                          'mock://test/a')
+
+        request, = self.spans('request')
+        match, = self.spans('match')
+        build, = self.spans('build')
+
+        self.assertEqual({'method': 'GET',
+                          'url': 'mock://test/a',
+                          'error': 'ConnectionError'},
+                         request['args'])
+        self.assertEqual({'matcher': 'GET mock://test/a'}, match['args'])
+        self.assertEqual({'error': 'ConnectionError'}, build['args'])
+        self.assertAlmostEqual(match['ts'] + match['dur'], build['ts'])
+
+    def test_failed_matching(self):
+        def matcher(request):
+            raise ValueError()
+
+        self.adapter.add_matcher(matcher)
+
+        self.assertRaises(ValueError, self.session.get, 'mock://test/a')
+
+        request, = self.spans('request')
+        match, = self.spans('match')
+        self.assertEqual('ValueError', request['args']['error'])
+        self.assertEqual('ValueError', match['args']['error'])
+        self.assertEqual([], self.spans('build'))
+
+    def test_stream(self):
+        self.adapter.register_uri('GET', 'mock://test/a', text='data')
+
+        resp = self.session.get('mock://test/a', stream=True)
+        self.assertEqual([], self.events('b'))
+
+        request, = self.spans('request')
+        resp.close()
+
+        begin, = self.events('b')
+        end, = self.events('e')
+        self.assertEqual('stream', begin['name'])
+        self.assertEqual(begin['id'], end['id'])
+        self.assertEqual(request['tid'], begin['tid'])
+        self.assertAlmostEqual(request['ts'] + request['dur'], begin['ts'])
+        self.assertGreaterEqual(end['ts'], begin['ts'])
+
+    def test_thread_tracks(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+
+        # keep every thread alive until all have sent so their ids differ
+        barrier = threading.Barrier(3)
+
+        def send():
+            self.session.get('mock://test/a')
+            barrier.wait()
+
+        threads = [threading.Thread(target=send, name='sender-%d' % i)
+                   for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        names = dict((e['tid'], e['args']['name'])
+                     for e in self.events('M') if e['name'] == 'thread_name')
+        self.assertEqual(['sender-0', 'sender-1', 'sender-2'],
+                         sorted(names.values()))
+        self.assertEqual(set(names),
+                         set(e['tid'] for e in self.spans('request')))
+
+        process, = [e for e in self.events('M')
+                    if e['name'] == 'process_name']
+        self.assertEqual({'name': 'test'}, process['args'])
+
+    def test_reset(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.session.get('mock://test/a')
+
+        self.exporter.reset()
+
+        self.assertEqual(['process_name'],
+                         [e['name'] for e in
+                          self.exporter.render()['traceEvents']])
+
+    def test_write(self):
+        self.adapter.register_uri('GET', 'mock://test/a')
+        self.session.get('mock://test/a')
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, directory)
+        path = os.path.join(directory, 'trace.json')
+
+        self.exporter.write(path)
+        self.addCleanup(os.unlink, path)
+
+        with open(path) as f:
+            self.assertEqual(self.exporter.render(), json.load(f))
+
+        self.assertEqual(['trace.json'], os.listdir(directory))